@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 查询缓存离线模拟
+
+src/config/cache-config.ts 的默认值（TTL 5 分钟、maxSize 100）是拍脑袋定的。本脚本把带时间戳的
+问题负载（question-generator.py 的 JSONL）回放进缓存模型，在 TTL × maxSize 网格上计算
+命中率和节省的延迟，用数据来定缓存大小：
+
+    sqlite  忠实复现 SQLiteCacheManager：
+            - 键为归一化问题（小写、合并空白、去首尾空白）的 SHA-256
+            - get：不存在或 expires_at < now 时未命中（过期条目删除），命中时 hit_count + 1、更新 last_accessed_at
+            - set：条目数 ≥ maxSize 时先删除全部过期条目，仍 ≥ maxSize 时按 last_accessed_at
+              删除最旧的 max(1, floor(maxSize × 0.1)) 条，再 INSERT OR REPLACE（hit_count = 0）
+            - expires_at 从写入时算起，命中不会续期
+    lru     每次只淘汰最久未访问的一条
+    lfu     淘汰 hit_count 最小的一条（相同时淘汰最久未访问的）
+    gdsf    Greedy-Dual-Size-Frequency：优先级 = L + 访问次数 × 未命中延迟 / 条目大小，
+            保留「小而贵」的结果（L 为最近一次淘汰的优先级，用于老化）
+
+所有策略使用相同的 TTL 语义，满时先清理过期条目。回放按事件时间进行：未命中的问题在
+「到达时间 + 未命中延迟」（Agent 完成）时才写入缓存，期间到达的相同问题同样未命中，与线上一致。
+
+使用方式：
+    python scripts/question-generator.py --count 20000 --repeat-rate 0.4 --rate 2 --poisson --output questions.jsonl
+    python scripts/cache-simulator.py --questions questions.jsonl
+    python scripts/cache-simulator.py --questions questions.jsonl --ttl 5m 1h 1d --max-size 100 1000 10000
+    python scripts/cache-simulator.py --questions questions.jsonl --policies sqlite lru --miss-latency-ms 12000
+
+负载中每行需要 ts（秒）和 question；可选 latency_ms（该问题未命中时的端到端延迟）和
+result / result_bytes（缓存结果大小），缺省时使用 --miss-latency-ms 和 --result-bytes。
+
+输出：
+    控制台表格，以及 scripts/output/cache-simulation.json
+"""
+
+import argparse
+import heapq
+import importlib
+import json
+import re
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+from common import OUTPUT_DIR
+
+# 复用 cache-warmer.py 中与 src/cache 一致的缓存键和默认配置
+cache_warmer = importlib.import_module('cache-warmer')
+
+DEFAULT_TTLS = ['1m', '5m', '15m', '1h', '6h', '1d']
+DEFAULT_MAX_SIZES = [50, 100, 200, 500, 1000, 5000]
+DEFAULT_MISS_LATENCY_MS = 5000
+DEFAULT_HIT_LATENCY_MS = 5
+DEFAULT_RESULT_BYTES = 2000
+# SQLiteCacheManager 每次淘汰的比例
+EVICT_FRACTION = 0.1
+
+DURATION_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h|d)?\s*$')
+DURATION_UNITS = {'ms': 1, 's': 1000, 'm': 60 * 1000, 'h': 3600 * 1000, 'd': 86400 * 1000}
+
+
+def parse_duration(value):
+    """'5m' / '1h' / '300000'（毫秒）→ 毫秒数"""
+    match = DURATION_RE.match(str(value))
+    if not match:
+        raise argparse.ArgumentTypeError(f"无法解析的时长: {value}（示例：30s、5m、1h、1d 或毫秒数）")
+    return int(float(match.group(1)) * DURATION_UNITS[match.group(2) or 'ms'])
+
+
+def format_duration(ms):
+    for unit in ('d', 'h', 'm', 's'):
+        if ms >= DURATION_UNITS[unit] and ms % DURATION_UNITS[unit] == 0:
+            return f"{ms // DURATION_UNITS[unit]}{unit}"
+    return f"{ms}ms"
+
+
+# ============================================
+# 1. 缓存策略
+# ============================================
+
+class Entry:
+    __slots__ = ('key', 'created_at', 'expires_at', 'hit_count', 'last_accessed_at', 'rowid', 'size', 'cost',
+                 'priority')
+
+    def __init__(self, key, now, ttl, rowid, size, cost):
+        self.key = key
+        self.created_at = now
+        self.expires_at = now + ttl
+        self.hit_count = 0
+        self.last_accessed_at = now
+        self.rowid = rowid
+        self.size = size
+        self.cost = cost
+        self.priority = 0
+
+
+class CachePolicy:
+    """
+    缓存模型基类：TTL、过期清理和统计
+
+    子类实现 _on_insert / _on_hit / _on_remove 和 _make_room（满时淘汰）。
+    """
+
+    name = None
+
+    def __init__(self, ttl_ms, max_size):
+        self.ttl = ttl_ms
+        self.max_size = max_size
+        self.entries = {}
+        self.bytes = 0
+        self.rowid = 0
+        # (expires_at, rowid, key)，删除条目时不从堆中移除，弹出时按 rowid 校验
+        self.expiry_heap = []
+        self.evicted = 0
+        self.expired = 0
+        self.peak_entries = 0
+        self.peak_bytes = 0
+
+    def get(self, key, now):
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        if entry.expires_at < now:
+            self._remove(entry)
+            self.expired += 1
+            return False
+        entry.hit_count += 1
+        entry.last_accessed_at = now
+        self._on_hit(entry)
+        return True
+
+    def set(self, key, now, size, cost):
+        if key in self.entries:
+            self._remove(self.entries[key])
+        self._make_room(now)
+        self._insert(key, now, size, cost)
+
+    def purge_expired(self, now):
+        """对应 clearExpired()：删除 expires_at < now 的条目"""
+        while self.expiry_heap and self.expiry_heap[0][0] < now:
+            _, rowid, key = heapq.heappop(self.expiry_heap)
+            entry = self.entries.get(key)
+            if entry is not None and entry.rowid == rowid:
+                self._remove(entry)
+                self.expired += 1
+
+    def evict(self, entry):
+        self._remove(entry)
+        self.evicted += 1
+
+    def _insert(self, key, now, size, cost):
+        self.rowid += 1
+        entry = Entry(key, now, self.ttl, self.rowid, size, cost)
+        self.entries[key] = entry
+        self.bytes += size
+        heapq.heappush(self.expiry_heap, (entry.expires_at, entry.rowid, key))
+        self._on_insert(entry)
+        self.peak_entries = max(self.peak_entries, len(self.entries))
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+
+    def _remove(self, entry):
+        del self.entries[entry.key]
+        self.bytes -= entry.size
+        self._on_remove(entry)
+
+    def _make_room(self, now):
+        if len(self.entries) < self.max_size:
+            return
+        self.purge_expired(now)
+        while len(self.entries) >= self.max_size:
+            self.evict(self._victim())
+
+    def _on_insert(self, entry):
+        pass
+
+    def _on_hit(self, entry):
+        pass
+
+    def _on_remove(self, entry):
+        pass
+
+    def _victim(self):
+        raise NotImplementedError
+
+
+class SQLiteCachePolicy(CachePolicy):
+    """SQLiteCacheManager.get / set / evictIfNeeded 的忠实模型"""
+
+    name = 'sqlite'
+
+    def set(self, key, now, size, cost):
+        # evictIfNeeded() 在 INSERT OR REPLACE 之前执行，计数包含将被替换的同键条目
+        if len(self.entries) >= self.max_size:
+            self.purge_expired(now)
+            if len(self.entries) >= self.max_size:
+                count = max(1, int(self.max_size * EVICT_FRACTION))
+                # ORDER BY last_accessed_at ASC：相同时间按 idx_last_accessed 中的 rowid 顺序
+                for entry in heapq.nsmallest(count, self.entries.values(),
+                                             key=lambda e: (e.last_accessed_at, e.rowid)):
+                    self.evict(entry)
+        if key in self.entries:
+            self._remove(self.entries[key])
+        self._insert(key, now, size, cost)
+
+
+class LRUPolicy(CachePolicy):
+    name = 'lru'
+
+    def __init__(self, ttl_ms, max_size):
+        super().__init__(ttl_ms, max_size)
+        self.order = OrderedDict()
+
+    def _on_insert(self, entry):
+        self.order[entry.key] = entry
+
+    def _on_hit(self, entry):
+        self.order.move_to_end(entry.key)
+
+    def _on_remove(self, entry):
+        del self.order[entry.key]
+
+    def _victim(self):
+        return next(iter(self.order.values()))
+
+
+class _HeapPolicy(CachePolicy):
+    """按 _rank 选淘汰对象，堆中的过期记录在弹出时按 (rowid, 访问次数) 校验"""
+
+    def __init__(self, ttl_ms, max_size):
+        super().__init__(ttl_ms, max_size)
+        self.heap = []
+
+    def _rank(self, entry):
+        raise NotImplementedError
+
+    def _push(self, entry):
+        heapq.heappush(self.heap, (self._rank(entry), entry.rowid, entry.hit_count, entry.key))
+
+    _on_insert = _push
+    _on_hit = _push
+
+    def _victim(self):
+        while True:
+            _, rowid, hit_count, key = heapq.heappop(self.heap)
+            entry = self.entries.get(key)
+            if entry is not None and entry.rowid == rowid and entry.hit_count == hit_count:
+                return entry
+
+
+class LFUPolicy(_HeapPolicy):
+    name = 'lfu'
+
+    def _rank(self, entry):
+        return (entry.hit_count, entry.last_accessed_at)
+
+
+class GDSFPolicy(_HeapPolicy):
+    name = 'gdsf'
+
+    def __init__(self, ttl_ms, max_size):
+        super().__init__(ttl_ms, max_size)
+        self.inflation = 0.0
+
+    def _rank(self, entry):
+        entry.priority = self.inflation + (entry.hit_count + 1) * entry.cost / max(entry.size, 1)
+        return entry.priority
+
+    def evict(self, entry):
+        self.inflation = entry.priority
+        super().evict(entry)
+
+
+POLICIES = {policy.name: policy for policy in (SQLiteCachePolicy, LRUPolicy, LFUPolicy, GDSFPolicy)}
+
+
+# ============================================
+# 2. 负载回放
+# ============================================
+
+def load_workload(path, args):
+    """读取 JSONL 负载，返回按到达时间排序的 [(到达毫秒, 缓存键, 未命中延迟, 条目大小)]"""
+    requests = []
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if 'question' not in item or 'ts' not in item:
+                raise ValueError(f"第 {line_no} 行缺少 question 或 ts 字段")
+            question = item['question']
+            result_bytes = (len(item['result'].encode('utf-8')) if isinstance(item.get('result'), str)
+                            else item.get('result_bytes', args.result_bytes))
+            # 与 getStats() 的 totalSize 一致：问题 + 结果 + 执行的 SQL
+            size = len(question.encode('utf-8')) + result_bytes + len(str(item.get('sql') or '').encode('utf-8'))
+            requests.append((
+                float(item['ts']) * 1000 * args.time_scale,
+                cache_warmer.generate_cache_key(question),
+                float(item.get('latency_ms', args.miss_latency_ms)),
+                size,
+            ))
+    requests.sort(key=lambda request: request[0])
+    return requests
+
+
+def simulate(requests, policy, hit_latency_ms):
+    """
+    按事件时间回放：到达时查缓存，未命中的请求在完成时写入缓存
+
+    同一时刻先处理写入再处理到达；完成前到达的相同问题记为「并发未命中」。
+    """
+    completions = []
+    in_flight = {}
+    hits = misses = concurrent_misses = 0
+    saved_ms = 0.0
+
+    def complete_until(now):
+        while completions and completions[0][0] <= now:
+            done_at, _, key, size, cost = heapq.heappop(completions)
+            in_flight[key] -= 1
+            if not in_flight[key]:
+                del in_flight[key]
+            policy.set(key, int(done_at), size, cost)
+
+    for seq, (arrival, key, miss_latency, size) in enumerate(requests):
+        complete_until(arrival)
+        if policy.get(key, int(arrival)):
+            hits += 1
+            saved_ms += max(0.0, miss_latency - hit_latency_ms)
+            continue
+        misses += 1
+        if key in in_flight:
+            concurrent_misses += 1
+        in_flight[key] = in_flight.get(key, 0) + 1
+        heapq.heappush(completions, (arrival + miss_latency, seq, key, size, miss_latency))
+    complete_until(float('inf'))
+
+    total = hits + misses
+    return {
+        'requests': total,
+        'hits': hits,
+        'misses': misses,
+        'hitRate': round(hits / total, 4) if total else 0,
+        'concurrentMisses': concurrent_misses,
+        'savedLatencyMs': round(saved_ms, 1),
+        'avgLatencyMs': round((sum(r[2] for r in requests) - saved_ms) / total, 1) if total else 0,
+        'evicted': policy.evicted,
+        'expired': policy.expired,
+        'peakEntries': policy.peak_entries,
+        'peakBytes': policy.peak_bytes,
+    }
+
+
+def upper_bound(requests):
+    """无限容量、永不过期时的命中率（只有首次出现的问题未命中）"""
+    seen = set()
+    hits = 0
+    for _, key, _, _ in requests:
+        hits += key in seen
+        seen.add(key)
+    return round(hits / len(requests), 4) if requests else 0, len(seen)
+
+
+def recommend(runs, target):
+    """命中率达到网格内最高值 target 倍的配置中，maxSize 最小、其次 TTL 最短的一个"""
+    best = max(run['hitRate'] for run in runs)
+    candidates = [run for run in runs if run['hitRate'] >= best * target]
+    return min(candidates, key=lambda run: (run['maxSize'], run['ttlMs'])) if candidates else None
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='回放问题负载，模拟不同 TTL / maxSize / 淘汰策略下的查询缓存命中率')
+    parser.add_argument('--questions', required=True, help='问题负载 JSONL（question-generator.py 的输出）')
+    parser.add_argument('--policies', nargs='+', choices=sorted(POLICIES), default=list(POLICIES),
+                        help='模拟的策略（默认：全部）')
+    parser.add_argument('--ttl', nargs='+', type=parse_duration, default=[parse_duration(v) for v in DEFAULT_TTLS],
+                        help=f"TTL 取值，如 30s 5m 1h（默认：{' '.join(DEFAULT_TTLS)}）")
+    parser.add_argument('--max-size', nargs='+', type=int, default=DEFAULT_MAX_SIZES,
+                        help=f"maxSize 取值（默认：{' '.join(map(str, DEFAULT_MAX_SIZES))}）")
+    parser.add_argument('--miss-latency-ms', type=float, default=DEFAULT_MISS_LATENCY_MS,
+                        help=f'未命中时的端到端延迟，负载行中有 latency_ms 时以其为准（默认：{DEFAULT_MISS_LATENCY_MS}）')
+    parser.add_argument('--hit-latency-ms', type=float, default=DEFAULT_HIT_LATENCY_MS,
+                        help=f'命中时的延迟（默认：{DEFAULT_HIT_LATENCY_MS}）')
+    parser.add_argument('--result-bytes', type=int, default=DEFAULT_RESULT_BYTES,
+                        help=f'缓存结果的大小，负载行中有 result / result_bytes 时以其为准（默认：{DEFAULT_RESULT_BYTES}）')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='到达时间的缩放倍数，如 10 表示把负载放慢 10 倍（默认：1）')
+    parser.add_argument('--target', type=float, default=0.95,
+                        help='推荐配置需要达到网格内最高命中率的比例（默认：0.95）')
+    parser.add_argument('--report', help='报告 JSON（默认：scripts/output/cache-simulation.json）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("SQL-Zen 查询缓存离线模拟")
+    print("=" * 60)
+
+    try:
+        requests = load_workload(args.questions, args)
+    except (OSError, ValueError) as e:
+        print(f"❌ 无法读取负载: {e}")
+        sys.exit(1)
+    if not requests:
+        print("❌ 负载为空")
+        sys.exit(1)
+
+    ceiling, distinct = upper_bound(requests)
+    span_ms = requests[-1][0] - requests[0][0]
+    print(f"\n📦 {len(requests)} 个请求，{distinct} 个不同问题，时间跨度 {span_ms / 3600000:.1f} 小时；"
+          f"命中率上限（无限容量、永不过期）{ceiling:.1%}")
+    ttls = sorted(set(args.ttl))
+    sizes = sorted(set(args.max_size))
+    default_ttl, default_size = cache_warmer.DEFAULT_TTL_MS, cache_warmer.DEFAULT_MAX_SIZE
+
+    runs = []
+    for name in args.policies:
+        for ttl in ttls:
+            for size in sizes:
+                stats = simulate(requests, POLICIES[name](ttl, size), args.hit_latency_ms)
+                runs.append(dict(policy=name, ttlMs=ttl, maxSize=size, **stats))
+
+    header = f"{'TTL':>8} " + ' '.join(f"{size:>8}" for size in sizes)
+    recommendations = {}
+    for name in args.policies:
+        policy_runs = [run for run in runs if run['policy'] == name]
+        by_cell = {(run['ttlMs'], run['maxSize']): run for run in policy_runs}
+        print(f"\n📊 {name}：命中率（行为 TTL，列为 maxSize）")
+        print(header)
+        print('-' * len(header))
+        for ttl in ttls:
+            print(f"{format_duration(ttl):>8} " + ' '.join(f"{by_cell[(ttl, size)]['hitRate']:>8.1%}" for size in sizes))
+        if name == 'sqlite':
+            print(f"\n⏱️  {name}：节省的延迟（小时）")
+            print(header)
+            print('-' * len(header))
+            for ttl in ttls:
+                print(f"{format_duration(ttl):>8} "
+                      + ' '.join(f"{by_cell[(ttl, size)]['savedLatencyMs'] / 3600000:>8.2f}" for size in sizes))
+            current = by_cell.get((default_ttl, default_size))
+            if current:
+                print(f"\n📌 当前默认配置（TTL {format_duration(default_ttl)}、maxSize {default_size}）："
+                      f"命中率 {current['hitRate']:.1%}，淘汰 {current['evicted']} 条，过期 {current['expired']} 条")
+        best = recommend(policy_runs, args.target)
+        recommendations[name] = best
+        if best:
+            print(f"🎯 {name}：达到最高命中率 {args.target:.0%} 的最小配置为 TTL {format_duration(best['ttlMs'])}、"
+                  f"maxSize {best['maxSize']}（命中率 {best['hitRate']:.1%}，峰值 {best['peakEntries']} 条）")
+
+    concurrent = max(run['concurrentMisses'] for run in runs)
+    if concurrent:
+        print(f"\n⚠️  最多 {concurrent} 次未命中发生在相同问题仍在处理时（缓存在 Agent 完成后才写入），"
+              f"这部分无法靠调大缓存消除")
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'questions': str(args.questions),
+        'requests': len(requests),
+        'distinct': distinct,
+        'upperBoundHitRate': ceiling,
+        'missLatencyMs': args.miss_latency_ms,
+        'hitLatencyMs': args.hit_latency_ms,
+        'timeScale': args.time_scale,
+        'default': {'ttlMs': default_ttl, 'maxSize': default_size},
+        'recommendations': recommendations,
+        'runs': runs,
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'cache-simulation.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 查询缓存预热脚本
+
+部署后 SQLiteCacheManager 的 query_cache 表是空的，第一批用户要承担完整的
+LLM + 数据库延迟。本脚本在上线前把常见问题的结果预先写入缓存：
+
+1. 读取常见问题列表（JSONL，每行 {"question": "...", "sql": "..."}）
+2. 追加 Cube 层「指标 × 常用过滤器」组合生成的问题（如「最近30天的总收入是多少？」）
+3. 以有限并发在数据库上执行对应 SQL
+4. 按 src/cache 的规则写入缓存：
+   - query_hash = SHA-256(小写 + 合并空白 + 去首尾空白后的问题)
+   - expires_at = created_at + TTL，hit_count = 0
+   - 超过 maxSize 时先清理过期条目，再按 last_accessed_at 淘汰最旧的 10%
+
+使用方式：
+    python scripts/cache-warmer.py
+    python scripts/cache-warmer.py --questions frequent-questions.jsonl --concurrency 8
+    python scripts/cache-warmer.py --ttl 3600000 --no-cube-queries
+
+环境变量：
+    数据库连接与 init-test-data.py 相同（DB_TYPE, DB_HOST, ...）
+    CACHE_DB_PATH, CACHE_TTL, CACHE_MAX_SIZE, QUERY_DEFAULT_LIMIT 与 SQL-Zen 运行时一致
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from common import OUTPUT_DIR, SCHEMA_DIR, connect, get_db_type, percentile, timed_query
+from cube_sql import cube_questions, load_cubes, load_table_columns
+
+# 与 src/config/cache-config.ts 的 DEFAULT_CACHE_CONFIG 保持一致
+DEFAULT_TTL_MS = 5 * 60 * 1000
+DEFAULT_MAX_SIZE = 100
+DEFAULT_CACHE_DB_PATH = Path.home() / '.sql-zen' / 'cache.db'
+DEFAULT_QUERY_LIMIT = 100
+TRAILING_LIMIT_RE = re.compile(r'\bLIMIT\s+\d+(\s*,\s*\d+|\s+OFFSET\s+\d+)?\s*$', re.IGNORECASE)
+
+# 与 SQLiteCacheManager.initialize() 中的表结构一致
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS query_cache (
+  query_hash TEXT PRIMARY KEY,
+  query TEXT NOT NULL,
+  result TEXT NOT NULL,
+  sql_executed TEXT,
+  created_at INTEGER NOT NULL,
+  expires_at INTEGER NOT NULL,
+  hit_count INTEGER DEFAULT 0,
+  last_accessed_at INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_expires_at ON query_cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_last_accessed ON query_cache(last_accessed_at);
+
+CREATE TABLE IF NOT EXISTS cache_stats (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  total_hits INTEGER DEFAULT 0,
+  total_misses INTEGER DEFAULT 0
+);
+
+INSERT OR IGNORE INTO cache_stats (id, total_hits, total_misses) VALUES (1, 0, 0);
+"""
+
+RESULT_PREVIEW_ROWS = 20
+
+
+# ============================================
+# 1. 缓存键与缓存写入（对应 src/cache）
+# ============================================
+
+def normalize_query(query):
+    """对应 normalizeQuery()：转小写、合并空白、去首尾空白"""
+    return re.sub(r'\s+', ' ', query.lower()).strip()
+
+
+def generate_cache_key(query):
+    """对应 generateCacheKey()：归一化查询的 SHA-256"""
+    return hashlib.sha256(normalize_query(query).encode('utf-8')).hexdigest()
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def load_cache_config(args):
+    """对应 loadCacheConfig()，命令行参数优先"""
+    ttl = args.ttl or int(os.getenv('CACHE_TTL', '0') or 0) or DEFAULT_TTL_MS
+    max_size = args.max_size or int(os.getenv('CACHE_MAX_SIZE', '0') or 0) or DEFAULT_MAX_SIZE
+    db_path = Path(args.cache_db or os.getenv('CACHE_DB_PATH') or DEFAULT_CACHE_DB_PATH).expanduser()
+    return {'ttl': ttl, 'max_size': max_size, 'db_path': db_path}
+
+
+def open_cache(db_path):
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(str(db_path))
+    cache.execute('PRAGMA journal_mode = WAL')
+    cache.executescript(CACHE_SCHEMA_SQL)
+    return cache
+
+
+def evict_if_needed(cache, max_size):
+    """对应 SQLiteCacheManager.evictIfNeeded()"""
+    count = cache.execute('SELECT COUNT(*) FROM query_cache').fetchone()[0]
+    if count < max_size:
+        return
+    cache.execute('DELETE FROM query_cache WHERE expires_at < ?', (now_ms(),))
+    count = cache.execute('SELECT COUNT(*) FROM query_cache').fetchone()[0]
+    if count >= max_size:
+        to_delete = max(1, int(max_size * 0.1))
+        cache.execute("""
+            DELETE FROM query_cache
+            WHERE query_hash IN (
+              SELECT query_hash FROM query_cache
+              ORDER BY last_accessed_at ASC
+              LIMIT ?
+            )
+        """, (to_delete,))
+
+
+def write_entry(cache, config, question, result, sql_executed):
+    """对应 SQLiteCacheManager.set()"""
+    evict_if_needed(cache, config['max_size'])
+    created_at = now_ms()
+    cache.execute("""
+        INSERT OR REPLACE INTO query_cache
+        (query_hash, query, result, sql_executed, created_at, expires_at, hit_count, last_accessed_at)
+        VALUES (?, ?, ?, ?, ?, ?, 0, ?)
+    """, (
+        generate_cache_key(question),
+        question,
+        result,
+        json.dumps(sql_executed, ensure_ascii=False),
+        created_at,
+        created_at + config['ttl'],
+        created_at,
+    ))
+    cache.commit()
+
+
+# ============================================
+# 2. 问题列表与查询执行
+# ============================================
+
+def load_questions(path):
+    """
+    读取 JSONL 问题列表，每行需要 question 和 sql 字段
+
+    可选的 count 字段为提问次数（默认 1）；同一个问题出现多次时次数累加，
+    因此 question-generator.py 的负载可以直接使用。
+    """
+    questions = []
+    for line_no, line in enumerate(Path(path).read_text(encoding='utf-8').splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        item = json.loads(line)
+        if not item.get('question') or not item.get('sql'):
+            print(f"⚠️  第 {line_no} 行缺少 question 或 sql，已跳过")
+            continue
+        questions.append({'question': item['question'], 'sql': item['sql'], 'count': int(item.get('count', 1))})
+    return questions
+
+
+def rank_questions(questions, max_size):
+    """按缓存键合并重复问题、累加次数，按次数从高到低取前 max_size 个（次数相同时保持文件顺序）"""
+    unique = {}
+    for item in questions:
+        key = generate_cache_key(item['question'])
+        if key in unique:
+            unique[key]['count'] += item.get('count', 1)
+        else:
+            unique[key] = dict(item, count=item.get('count', 1))
+    ranked = sorted(unique.values(), key=lambda item: -item['count'])
+    return ranked[:max_size], len(ranked)
+
+
+def apply_limit(sql, limit):
+    """去掉末尾分号，SQL 末尾没有 LIMIT 时追加（limit 为 0 时不追加），与 Agent 执行的 SQL 一致"""
+    sql = sql.strip().rstrip(';').rstrip()
+    if limit <= 0 or TRAILING_LIMIT_RE.search(sql):
+        return sql
+    return f"{sql} LIMIT {limit}"
+
+
+def _format_value(value):
+    if value is None:
+        return 'NULL'
+    if isinstance(value, Decimal):
+        return format(value, 'f')
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def format_result(question, columns, rows):
+    """把查询结果整理成缓存中的回答文本"""
+    lines = [f"问题：{question}", '', f"查询返回 {len(rows)} 行。"]
+    if columns:
+        lines.append('')
+        lines.append('| ' + ' | '.join(columns) + ' |')
+        lines.append('|' + '---|' * len(columns))
+        for row in rows[:RESULT_PREVIEW_ROWS]:
+            lines.append('| ' + ' | '.join(_format_value(v) for v in row) + ' |')
+        if len(rows) > RESULT_PREVIEW_ROWS:
+            lines.append(f"... 其余 {len(rows) - RESULT_PREVIEW_ROWS} 行省略")
+    return '\n'.join(lines)
+
+
+class QueryRunner:
+    """每个工作线程持有独立的数据库连接"""
+
+    def __init__(self, db_type):
+        self.db_type = db_type
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+
+    def cursor(self):
+        if not hasattr(self.local, 'conn'):
+            conn = connect(self.db_type)
+            with self.lock:
+                self.connections.append(conn)
+            self.local.conn = conn
+        return self.local.conn.cursor()
+
+    def run(self, sql):
+        cursor = self.cursor()
+        try:
+            rows, elapsed_ms = timed_query(cursor, sql)
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            return columns, rows, elapsed_ms
+        finally:
+            cursor.close()
+
+    def close(self):
+        for conn in self.connections:
+            conn.close()
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='预热 SQL-Zen 查询缓存')
+    parser.add_argument('--questions', help='常见问题 JSONL 文件（每行 {"question": ..., "sql": ...}）')
+    parser.add_argument('--no-cube-queries', action='store_true', help='不追加 Cube「指标 × 过滤器」问题')
+    parser.add_argument('--concurrency', type=int, default=4, help='并发执行的查询数（默认：4）')
+    parser.add_argument('--ttl', type=int, help='缓存有效期（毫秒，默认：CACHE_TTL 或 300000）')
+    parser.add_argument('--max-size', type=int, help='最大缓存条目数（默认：CACHE_MAX_SIZE 或 100）')
+    parser.add_argument('--cache-db', help='缓存数据库路径（默认：CACHE_DB_PATH 或 ~/.sql-zen/cache.db）')
+    parser.add_argument('--limit', type=int, default=int(os.getenv('QUERY_DEFAULT_LIMIT', DEFAULT_QUERY_LIMIT)),
+                        help='追加到 SQL 的 LIMIT，与 Agent 执行方式一致（默认：100）')
+    parser.add_argument('--report', help='预热报告 JSON 路径（默认：scripts/output/cache-warm-report.json）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = load_cache_config(args)
+
+    print("=" * 60)
+    print("SQL-Zen 查询缓存预热")
+    print("=" * 60)
+
+    try:
+        db_type = get_db_type()
+        questions = load_questions(args.questions) if args.questions else []
+        if not args.no_cube_queries:
+            cubes = load_cubes(SCHEMA_DIR)
+            for query in cube_questions(cubes, db_type, load_table_columns(SCHEMA_DIR)):
+                questions.append({'question': query['question'], 'sql': query['sql']})
+    except (ImportError, ValueError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # 同一个问题只预热一次，且不超过缓存容量（超出部分会被立即淘汰），优先预热最常问的问题
+    questions, total = rank_questions(questions, config['max_size'])
+    if total > config['max_size']:
+        print(f"⚠️  问题数 {total} 超过缓存容量 {config['max_size']}，只预热提问次数最多的 {config['max_size']} 个")
+
+    print(f"\n📦 缓存: {config['db_path']}（TTL {config['ttl']}ms，maxSize {config['max_size']}）")
+    print(f"🔥 预热 {len(questions)} 个问题，并发 {args.concurrency}")
+
+    cache = open_cache(config['db_path'])
+    runner = QueryRunner(db_type)
+    started = time.perf_counter()
+    warmed, failed, timings = 0, [], []
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = {
+            pool.submit(runner.run, apply_limit(item['sql'], args.limit)): item
+            for item in questions
+        }
+        for future in as_completed(futures):
+            item = futures[future]
+            sql = apply_limit(item['sql'], args.limit)
+            try:
+                columns, rows, elapsed_ms = future.result()
+            except Exception as e:
+                failed.append({'question': item['question'], 'error': str(e)})
+                print(f"  ❌ {item['question']}: {e}")
+                continue
+            write_entry(cache, config, item['question'], format_result(item['question'], columns, rows), [sql])
+            timings.append(elapsed_ms)
+            warmed += 1
+
+    elapsed = time.perf_counter() - started
+    runner.close()
+    total_entries = cache.execute('SELECT COUNT(*) FROM query_cache').fetchone()[0]
+    cache.close()
+
+    report = {
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'cache_db': str(config['db_path']),
+        'ttl_ms': config['ttl'],
+        'max_size': config['max_size'],
+        'questions': len(questions),
+        'warmed': warmed,
+        'failed': len(failed),
+        'elapsed_seconds': round(elapsed, 3),
+        'avg_query_ms': round(sum(timings) / len(timings), 3) if timings else 0,
+        'p95_query_ms': round(percentile(timings, 95), 3),
+        'cache_entries': total_entries,
+        'errors': failed,
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'cache-warm-report.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    print("\n" + "=" * 60)
+    print("🎉 预热完成！")
+    print("=" * 60)
+    print(f"  - 已预热: {warmed} 条")
+    print(f"  - 失败: {len(failed)} 条")
+    print(f"  - 耗时: {elapsed:.2f}s（SQL 平均 {report['avg_query_ms']}ms，P95 {report['p95_query_ms']}ms）")
+    print(f"  - 缓存条目总数: {total_entries}")
+    print(f"  - 报告: {report_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 大规模 Schema 目录合成
+
+生产数仓有数百张表，init-test-data.py 只生成四张表和三个 Cube，复现不了 Schema 加载变慢
+（SchemaParser.loadSchema / parseCubesDirectory）和 Agent 上下文膨胀的问题。
+本脚本按给定规模合成一套完整的 schema/ 目录：
+
+1. N 张表：列数按对数正态分布（中位数约 15 列），包含主键、外键、状态枚举、时间列和各类业务列
+2. 外键关系：每张表引用 0～3 张更早生成的表，按已被引用次数加权（形成少数被大量引用的维度表），
+   保证无环；每条外键写一个 joins/*.yaml
+3. M 个 Cube：选外键和数值列最多的事实表，包含时间维度、状态维度、关联表维度、计数/求和/平均指标和过滤器
+4. 建表 DDL：用 schema-synth.py 读回生成的 YAML，按外键依赖顺序输出 PostgreSQL 和 MySQL 的建表语句
+
+生成后统计文件数、体积、YAML 解析耗时和估算 token 数（与 context-profiler.py 相同的估算方法）；
+加 --node 时还会用编译后的 dist/ 测量 SchemaParser.loadSchema 的冷/热加载耗时和堆内存增量。
+相同的参数和种子生成的目录完全相同。
+
+使用方式：
+    python scripts/catalog-synth.py --tables 200
+    python scripts/catalog-synth.py --tables 50 200 800 --node        # 多个规模对比（需先 npm run build）
+    python scripts/catalog-synth.py --tables 800 --cubes 120 --out-dir /tmp/catalog
+
+    # 在合成的目录上生成数据 / 运行 Agent
+    python scripts/schema-synth.py --schema-dir scripts/output/catalog-200/schema --create-tables
+    cd scripts/output/catalog-200 && sql-zen ask "..."
+
+输出（目录中的 .catalog-synth 标记文件表示可以安全覆盖；已有其他 schema/ 的目录会被拒绝）：
+    scripts/output/catalog-<N>/schema/{tables,joins,cubes}/*.yaml
+    scripts/output/catalog-<N>/ddl/{postgresql,mysql}.sql
+    scripts/output/catalog-report.json
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from common import OUTPUT_DIR, positive_int
+
+# 文件名带连字符，用 import_module 复用解析、建表和 token 估算逻辑
+schema_synth = importlib.import_module('schema-synth')
+context_profiler = importlib.import_module('context-profiler')
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_COLUMNS_MEDIAN = 15
+MIN_COLUMNS = 4
+MAX_COLUMNS = 120
+# 每张表引用的父表数量及其概率
+PARENT_COUNT_WEIGHTS = {0: 0.2, 1: 0.4, 2: 0.25, 3: 0.15}
+STATUS_RATE = 0.7
+# 输出目录中的标记文件：只覆盖本脚本生成过的 schema/ 和 ddl/
+MARKER_FILE = '.catalog-synth'
+MAX_CUBE_JOINS = 3
+MAX_CUBE_MEASURES = 4
+
+DOMAINS = [
+    ('sales', '销售'), ('finance', '财务'), ('inventory', '库存'), ('logistics', '物流'),
+    ('marketing', '营销'), ('crm', '客户关系'), ('hr', '人力'), ('support', '客服'),
+    ('procurement', '采购'), ('product', '商品'),
+]
+ENTITIES = [
+    ('customer', '客户'), ('account', '账户'), ('order', '订单'), ('invoice', '发票'),
+    ('payment', '支付'), ('shipment', '发货'), ('warehouse', '仓库'), ('campaign', '活动'),
+    ('ticket', '工单'), ('employee', '员工'), ('supplier', '供应商'), ('contract', '合同'),
+    ('item', '明细'), ('store', '门店'), ('region', '区域'), ('budget', '预算'),
+    ('refund', '退款'), ('coupon', '优惠券'), ('visit', '访问'), ('lead', '线索'),
+]
+# 业务列池：(列名, 类型, 描述, 枚举)
+FILLER_COLUMNS = [
+    ('name', 'VARCHAR(100)', '名称', None),
+    ('code', 'VARCHAR(32)', '业务编码', None),
+    ('amount', 'DECIMAL(12, 2)', '金额（单位：元）', None),
+    ('price', 'DECIMAL(10, 2)', '单价（单位：元）', None),
+    ('cost', 'DECIMAL(10, 2)', '成本（单位：元）', None),
+    ('discount', 'DECIMAL(5, 2)', '折扣率，典型范围：0 - 1', None),
+    ('weight', 'DECIMAL(10, 3)', '重量（千克），典型范围：0 - 500', None),
+    ('quantity', 'INTEGER', '数量', None),
+    ('score', 'INTEGER', '评分，典型范围：0 - 100', None),
+    ('is_active', 'BOOLEAN', '是否有效', None),
+    ('start_date', 'DATE', '开始日期', None),
+    ('end_date', 'DATE', '结束日期', None),
+    ('updated_at', 'TIMESTAMP', '更新时间', None),
+    ('channel', 'VARCHAR(20)', '渠道', ['online', 'offline', 'partner']),
+    ('level', 'VARCHAR(20)', '等级', ['bronze', 'silver', 'gold', 'platinum']),
+    ('priority', 'VARCHAR(10)', '优先级', ['low', 'medium', 'high']),
+    ('city', 'VARCHAR(50)', '城市', None),
+    ('email', 'VARCHAR(100)', '联系邮箱', None),
+    ('phone', 'VARCHAR(20)', '联系电话', None),
+    ('tags', 'VARCHAR(200)', '标签，多个标签用逗号分隔', None),
+    ('remark', 'TEXT', '备注', None),
+]
+STATUS_VALUES = ['active', 'inactive', 'archived']
+NUMERIC_PREFIXES = ('DECIMAL', 'INTEGER')
+
+NODE_BENCH_SCRIPT = """
+import { SchemaParser } from '%(parser)s';
+import { getSchemaCache } from '%(cache)s';
+const dir = process.env.CATALOG_SCHEMA_DIR;
+global.gc?.();
+const before = process.memoryUsage().heapUsed;
+let started = performance.now();
+const parser = new SchemaParser(dir);
+const schema = await parser.loadSchema({ includeCubes: true });
+const coldMs = performance.now() - started;
+global.gc?.();
+const heapBytes = process.memoryUsage().heapUsed - before;
+started = performance.now();
+await parser.loadSchema({ includeCubes: true });
+const warmMs = performance.now() - started;
+console.log(JSON.stringify({
+  coldMs, warmMs, heapBytes,
+  tables: schema.tables.length,
+  relationships: (schema.relationships || []).length,
+  cubes: (schema.cubes || []).length,
+  cache: getSchemaCache().getStats(),
+}));
+"""
+
+
+# ============================================
+# 1. 表和外键
+# ============================================
+
+def column_count(rng, columns_median):
+    return max(MIN_COLUMNS, min(MAX_COLUMNS, round(rng.lognormvariate(math.log(columns_median), 0.6))))
+
+
+def pick_parents(rng, index, in_degree):
+    """从已生成的表中按被引用次数加权选取父表（只引用更早的表，保证无环）"""
+    count = min(index, rng.choices(list(PARENT_COUNT_WEIGHTS), weights=list(PARENT_COUNT_WEIGHTS.values()))[0])
+    candidates = list(range(index))
+    parents = []
+    for _ in range(count):
+        choice = rng.choices(candidates, weights=[1 + in_degree[i] for i in candidates])[0]
+        candidates.remove(choice)
+        parents.append(choice)
+    return sorted(parents)
+
+
+def build_tables(table_count, columns_median, seed):
+    """生成表定义列表，每项包含 name、label、columns、parents"""
+    rng = random.Random(seed)
+    width = max(3, len(str(table_count)))
+    tables = []
+    in_degree = [0] * table_count
+    for index in range(table_count):
+        (domain, domain_label), (entity, entity_label) = rng.choice(DOMAINS), rng.choice(ENTITIES)
+        name = f"{domain}_{entity}_{index + 1:0{width}d}"
+        parents = pick_parents(rng, index, in_degree)
+        for parent in parents:
+            in_degree[parent] += 1
+
+        columns = [{'name': 'id', 'type': 'SERIAL', 'description': f"{entity_label}唯一标识", 'primary_key': True}]
+        for parent in parents:
+            parent_table = tables[parent]
+            columns.append({
+                'name': f"{parent_table['name']}_id",
+                'type': 'INTEGER',
+                'description': f"关联的{parent_table['label']}ID",
+                'foreign_key': f"{parent_table['name']}.id",
+            })
+        if rng.random() < STATUS_RATE:
+            columns.append({'name': 'status', 'type': 'VARCHAR(20)', 'description': '记录状态',
+                            'enum': list(STATUS_VALUES)})
+        columns.append({'name': 'created_at', 'type': 'TIMESTAMP', 'description': '创建时间'})
+
+        filler_count = max(0, column_count(rng, columns_median) - len(columns))
+        pool = rng.sample(FILLER_COLUMNS, min(filler_count, len(FILLER_COLUMNS)))
+        for column_name, column_type, description, enum in pool:
+            column = {'name': column_name, 'type': column_type, 'description': description}
+            if enum:
+                column['enum'] = list(enum)
+            if column_name not in ('name', 'code', 'amount', 'quantity') and rng.random() < 0.3:
+                column['nullable'] = True
+            columns.append(column)
+        for extra in range(filler_count - len(pool)):
+            columns.append({'name': f"attr_{extra + 1:02d}", 'type': 'VARCHAR(64)',
+                            'description': f"扩展属性 {extra + 1}", 'nullable': True})
+
+        tables.append({
+            'name': name,
+            'label': f"{domain_label}{entity_label}",
+            'columns': columns,
+            'parents': [tables[parent]['name'] for parent in parents],
+        })
+    return tables
+
+
+def table_doc(table, children):
+    context = [f"{table['label']}数据，由 catalog-synth.py 合成。"]
+    if table['parents']:
+        context.append(f"引用：{', '.join(table['parents'])}。")
+    if children:
+        context.append(f"被引用：{', '.join(children[:10])}" + (f" 等 {len(children)} 张表。" if len(children) > 10 else "。"))
+    return {
+        'table': {'name': table['name'], 'description': f"{table['label']}表"},
+        'columns': table['columns'],
+        'business_context': '\n'.join(context) + '\n',
+    }
+
+
+def relationship_doc(parent, child):
+    return {
+        'relationship': {
+            'name': f"{parent}_{child}",
+            'from_table': parent,
+            'to_table': child,
+            'type': 'one_to_many',
+            'join_sql': f"JOIN {child} ON {parent}.id = {child}.{parent}_id",
+            'description': f"{parent} 与 {child} 的一对多关系，关联字段：{parent}.id → {child}.{parent}_id\n",
+        }
+    }
+
+
+# ============================================
+# 2. Cube
+# ============================================
+
+def _numeric_columns(table):
+    return [column for column in table['columns']
+            if str(column['type']).startswith(NUMERIC_PREFIXES) and not column.get('foreign_key')]
+
+
+def pick_fact_tables(tables, cube_count):
+    """外键和数值列越多越像事实表"""
+    candidates = [table for table in tables if table['parents'] and _numeric_columns(table)]
+    candidates.sort(key=lambda table: (len(table['parents']), len(_numeric_columns(table)), table['name']),
+                    reverse=True)
+    return candidates[:cube_count]
+
+
+def cube_doc(table, tables_by_name):
+    name = table['name']
+    columns = {column['name'] for column in table['columns']}
+    dimensions = [{
+        'name': 'time',
+        'description': f"时间维度，基于{table['label']}创建时间",
+        'column': f"{name}.created_at",
+        'granularity': [
+            {'day': {'sql': f"DATE({name}.created_at)", 'description': '按天'}},
+            {'month': {'sql': f"DATE_TRUNC('month', {name}.created_at)", 'description': '按月'}},
+        ],
+    }]
+    if 'status' in columns:
+        dimensions.append({'name': 'status', 'description': '状态维度', 'column': f"{name}.status",
+                           'enum': list(STATUS_VALUES)})
+    for parent in table['parents'][:MAX_CUBE_JOINS]:
+        parent_columns = {column['name'] for column in tables_by_name[parent]['columns']}
+        label_column = next((c for c in ('name', 'code', 'city') if c in parent_columns), 'id')
+        dimensions.append({
+            'name': parent,
+            'description': f"{tables_by_name[parent]['label']}维度",
+            'column': f"{parent}.{label_column}",
+            'join': f"JOIN {parent} ON {name}.{parent}_id = {parent}.id",
+        })
+
+    metrics = [{'name': f"{name}_count", 'description': f"{table['label']}记录数",
+                'sql': f"COUNT(DISTINCT {name}.id)", 'type': 'count'}]
+    for column in _numeric_columns(table)[:MAX_CUBE_MEASURES]:
+        is_decimal = str(column['type']).startswith('DECIMAL')
+        metrics.append({
+            'name': f"{'total' if is_decimal else 'avg'}_{column['name']}",
+            'description': f"{'总' if is_decimal else '平均'}{column['description'].split('，')[0]}",
+            'sql': f"{'SUM' if is_decimal else 'AVG'}({name}.{column['name']})",
+            'type': 'sum' if is_decimal else 'avg',
+        })
+
+    filters = [{'name': 'last_30_days', 'sql': f"{name}.created_at >= CURRENT_DATE - INTERVAL '30 days'",
+                'description': '最近30天'}]
+    if 'status' in columns:
+        filters.append({'name': 'active_only', 'sql': f"{name}.status = 'active'", 'description': '仅有效记录'})
+    return {
+        'cube': f"{name}_metrics",
+        'description': f"{table['label']}分析指标",
+        'dimensions': dimensions,
+        'metrics': metrics,
+        'filters': filters,
+    }
+
+
+# ============================================
+# 3. 写出目录与 DDL
+# ============================================
+
+def prepare_out_dir(out_dir, params):
+    """
+    清空上次生成的 schema/，写入标记文件
+
+    目录中已有 schema/ 或 ddl/ 但没有标记文件时（如仓库根目录）抛出 ValueError，不删除任何文件。
+    """
+    marker = out_dir / MARKER_FILE
+    existing = [name for name in ('schema', 'ddl') if (out_dir / name).exists()]
+    if existing and not marker.exists():
+        raise ValueError(f"{out_dir} 中已有不是本脚本生成的 {'、'.join(name + '/' for name in existing)}，"
+                         f"为避免覆盖请换一个 --out-dir（或确认后手动删除）")
+    schema_dir = out_dir / 'schema'
+    if schema_dir.exists():
+        shutil.rmtree(schema_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    marker.write_text(json.dumps(params, ensure_ascii=False) + '\n', encoding='utf-8')
+    return schema_dir
+
+
+def write_catalog(out_dir, table_count, cube_count, columns_median, seed):
+    yaml = schema_synth._require_yaml()
+    schema_dir = prepare_out_dir(out_dir, {'tables': table_count, 'cubes': cube_count,
+                                           'columns_median': columns_median, 'seed': seed})
+    for sub in ('tables', 'joins', 'cubes'):
+        (schema_dir / sub).mkdir(parents=True)
+
+    def dump(path, doc):
+        path.write_text(yaml.safe_dump(doc, allow_unicode=True, sort_keys=False), encoding='utf-8')
+
+    tables = build_tables(table_count, columns_median, seed)
+    tables_by_name = {table['name']: table for table in tables}
+    children = {table['name']: [] for table in tables}
+    for table in tables:
+        for parent in table['parents']:
+            children[parent].append(table['name'])
+
+    edges = 0
+    for table in tables:
+        dump(schema_dir / 'tables' / f"{table['name']}.yaml", table_doc(table, children[table['name']]))
+        for parent in table['parents']:
+            dump(schema_dir / 'joins' / f"{parent}-{table['name']}.yaml", relationship_doc(parent, table['name']))
+            edges += 1
+    facts = pick_fact_tables(tables, cube_count)
+    for table in facts:
+        dump(schema_dir / 'cubes' / f"{table['name']}.yaml", cube_doc(table, tables_by_name))
+    return schema_dir, {'tables': len(tables), 'relationships': edges, 'cubes': len(facts),
+                        'columns': sum(len(table['columns']) for table in tables)}
+
+
+def write_ddl(out_dir, schema_dir):
+    """用 schema-synth.py 的解析和建表逻辑读回 YAML，保证 DDL 与 schema-synth 加载数据时一致"""
+    tables = schema_synth.load_tables(schema_dir)
+    schema_synth.apply_relationships(tables, schema_synth.load_relationships(schema_dir))
+    order = schema_synth.load_order(tables)
+    ddl_dir = out_dir / 'ddl'
+    ddl_dir.mkdir(parents=True, exist_ok=True)
+    for db_type in ('postgresql', 'mysql'):
+        statements = [schema_synth.create_table_sql(tables[name], db_type) + ';' for name in order]
+        (ddl_dir / f"{db_type}.sql").write_text('\n\n'.join(statements) + '\n', encoding='utf-8')
+    return ddl_dir
+
+
+# ============================================
+# 4. 加载开销测量
+# ============================================
+
+def measure_catalog(schema_dir, budget):
+    yaml = schema_synth._require_yaml()
+    estimate = context_profiler.make_estimator()
+    paths = sorted(schema_dir.rglob('*.yaml'))
+    texts = [path.read_text(encoding='utf-8') for path in paths]
+    started = time.perf_counter()
+    for text in texts:
+        yaml.safe_load(text)
+    parse_ms = (time.perf_counter() - started) * 1000
+    summary, level, truncated = context_profiler.build_summary(
+        context_profiler.load_summary_sources(schema_dir), budget, estimate)
+    return {
+        'files': len(paths),
+        'bytes': sum(len(text.encode('utf-8')) for text in texts),
+        'yamlParseMs': round(parse_ms, 1),
+        'tokens': sum(estimate(text) for text in texts),
+        'summaryTokens': estimate(summary),
+        'summaryLevel': level,
+        'summaryTruncated': truncated,
+    }
+
+
+def measure_node(schema_dir):
+    """用编译后的 dist/ 测量 SchemaParser.loadSchema（冷加载、缓存命中）和堆内存增量"""
+    dist = PROJECT_ROOT / 'dist'
+    parser_js, cache_js = dist / 'schema' / 'parser.js', dist / 'performance' / 'schema-cache.js'
+    if not parser_js.exists():
+        raise RuntimeError("未找到 dist/schema/parser.js，请先运行 npm run build")
+    script = NODE_BENCH_SCRIPT % {'parser': parser_js.as_uri(), 'cache': cache_js.as_uri()}
+    result = subprocess.run(
+        ['node', '--expose-gc', '--input-type=module', '-e', script],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=600,
+        env=dict(os.environ, CATALOG_SCHEMA_DIR=str(schema_dir.resolve())),
+    )
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr or result.stdout).strip().splitlines()[-1])
+    line = next(line for line in reversed(result.stdout.splitlines()) if line.startswith('{'))
+    stats = json.loads(line)
+    return {
+        'coldMs': round(stats['coldMs'], 1),
+        'warmMs': round(stats['warmMs'], 3),
+        'heapBytes': stats['heapBytes'],
+        'tables': stats['tables'],
+        'cubes': stats['cubes'],
+        'cache': stats['cache'],
+    }
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='合成大规模 schema/ 目录（表、关系、Cube 和 DDL），测量加载和上下文开销')
+    parser.add_argument('--tables', type=positive_int, nargs='+', default=[200], help='表数量，可给多个规模对比（默认：200）')
+    parser.add_argument('--cubes', type=positive_int, help='Cube 数量（默认：表数量的 1/10，至少 1 个）')
+    parser.add_argument('--columns-median', type=positive_int, default=DEFAULT_COLUMNS_MEDIAN,
+                        help=f'每张表列数的中位数（默认：{DEFAULT_COLUMNS_MEDIAN}）')
+    parser.add_argument('--seed', type=int, default=42, help='随机种子（默认：42）')
+    parser.add_argument('--out-dir', help='输出目录（默认：scripts/output/catalog-<表数量>；多个规模时为其下的子目录）')
+    parser.add_argument('--budget', type=int, default=1500, help='测量精简摘要时的 token 预算（默认：1500）')
+    parser.add_argument('--node', action='store_true', help='用编译后的 dist/ 测量 SchemaParser 加载耗时和内存')
+    parser.add_argument('--report', help='报告 JSON（默认：scripts/output/catalog-report.json）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("SQL-Zen 大规模 Schema 目录合成")
+    print("=" * 60)
+
+    results = []
+    for table_count in args.tables:
+        cube_count = args.cubes if args.cubes is not None else max(1, table_count // 10)
+        if args.out_dir:
+            out_dir = Path(args.out_dir) / (f"catalog-{table_count}" if len(args.tables) > 1 else '')
+        else:
+            out_dir = OUTPUT_DIR / f"catalog-{table_count}"
+
+        print(f"\n📦 {table_count} 张表、{cube_count} 个 Cube → {out_dir}")
+        try:
+            schema_dir, counts = write_catalog(out_dir, table_count, cube_count, args.columns_median, args.seed)
+            ddl_dir = write_ddl(out_dir, schema_dir)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        if counts['cubes'] < cube_count:
+            print(f"⚠️  只有 {counts['cubes']} 张表适合作为事实表，生成 {counts['cubes']} 个 Cube")
+        print(f"✅ {counts['tables']} 张表（{counts['columns']} 列）、{counts['relationships']} 个关系、"
+              f"{counts['cubes']} 个 Cube，DDL: {ddl_dir}")
+
+        stats = measure_catalog(schema_dir, args.budget)
+        print(f"📊 {stats['files']} 个文件，{stats['bytes'] / 1024:.0f} KB，约 {stats['tokens']} tokens，"
+              f"YAML 解析 {stats['yamlParseMs']:.0f}ms；摘要约 {stats['summaryTokens']} tokens"
+              f"（预算 {args.budget}{'，已截断' if stats['summaryTruncated'] else ''}）")
+        entry = {'tables': table_count, 'dir': str(out_dir), 'counts': counts, 'stats': stats}
+        if args.node:
+            try:
+                entry['node'] = measure_node(schema_dir)
+                node = entry['node']
+                print(f"⏱️  loadSchema 冷加载 {node['coldMs']:.0f}ms，缓存命中 {node['warmMs']:.2f}ms，"
+                      f"堆内存增量 {node['heapBytes'] / 1024 / 1024:.1f} MB")
+            except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+                print(f"⚠️  Node 测量失败: {e}")
+        results.append(entry)
+
+    if len(results) > 1:
+        header = f"{'表':>6} {'列':>8} {'关系':>6} {'Cube':>6} {'KB':>8} {'tokens':>10} {'解析(ms)':>10} {'loadSchema(ms)':>15}"
+        print("\n" + header)
+        print('-' * len(header))
+        for entry in results:
+            counts, stats = entry['counts'], entry['stats']
+            node_ms = f"{entry['node']['coldMs']:.0f}" if 'node' in entry else '-'
+            print(f"{counts['tables']:>6} {counts['columns']:>8} {counts['relationships']:>6} {counts['cubes']:>6} "
+                  f"{stats['bytes'] / 1024:>8.0f} {stats['tokens']:>10} {stats['yamlParseMs']:>10.0f} {node_ms:>15}")
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'seed': args.seed,
+        'columns_median': args.columns_median,
+        'budget': args.budget,
+        'catalogs': results,
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'catalog-report.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()
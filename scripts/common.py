@@ -0,0 +1,134 @@
+"""
+SQL-Zen 脚本公共工具
+
+供 scripts/ 下的各个工具脚本复用：
+- 路径常量（schema/ 目录、输出目录）
+- 与 init-test-data.py 相同的数据库环境变量约定
+- 按需导入数据库驱动并建立连接
+- 计时统计辅助函数
+"""
+
+import os
+import time
+from pathlib import Path
+
+from sqlzen_seed.backends import available_backends, resolve_backend_name
+# split_sql_statements / positive_int 只在 sqlzen_seed 中实现一份，这里导入供各工具脚本使用
+from sqlzen_seed.backends.base import split_sql_statements
+from sqlzen_seed.cli import positive_int
+
+SCRIPTS_DIR = Path(__file__).parent
+SCHEMA_DIR = SCRIPTS_DIR.parent / 'schema'
+OUTPUT_DIR = SCRIPTS_DIR / 'output'
+
+# 工具脚本可以连接和生成 SQL 的数据库类型；init-test-data.py 的其他写入后端
+# （sqlite / file / duckdb，见 sqlzen_seed.backends）只用于生成数据
+SUPPORTED_DB_TYPES = ('postgresql', 'mysql')
+
+# init-test-data.py --duckdb-mirror 写入的分析镜像（可用 DUCKDB_PATH 覆盖）
+DUCKDB_FILE = OUTPUT_DIR / 'seed.duckdb'
+
+_dotenv_loaded = False
+
+
+def load_env():
+    """加载 .env 文件（dotenv 未安装时只使用系统环境变量）"""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+
+def get_db_type():
+    """读取 DB_TYPE 环境变量"""
+    load_env()
+    # 与 init-test-data.py 使用同一个后端注册表解析名称和别名（如 postgres、pg）
+    db_type = resolve_backend_name(os.getenv('DB_TYPE', 'postgresql'))
+    if db_type not in SUPPORTED_DB_TYPES:
+        raise ValueError(f"工具脚本不支持数据库类型 {db_type}（支持: {', '.join(SUPPORTED_DB_TYPES)}；"
+                         f"{', '.join(sorted(set(available_backends()) - set(SUPPORTED_DB_TYPES)))} "
+                         f"只用于 init-test-data.py 生成数据）")
+    return db_type
+
+
+def get_db_config(db_type):
+    """按 init-test-data.py 的约定读取数据库连接配置"""
+    load_env()
+    if db_type == 'duckdb':
+        return {'database': os.getenv('DUCKDB_PATH', str(DUCKDB_FILE))}
+    if db_type == 'mysql':
+        default_port, default_user = 3306, 'root'
+    else:
+        default_port, default_user = 5432, 'postgres'
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', str(default_port))),
+        'database': os.getenv('DB_NAME', 'test'),
+        'user': os.getenv('DB_USER', default_user),
+        'password': os.getenv('DB_PASSWORD', ''),
+    }
+
+
+def connect(db_type, config=None):
+    """
+    建立数据库连接
+
+    驱动在调用时才导入，缺少驱动时抛出带安装提示的 ImportError。
+    PostgreSQL 连接开启 autocommit，MySQL 连接同样开启 autocommit，
+    以便工具脚本里的 DDL/查询互不影响。DuckDB 镜像以只读方式打开。
+    """
+    config = config or get_db_config(db_type)
+    if db_type == 'duckdb':
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("请先安装 DuckDB: pip install duckdb") from e
+        return duckdb.connect(config['database'], read_only=True)
+
+    if db_type == 'mysql':
+        try:
+            import mysql.connector
+        except ImportError as e:
+            raise ImportError("请先安装 MySQL 驱动: pip install mysql-connector-python") from e
+        conn = mysql.connector.connect(**config)
+        conn.autocommit = True
+        return conn
+
+    try:
+        import psycopg2
+    except ImportError as e:
+        raise ImportError("请先安装 PostgreSQL 驱动: pip install psycopg2-binary") from e
+    conn = psycopg2.connect(**config)
+    conn.autocommit = True
+    return conn
+
+
+def timed_query(cursor, sql, params=None):
+    """执行查询并取回全部结果，返回 (rows, 耗时毫秒)"""
+    start = time.perf_counter()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall() if cursor.description else []
+    return rows, (time.perf_counter() - start) * 1000
+
+
+def percentile(values, pct):
+    """线性插值百分位数，values 为空时返回 0"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def median(values):
+    """中位数"""
+    return percentile(values, 50)
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen Schema 上下文体积分析
+
+Agent 通过 cat/grep 把 schema/ 下的 YAML 和文档读进 LLM 上下文，提示词越长，响应越慢、成本越高。
+本脚本离线估算 schema/ 中每个文件、表、列、Cube 指标/维度/过滤器、关系和文档章节的 token 数，
+标出明显偏大的条目，并生成一份限定 token 预算的精简摘要：每张表一行（只列主键、外键、枚举和时间列）、
+每个 Cube 一行，供 Agent 先读摘要定位，再按需读取完整 YAML。
+
+token 数按字符估算（CJK 字符约 1 token/字，其他字符约 4 字符/token，连续空白计为一个字符），
+不依赖分词器，适合比较相对大小；需要更准确时可用 --chars-per-token / --cjk-tokens-per-char 校准。
+
+使用方式：
+    python scripts/context-profiler.py
+    python scripts/context-profiler.py --budget 800 --top 20
+    python scripts/context-profiler.py --budget 1500 --summary schema/SUMMARY.md   # 放进 schema/ 供 Agent 读取
+
+输出：
+    控制台表格、scripts/output/schema-context.json 和 scripts/output/schema-summary.md
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+
+from common import OUTPUT_DIR, SCHEMA_DIR
+from cube_sql import metric_label, parse_granularities
+
+CHARS_PER_TOKEN = 4.0
+CJK_TOKENS_PER_CHAR = 1.0
+
+CJK_RE = re.compile(r'[　-〿㐀-䶿一-鿿豈-﫿＀-￯]')
+WHITESPACE_RE = re.compile(r'\s+')
+HEADING_RE = re.compile(r'^(#{1,3})\s+(.+?)\s*$')
+TIME_TYPE_RE = re.compile(r'^\s*(timestamp|datetime|date)\b', re.IGNORECASE)
+SHORT_SPLIT_RE = re.compile(r'[，。；,;]')
+
+# 摘要的详细程度（从详细到精简依次尝试，取第一个不超过预算的）
+SUMMARY_LEVELS = (3, 2, 1, 0)
+
+
+def _require_yaml():
+    try:
+        import yaml
+    except ImportError:
+        print("❌ 请先安装 PyYAML: pip install pyyaml")
+        sys.exit(1)
+    return yaml
+
+
+# ============================================
+# 1. token 估算
+# ============================================
+
+def make_estimator(chars_per_token=CHARS_PER_TOKEN, cjk_tokens_per_char=CJK_TOKENS_PER_CHAR):
+    def estimate(text):
+        cjk = len(CJK_RE.findall(text))
+        rest = WHITESPACE_RE.sub(' ', CJK_RE.sub('', text)).strip()
+        return math.ceil(cjk * cjk_tokens_per_char + len(rest) / chars_per_token)
+    return estimate
+
+
+# ============================================
+# 2. 条目拆分
+# ============================================
+
+def _dump(yaml, value):
+    return yaml.safe_dump(value, allow_unicode=True, sort_keys=False)
+
+
+def yaml_items(yaml, doc):
+    """
+    YAML 文档中的条目：(类型, 名称, 文本, 所属)
+
+    条目文本按 YAML 片段重新序列化，注释和空行不计入（文件级别的统计包含它们）。
+    """
+    if isinstance(doc.get('table'), dict) and isinstance(doc.get('columns'), list):
+        table = doc['table'].get('name', '?')
+        yield 'table', table, _dump(yaml, doc), None
+        for column in doc['columns']:
+            if isinstance(column, dict):
+                yield 'column', f"{table}.{column.get('name', '?')}", _dump(yaml, column), table
+    if 'cube' in doc:
+        cube = doc['cube']
+        yield 'cube', cube, _dump(yaml, doc), None
+        for section, kind in (('metrics', 'metric'), ('dimensions', 'dimension'), ('filters', 'filter')):
+            for entry in doc.get(section) or []:
+                if isinstance(entry, dict):
+                    yield kind, f"{cube}.{entry.get('name', '?')}", _dump(yaml, entry), cube
+    for entry in doc.get('relationships') or []:
+        if isinstance(entry, dict):
+            yield 'relationship', entry.get('name', '?'), _dump(yaml, entry), None
+    if isinstance(doc.get('relationship'), dict):
+        yield 'relationship', doc['relationship'].get('name', '?'), _dump(yaml, doc['relationship']), None
+
+
+def markdown_sections(text):
+    """按一到三级标题拆分 Markdown（代码块中的 # 不算标题），返回 [(标题, 文本)]"""
+    sections = []
+    title, lines, in_code = None, [], False
+    for line in text.splitlines():
+        if line.strip().startswith('```'):
+            in_code = not in_code
+        match = None if in_code else HEADING_RE.match(line)
+        if match:
+            if title is not None or any(l.strip() for l in lines):
+                sections.append((title or '(开头)', '\n'.join(lines)))
+            title, lines = match.group(2), []
+        lines.append(line)
+    if title is not None or any(l.strip() for l in lines):
+        sections.append((title or '(开头)', '\n'.join(lines)))
+    return sections
+
+
+def profile_schema(schema_dir, estimate):
+    """统计 schema/ 下全部文件及其中条目的 token 数"""
+    yaml = _require_yaml()
+    items = []
+
+    def add(kind, path, name, text, parent=None):
+        items.append({
+            'kind': kind,
+            'path': path.relative_to(schema_dir).as_posix(),
+            'name': name,
+            'parent': parent,
+            'chars': len(text),
+            'tokens': estimate(text),
+        })
+
+    for path in sorted(p for p in schema_dir.rglob('*') if p.is_file()):
+        relative = path.relative_to(schema_dir)
+        text = path.read_text(encoding='utf-8', errors='replace')
+        add('file', path, relative.as_posix(), text, relative.parts[0] if len(relative.parts) > 1 else '.')
+        if path.suffix in ('.yaml', '.yml'):
+            try:
+                doc = yaml.safe_load(text)
+            except yaml.YAMLError:
+                continue
+            if isinstance(doc, dict):
+                for kind, name, fragment, parent in yaml_items(yaml, doc):
+                    add(kind, path, name, fragment, parent)
+        elif path.suffix == '.md':
+            for title, section in markdown_sections(text):
+                add('section', path, f"{relative.as_posix()}#{title}", section, relative.as_posix())
+    return items
+
+
+def find_heavy(items, factor, top):
+    """每类条目中 token 数不低于该类中位数 factor 倍的条目（该类至少 3 个条目时才比较）"""
+    by_kind = defaultdict(list)
+    for item in items:
+        by_kind[item['kind']].append(item)
+    heavy = []
+    for kind, group in by_kind.items():
+        if len(group) < 3:
+            continue
+        threshold = median(item['tokens'] for item in group) * factor
+        for item in sorted(group, key=lambda i: i['tokens'], reverse=True)[:top]:
+            if item['tokens'] >= threshold:
+                heavy.append(dict(item, kindMedian=round(threshold / factor, 1)))
+    return sorted(heavy, key=lambda i: i['tokens'], reverse=True)
+
+
+# ============================================
+# 3. 精简摘要
+# ============================================
+
+def _short(text):
+    """描述的第一句，如「订单表，记录所有用户订单」→「订单表」"""
+    lines = str(text or '').strip().splitlines()
+    return SHORT_SPLIT_RE.split(lines[0], maxsplit=1)[0].strip() if lines else ''
+
+
+def _fk(value):
+    if isinstance(value, dict):
+        return f"{value.get('table')}.{value.get('column')}"
+    return str(value)
+
+
+def table_line(doc, level):
+    table = doc['table']
+    line = f"- {table.get('name')}"
+    description = _short(table.get('description'))
+    if description:
+        line += f"：{description}"
+    if level == 0:
+        return line
+    columns = []
+    for column in doc['columns']:
+        if not isinstance(column, dict):
+            continue
+        name = column.get('name')
+        if column.get('primary_key'):
+            columns.append(f"{name} PK")
+        elif column.get('foreign_key'):
+            columns.append(f"{name}→{_fk(column['foreign_key'])}")
+        elif column.get('enum'):
+            columns.append(f"{name}({'/'.join(str(v) for v in column['enum'])})")
+        elif TIME_TYPE_RE.match(str(column.get('type', ''))) or level >= 3:
+            columns.append(name)
+    return f"{line} | {', '.join(columns)}"
+
+
+def cube_line(doc, level):
+    line = f"- {doc['cube']}"
+    description = _short(doc.get('description'))
+    if description:
+        line += f"：{description}"
+    metrics = [m for m in doc.get('metrics') or [] if isinstance(m, dict)]
+    if level >= 2:
+        names = [f"{m['name']}({_short(metric_label(m))})" if metric_label(m) != m['name'] else m['name']
+                 for m in metrics]
+    else:
+        names = [m['name'] for m in metrics]
+    line += f" | 指标: {', '.join(names)}"
+    if level == 0:
+        return line
+    dimensions = []
+    for dimension in doc.get('dimensions') or []:
+        granularities = parse_granularities(dimension) if level >= 3 else []
+        dimensions.append(f"{dimension['name']}({'/'.join(g[0] for g in granularities)})"
+                          if granularities else dimension['name'])
+    line += f" | 维度: {', '.join(dimensions)}"
+    if level >= 2 and doc.get('filters'):
+        line += f" | 过滤: {', '.join(f['name'] for f in doc['filters'] if isinstance(f, dict))}"
+    return line
+
+
+def relationship_lines(docs):
+    """每对表一行；同一对表在多个文件中定义时取最短的关联条件"""
+    best = {}
+    for doc in docs:
+        entries = list(doc.get('relationships') or [])
+        if isinstance(doc.get('relationship'), dict):
+            entries.append(doc['relationship'])
+        for entry in entries:
+            source = entry.get('from') or entry.get('from_table')
+            target = entry.get('to') or entry.get('to_table')
+            condition = entry.get('join') or entry.get('join_sql') or ''
+            condition = ' '.join(str(condition).split())
+            if (source, target) not in best or len(condition) < len(best[(source, target)][1]):
+                best[(source, target)] = (entry.get('type', '?'), condition)
+    return [f"- {source} → {target}（{kind}）: {condition}" for (source, target), (kind, condition) in sorted(best.items())]
+
+
+def load_summary_sources(schema_dir):
+    yaml = _require_yaml()
+
+    def load(pattern):
+        docs = []
+        for path in sorted(schema_dir.glob(pattern)):
+            try:
+                doc = yaml.safe_load(path.read_text(encoding='utf-8'))
+            except yaml.YAMLError:
+                continue
+            if isinstance(doc, dict):
+                doc['_file'] = path.relative_to(schema_dir).as_posix()
+                docs.append(doc)
+        return docs
+
+    guides = []
+    for path in sorted(schema_dir.glob('guides/*.md')):
+        sections = markdown_sections(path.read_text(encoding='utf-8'))
+        title = next((title for title, _ in sections if title != '(开头)'), path.stem)
+        guides.append((path.relative_to(schema_dir).as_posix(), title))
+    return {
+        'tables': [doc for doc in load('tables/*.yaml') if isinstance(doc.get('table'), dict)
+                   and isinstance(doc.get('columns'), list)],
+        'cubes': [doc for doc in load('cubes/*.yaml') if 'cube' in doc],
+        'joins': load('joins/*.yaml'),
+        'guides': guides,
+    }
+
+
+def render_summary(sources, level):
+    lines = [
+        '# Schema 摘要',
+        '',
+        '先读本文件定位表、关系和指标；完整定义（列说明、指标 SQL、过滤条件）按需 `cat schema/<目录>/<文件>`。',
+        '',
+        '## 表（schema/tables/，列：PK 主键，→ 外键，括号内为枚举值）',
+    ]
+    lines += [table_line(doc, level) for doc in sources['tables']]
+    if level >= 1 and sources['joins']:
+        lines += ['', '## 关系（schema/joins/）'] + relationship_lines(sources['joins'])
+    lines += ['', '## Cube（schema/cubes/，优先使用其中定义的指标）']
+    lines += [cube_line(doc, level) for doc in sources['cubes']]
+    if level >= 3 and sources['guides']:
+        lines += ['', '## 文档（schema/guides/）'] + [f"- {path}：{title}" for path, title in sources['guides']]
+    return '\n'.join(lines) + '\n'
+
+
+def build_summary(sources, budget, estimate):
+    """返回 (摘要文本, 使用的详细程度, 是否截断)"""
+    for level in SUMMARY_LEVELS:
+        text = render_summary(sources, level)
+        if estimate(text) <= budget:
+            return text, level, False
+    # 最精简的版本仍然超出预算：从末尾逐行截断
+    lines = render_summary(sources, SUMMARY_LEVELS[-1]).rstrip('\n').split('\n')
+    marker = '- …（其余见 schema/）'
+    while lines and estimate('\n'.join(lines + [marker]) + '\n') > budget:
+        lines.pop()
+    return '\n'.join(lines + [marker]) + '\n', SUMMARY_LEVELS[-1], True
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='估算 schema/ 各部分的 token 数并生成限定预算的精简摘要')
+    parser.add_argument('--schema-dir', default=str(SCHEMA_DIR), help='Schema 目录（默认：仓库的 schema/）')
+    parser.add_argument('--budget', type=int, default=1500, help='摘要的 token 预算（默认：1500）')
+    parser.add_argument('--top', type=int, default=10, help='每类打印最大的条目数（默认：10）')
+    parser.add_argument('--heavy-factor', type=float, default=2.0,
+                        help='不低于同类中位数该倍数的条目标记为偏大（默认：2.0）')
+    parser.add_argument('--chars-per-token', type=float, default=CHARS_PER_TOKEN,
+                        help=f'非 CJK 字符每 token 的字符数（默认：{CHARS_PER_TOKEN}）')
+    parser.add_argument('--cjk-tokens-per-char', type=float, default=CJK_TOKENS_PER_CHAR,
+                        help=f'每个 CJK 字符的 token 数（默认：{CJK_TOKENS_PER_CHAR}）')
+    parser.add_argument('--report', help='分析结果 JSON（默认：scripts/output/schema-context.json）')
+    parser.add_argument('--summary', help='摘要输出路径（默认：scripts/output/schema-summary.md）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    schema_dir = Path(args.schema_dir)
+    estimate = make_estimator(args.chars_per_token, args.cjk_tokens_per_char)
+
+    print("=" * 60)
+    print("SQL-Zen Schema 上下文体积分析")
+    print("=" * 60)
+
+    if not schema_dir.is_dir():
+        print(f"❌ 未找到 Schema 目录: {schema_dir}")
+        sys.exit(1)
+
+    items = profile_schema(schema_dir, estimate)
+    files = [item for item in items if item['kind'] == 'file']
+    total = sum(item['tokens'] for item in files)
+    groups = defaultdict(lambda: {'files': 0, 'tokens': 0})
+    for item in files:
+        groups[item['parent']]['files'] += 1
+        groups[item['parent']]['tokens'] += item['tokens']
+
+    print(f"\n📦 {schema_dir}：{len(files)} 个文件，约 {total} tokens")
+    header = f"{'目录':<14} {'文件数':>6} {'tokens':>10} {'占比':>8}"
+    print("\n" + header)
+    print('-' * len(header))
+    for group, stats in sorted(groups.items(), key=lambda g: g[1]['tokens'], reverse=True):
+        share = stats['tokens'] / total if total else 0
+        print(f"{group:<14} {stats['files']:>6} {stats['tokens']:>10} {share:>8.1%}")
+
+    kinds = ('file', 'table', 'column', 'cube', 'metric', 'dimension', 'filter', 'relationship', 'section')
+    for kind in kinds:
+        group = sorted((item for item in items if item['kind'] == kind), key=lambda i: i['tokens'], reverse=True)
+        if not group:
+            continue
+        print(f"\n📊 最大的 {kind}（共 {len(group)} 个，中位数 {median(i['tokens'] for i in group):.0f} tokens）")
+        for item in group[:args.top]:
+            print(f"  {item['tokens']:>7}  {item['name']}")
+
+    heavy = find_heavy(items, args.heavy_factor, args.top)
+    if heavy:
+        print(f"\n⚠️  偏大的条目（≥ 同类中位数 {args.heavy_factor} 倍）：")
+        for item in heavy:
+            print(f"  {item['tokens']:>7}  [{item['kind']}] {item['name']}（同类中位数 {item['kindMedian']}）")
+
+    sources = load_summary_sources(schema_dir)
+    summary, level, truncated = build_summary(sources, args.budget, estimate)
+    summary_tokens = estimate(summary)
+    full_tokens = sum(item['tokens'] for item in files
+                      if item['parent'] in ('tables', 'joins', 'cubes'))
+    summary_path = Path(args.summary) if args.summary else OUTPUT_DIR / 'schema-summary.md'
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(summary, encoding='utf-8')
+
+    report = {
+        'schema_dir': str(schema_dir),
+        'estimator': {'charsPerToken': args.chars_per_token, 'cjkTokensPerChar': args.cjk_tokens_per_char},
+        'totalTokens': total,
+        'groups': dict(groups),
+        'heavy': heavy,
+        'summary': {
+            'path': str(summary_path),
+            'budget': args.budget,
+            'tokens': summary_tokens,
+            'level': level,
+            'truncated': truncated,
+            'fullTokens': full_tokens,
+        },
+        'items': sorted(items, key=lambda i: i['tokens'], reverse=True),
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'schema-context.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    print(f"\n📝 摘要约 {summary_tokens} tokens（预算 {args.budget}，详细程度 {level}"
+          f"{'，已截断' if truncated else ''}），tables/joins/cubes 全文约 {full_tokens} tokens")
+    print(f"📄 {summary_path}")
+    print(f"📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen Cube 查询引擎对比
+
+在主库（DB_TYPE：PostgreSQL / MySQL）和 DuckDB 分析镜像上逐条执行 Cube 生成的 SQL，
+对比每条查询的延迟并校验两边结果一致，用于判断是否把纯聚合类问题路由到列存副本。
+
+DuckDB 镜像由 init-test-data.py --duckdb-mirror 生成，与主库数据完全相同。
+
+使用方式：
+    python scripts/init-test-data.py --seed 42 --as-of 2026-01-01 --duckdb-mirror
+    python scripts/cube-benchmark.py --as-of 2026-01-01
+    python scripts/cube-benchmark.py --repeat 10 --all-granularities
+    python scripts/cube-benchmark.py --engines duckdb --duckdb /data/seed.duckdb   # 只测 DuckDB
+
+输出：
+    控制台表格，以及 scripts/output/cube-benchmark.json
+
+环境变量与 init-test-data.py 相同（DB_TYPE, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD），
+DuckDB 文件默认 scripts/output/seed.duckdb，可用 DUCKDB_PATH 或 --duckdb 指定。
+"""
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from common import (OUTPUT_DIR, SCHEMA_DIR, connect, get_db_config, get_db_type, median, percentile, positive_int,
+                    timed_query)
+from cube_sql import iter_cube_queries, load_cubes, load_table_columns
+
+# 结果比较时数值的相对误差容忍度（DOUBLE 与 DECIMAL 的舍入差异）
+RESULT_TOLERANCE = 1e-6
+
+
+# ============================================
+# 1. 执行与计时
+# ============================================
+
+def _normalize_value(value):
+    """把不同驱动返回的值统一成可比较的形式"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        # DATE_TRUNC 在 PostgreSQL / DuckDB 返回时间戳，MySQL 的改写返回日期字符串
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat(sep=' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def normalize_rows(rows):
+    rows = [tuple(_normalize_value(value) for value in row) for row in rows]
+    return sorted(rows, key=lambda row: tuple((value is None, str(value)) for value in row))
+
+
+def same_results(left, right):
+    if len(left) != len(right):
+        return False
+    for row_left, row_right in zip(left, right):
+        if len(row_left) != len(row_right):
+            return False
+        for a, b in zip(row_left, row_right):
+            if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+                if not math.isclose(a, b, rel_tol=RESULT_TOLERANCE, abs_tol=RESULT_TOLERANCE):
+                    return False
+            elif a != b:
+                return False
+    return True
+
+
+def run_engine(engine, queries, repeat, warmup, config=None):
+    """
+    在一个引擎上依次执行查询
+
+    每条查询先预热 warmup 次，再计时 repeat 次；返回 {查询 id: 结果统计}。
+    """
+    conn = connect(engine, config)
+    cursor = conn.cursor()
+    results = {}
+    try:
+        for query in queries:
+            times = []
+            try:
+                for _ in range(warmup):
+                    timed_query(cursor, query['sql'])
+                for _ in range(repeat):
+                    rows, elapsed = timed_query(cursor, query['sql'])
+                    times.append(elapsed)
+            except Exception as e:
+                results[query['id']] = {'error': str(e).splitlines()[0][:200]}
+                continue
+            results[query['id']] = {
+                'medianQueryTime': round(median(times), 3),
+                'p95QueryTime': round(percentile(times, 95), 3),
+                'minQueryTime': round(min(times), 3),
+                'rows': len(rows),
+                'result': normalize_rows(rows),
+            }
+    finally:
+        cursor.close()
+        conn.close()
+    return results
+
+
+# ============================================
+# 2. 对比汇总
+# ============================================
+
+def geomean(values):
+    values = [value for value in values if value > 0]
+    return math.exp(sum(math.log(value) for value in values) / len(values)) if values else None
+
+
+def compare(queries, engines, results, route_threshold):
+    """以第一个引擎为基准，计算每条查询的加速比和结果一致性"""
+    baseline = engines[0]
+    rows = []
+    for query in queries:
+        entry = {'query': query['id'], 'cube': query['cube']}
+        base = results[baseline].get(query['id'], {})
+        for engine in engines:
+            stats = results[engine].get(query['id'], {})
+            entry[engine] = {key: value for key, value in stats.items() if key != 'result'}
+            if engine == baseline or 'error' in stats or 'error' in base:
+                continue
+            entry[engine]['speedup'] = (round(base['medianQueryTime'] / stats['medianQueryTime'], 2)
+                                        if stats['medianQueryTime'] else None)
+            entry[engine]['match'] = same_results(base['result'], stats['result'])
+        rows.append(entry)
+
+    summary = {}
+    for engine in engines:
+        ok = [row for row in rows if 'error' not in row[engine]]
+        engine_summary = {
+            'queries': len(ok),
+            'errors': len(rows) - len(ok),
+            'totalMedianTime': round(sum(row[engine]['medianQueryTime'] for row in ok), 3),
+        }
+        if engine != baseline:
+            speedups = [row[engine]['speedup'] for row in ok if row[engine].get('speedup')]
+            engine_summary.update({
+                'geomeanSpeedup': round(geomean(speedups), 2) if speedups else None,
+                'mismatches': sum(1 for row in ok if row[engine].get('match') is False),
+                'routable': sum(1 for row in ok
+                                if row[engine].get('match') and (row[engine].get('speedup') or 0) >= route_threshold),
+            })
+        summary[engine] = engine_summary
+
+    by_cube = defaultdict(dict)
+    for engine in engines[1:]:
+        for cube in sorted({row['cube'] for row in rows}):
+            speedups = [row[engine]['speedup'] for row in rows
+                        if row['cube'] == cube and row[engine].get('speedup')]
+            by_cube[cube][engine] = round(geomean(speedups), 2) if speedups else None
+    return rows, summary, dict(by_cube)
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='在主库和 DuckDB 镜像上对比 Cube 查询的延迟和结果')
+    parser.add_argument('--engines',
+                        help='参与对比的引擎，逗号分隔，第一个为基准（默认：DB_TYPE,duckdb）')
+    parser.add_argument('--duckdb', help='DuckDB 镜像文件（默认：DUCKDB_PATH 或 scripts/output/seed.duckdb）')
+    parser.add_argument('--repeat', type=positive_int, default=5, help='每条查询计时执行的次数（默认：5）')
+    parser.add_argument('--warmup', type=int, default=1, help='每条查询计时前的预热次数（默认：1）')
+    parser.add_argument('--cubes', nargs='*', help='Cube 文件名（默认：init-test-data.py 生成的三个 Cube，* 表示全部）')
+    parser.add_argument('--all-granularities', action='store_true', help='时间维度展开全部粒度')
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help='Cube SQL 的 CURRENT_DATE 固定为该日期（与 init-test-data.py --as-of 一致）')
+    parser.add_argument('--route-threshold', type=float, default=2.0,
+                        help='加速比达到该值且结果一致时建议路由到列存（默认：2.0）')
+    parser.add_argument('--top', type=int, default=10, help='打印加速比最高/最低的查询条数（默认：10）')
+    parser.add_argument('--report', help='报告 JSON 路径（默认：scripts/output/cube-benchmark.json）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("SQL-Zen Cube 查询引擎对比")
+    print("=" * 60)
+
+    try:
+        engines = args.engines.split(',') if args.engines else [get_db_type(), 'duckdb']
+        cubes = load_cubes(SCHEMA_DIR, args.cubes)
+        table_columns = load_table_columns(SCHEMA_DIR)
+        queries = {
+            engine: list(iter_cube_queries(cubes, engine, table_columns,
+                                           all_granularities=args.all_granularities, as_of=args.as_of))
+            for engine in engines
+        }
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if not queries[engines[0]]:
+        print("❌ 没有可用的 Cube 查询，请先运行 init-test-data.py 生成 Cube 文件")
+        sys.exit(1)
+
+    configs = {engine: None for engine in engines}
+    if 'duckdb' in engines:
+        configs['duckdb'] = {'database': args.duckdb} if args.duckdb else get_db_config('duckdb')
+        if not Path(configs['duckdb']['database']).exists():
+            print(f"❌ 未找到 DuckDB 文件: {configs['duckdb']['database']}")
+            print("   请先运行: python scripts/init-test-data.py --duckdb-mirror")
+            sys.exit(1)
+
+    print(f"\n📦 引擎: {', '.join(engines)}（基准: {engines[0]}），{len(queries[engines[0]])} 条查询，"
+          f"每条预热 {args.warmup} 次、计时 {args.repeat} 次")
+    if args.as_of is None:
+        print("⚠️  未指定 --as-of，时间窗口按各引擎的 CURRENT_DATE 计算")
+
+    results = {}
+    for engine in engines:
+        print(f"\n⏱️  {engine} ...")
+        try:
+            results[engine] = run_engine(engine, queries[engine], args.repeat, args.warmup, configs[engine])
+        except Exception as e:
+            print(f"❌ {engine} 连接失败: {e}")
+            sys.exit(1)
+        failed = sum(1 for stats in results[engine].values() if 'error' in stats)
+        total = sum(stats.get('medianQueryTime', 0) for stats in results[engine].values())
+        print(f"✅ 完成，中位数合计 {total:.1f}ms" + (f"，{failed} 条失败" if failed else ""))
+
+    rows, summary, by_cube = compare(queries[engines[0]], engines, results, args.route_threshold)
+
+    baseline = engines[0]
+    for engine in engines[1:]:
+        ranked = sorted((row for row in rows if row[engine].get('speedup')),
+                        key=lambda row: row[engine]['speedup'], reverse=True)
+        header = f"{'查询':<60} {baseline + '(ms)':>14} {engine + '(ms)':>14} {'加速比':>8} {'结果':>4}"
+        for title, selected in ((f"加速比最高的 {args.top} 条", ranked[:args.top]),
+                                (f"加速比最低的 {args.top} 条", ranked[::-1][:args.top])):
+            print(f"\n📊 {engine} 相对 {baseline}：{title}")
+            print(header)
+            print('-' * len(header))
+            for row in selected:
+                print(f"{row['query'][:60]:<60} {row[baseline]['medianQueryTime']:>14.2f} "
+                      f"{row[engine]['medianQueryTime']:>14.2f} {row[engine]['speedup']:>8.2f} "
+                      f"{'✓' if row[engine]['match'] else '✗':>4}")
+
+        print(f"\n📦 按 Cube 的几何平均加速比（{engine} 相对 {baseline}）：")
+        for cube, speedups in by_cube.items():
+            speedup = speedups.get(engine)
+            print(f"  - {cube}: {speedup if speedup is not None else '-'}")
+
+        stats = summary[engine]
+        print(f"\n🎯 {engine}: 几何平均加速比 {stats['geomeanSpeedup']}，"
+              f"{stats['routable']}/{stats['queries']} 条查询加速 ≥ {args.route_threshold} 倍且结果一致")
+        if stats['mismatches']:
+            print(f"⚠️  {stats['mismatches']} 条查询结果不一致，详见报告（检查两边数据是否来自同一次导入、--as-of 是否一致）")
+
+    report = {
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'engines': engines,
+        'baseline': baseline,
+        'as_of': args.as_of.isoformat() if args.as_of else None,
+        'repeat': args.repeat,
+        'warmup': args.warmup,
+        'route_threshold': args.route_threshold,
+        'summary': summary,
+        'by_cube': by_cube,
+        'queries': rows,
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'cube-benchmark.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""
+Cube 层 SQL 渲染工具
+
+读取 schema/cubes/*.yaml，把「指标 × 维度 × 过滤器」组合渲染成可执行的 SQL，
+并在 PostgreSQL（Cube 文件原生方言）与 MySQL、DuckDB 之间做必要的语法转换。
+
+用法示例：
+    from cube_sql import load_cubes, load_table_columns, iter_cube_queries
+
+    cubes = load_cubes()
+    for query in iter_cube_queries(cubes, 'postgresql', load_table_columns()):
+        print(query['id'], query['sql'])
+"""
+
+import re
+
+from common import SCHEMA_DIR
+
+# init-test-data.py 生成、且与种子数据表结构一致的 Cube 文件
+SEEDED_CUBE_FILES = ['business-metrics.yaml', 'user-analytics.yaml', 'product-analytics.yaml']
+
+SUPPORTED_DIALECTS = ('postgresql', 'mysql', 'duckdb')
+
+COLUMN_REF_RE = re.compile(r'\b([A-Za-z_][A-Za-z0-9_]*)\.([A-Za-z_][A-Za-z0-9_]*)\b')
+JOIN_RE = re.compile(
+    r'^\s*(?:(LEFT|INNER|RIGHT)\s+(?:OUTER\s+)?)?JOIN\s+(\w+)\s+ON\s+(.+?)\s*$',
+    re.IGNORECASE,
+)
+INTERVAL_RE = re.compile(r"INTERVAL\s+'(\d+)\s+(day|week|month|year)s?'", re.IGNORECASE)
+DATE_TRUNC_RE = re.compile(r"DATE_TRUNC\('(\w+)',\s*([^()]*?)\)", re.IGNORECASE)
+CURRENT_DATE_RE = re.compile(r'\bCURRENT_DATE\b(?!\s*\()', re.IGNORECASE)
+LABEL_SPLIT_RE = re.compile(r'\s+[-=]\s+|\s*[（(]')
+
+
+def _require_yaml():
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("请先安装 PyYAML: pip install pyyaml") from e
+    return yaml
+
+
+def load_cubes(schema_dir=SCHEMA_DIR, files=None):
+    """
+    加载 Cube 定义
+
+    files 为空时只加载种子数据对应的 Cube 文件；传入 ['*'] 加载 cubes/ 下全部文件。
+    """
+    yaml = _require_yaml()
+    cubes_dir = schema_dir / 'cubes'
+    if files is None:
+        paths = [cubes_dir / name for name in SEEDED_CUBE_FILES]
+    elif list(files) == ['*']:
+        paths = sorted(cubes_dir.glob('*.yaml'))
+    else:
+        paths = [cubes_dir / name if '/' not in str(name) else name for name in files]
+
+    cubes = []
+    for path in paths:
+        if not path.exists():
+            continue
+        cube = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+        if 'cube' not in cube:
+            continue
+        cube['_file'] = path.name
+        cubes.append(cube)
+    return cubes
+
+
+def load_table_columns(schema_dir=SCHEMA_DIR):
+    """读取 schema/tables/*.yaml，返回 {表名: [列名, ...]}"""
+    yaml = _require_yaml()
+    tables = {}
+    for path in sorted((schema_dir / 'tables').glob('*.yaml')):
+        doc = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+        table = doc.get('table') or {}
+        name = table.get('name') if isinstance(table, dict) else None
+        if not name:
+            continue
+        tables[name] = [col['name'] for col in doc.get('columns') or [] if 'name' in col]
+    return tables
+
+
+def column_refs(sql):
+    """提取 SQL 片段中的 表.列 引用"""
+    return COLUMN_REF_RE.findall(sql or '')
+
+
+def parse_joins(join_sql):
+    """解析 join 片段，返回 [(join_type, table, on_condition), ...]"""
+    joins = []
+    for line in (join_sql or '').splitlines():
+        match = JOIN_RE.match(line)
+        if match:
+            join_type = (match.group(1) or 'INNER').upper()
+            joins.append((join_type, match.group(2), match.group(3)))
+    return joins
+
+
+def parse_granularities(dimension):
+    """返回维度的粒度列表 [(name, sql, description), ...]"""
+    result = []
+    for item in dimension.get('granularity') or []:
+        if isinstance(item, dict):
+            for name, spec in item.items():
+                spec = spec or {}
+                result.append((name, spec.get('sql'), spec.get('description', name)))
+    return result
+
+
+def cube_base_table(cube):
+    """推断 Cube 的主表：第一个无需 JOIN 的维度或指标所引用的表"""
+    for item in (cube.get('dimensions') or []) + (cube.get('metrics') or []):
+        if item.get('join'):
+            continue
+        refs = column_refs(item.get('column') or item.get('sql'))
+        if refs:
+            return refs[0][0]
+    return None
+
+
+def to_dialect(sql, dialect):
+    """把 Cube 中的 PostgreSQL 语法转换为目标方言"""
+    if dialect not in SUPPORTED_DIALECTS:
+        raise ValueError(f"不支持的 SQL 方言: {dialect}")
+    if dialect == 'duckdb':
+        # DuckDB 兼容 INTERVAL / DATE_TRUNC / DATE() 写法，但不带精度的 DECIMAL 是 DECIMAL(18,3)，
+        # 比率的分子会被截断到 3 位小数，改用 DOUBLE
+        return sql.replace('::DECIMAL', '::DOUBLE')
+    if dialect != 'mysql':
+        return sql
+
+    sql = INTERVAL_RE.sub(lambda m: f"INTERVAL {m.group(1)} {m.group(2).upper()}", sql)
+    sql = sql.replace('::DECIMAL', '')
+
+    def _date_trunc(match):
+        unit, expr = match.group(1).lower(), match.group(2).strip()
+        if unit == 'day':
+            return f"DATE({expr})"
+        if unit == 'week':
+            return f"DATE_SUB(DATE({expr}), INTERVAL WEEKDAY({expr}) DAY)"
+        if unit == 'month':
+            return f"DATE_FORMAT({expr}, '%Y-%m-01')"
+        if unit == 'year':
+            return f"DATE_FORMAT({expr}, '%Y-01-01')"
+        return match.group(0)
+
+    return DATE_TRUNC_RE.sub(_date_trunc, sql)
+
+
+def anchor_date(sql, as_of):
+    """把 CURRENT_DATE 替换为固定日期，使时间窗口过滤器的结果不随运行日期变化"""
+    if as_of is None:
+        return sql
+    return CURRENT_DATE_RE.sub(f"DATE '{as_of.isoformat()}'", sql)
+
+
+def _squash(sql):
+    return ' '.join((sql or '').split())
+
+
+def build_query(cube, metric, dimension=None, granularity=None, filter_=None,
+                dialect='postgresql', table_columns=None, as_of=None):
+    """
+    渲染单个 Cube 查询
+
+    dimension/granularity/filter_ 均为可选；granularity 为 parse_granularities 返回的元组。
+    引用了未 JOIN 的表、或 table_columns 中不存在的列时返回 None。
+    传入 as_of（date）时，CURRENT_DATE 渲染为该日期。
+    """
+    base = cube_base_table(cube)
+    if not base:
+        return None
+
+    joins = []
+    joined = {base}
+    for join_sql in ((dimension or {}).get('join'), metric.get('join')):
+        for join_type, table, condition in parse_joins(join_sql):
+            if table in joined:
+                continue
+            joined.add(table)
+            prefix = 'JOIN' if join_type == 'INNER' else f"{join_type} JOIN"
+            joins.append(f"{prefix} {table} ON {condition}")
+
+    select_parts = []
+    group_expr = None
+    if dimension is not None:
+        group_expr = granularity[1] if granularity else dimension.get('column')
+        alias = dimension['name'] if not granularity else f"{dimension['name']}_{granularity[0]}"
+        select_parts.append(f"{_squash(group_expr)} AS {alias}")
+    select_parts.append(f"{_squash(metric['sql'])} AS {metric['name']}")
+
+    sql = f"SELECT {', '.join(select_parts)} FROM {base}"
+    if joins:
+        sql += ' ' + ' '.join(joins)
+    if filter_ is not None:
+        sql += f" WHERE {_squash(filter_['sql'])}"
+    if group_expr is not None:
+        sql += f" GROUP BY {_squash(group_expr)} ORDER BY {alias}"
+
+    if table_columns is not None:
+        for table, column in column_refs(sql):
+            if table not in table_columns:
+                continue
+            if table not in joined or column not in table_columns[table]:
+                return None
+
+    return to_dialect(anchor_date(sql, as_of), dialect)
+
+
+def iter_cube_queries(cubes, dialect='postgresql', table_columns=None,
+                      all_granularities=False, with_dimensions=True, with_filters=True, as_of=None):
+    """
+    枚举 Cube 中的「指标 × 维度(粒度) × 过滤器」组合
+
+    产出 dict：id, cube, metric, dimension, granularity, filter, sql。
+    默认每个时间维度只取第一个粒度，all_granularities=True 时展开全部粒度。
+    """
+    for cube in cubes:
+        groupings = [(None, None)]
+        if with_dimensions:
+            for dimension in cube.get('dimensions') or []:
+                granularities = parse_granularities(dimension)
+                if not granularities:
+                    groupings.append((dimension, None))
+                elif all_granularities:
+                    groupings.extend((dimension, g) for g in granularities)
+                else:
+                    groupings.append((dimension, granularities[0]))
+
+        filters = [None]
+        if with_filters:
+            filters.extend(cube.get('filters') or [])
+
+        for metric in cube.get('metrics') or []:
+            for dimension, granularity in groupings:
+                for filter_ in filters:
+                    sql = build_query(cube, metric, dimension, granularity, filter_,
+                                      dialect=dialect, table_columns=table_columns, as_of=as_of)
+                    if sql is None:
+                        continue
+                    query_id = f"{cube['cube']}.{metric['name']}"
+                    if dimension is not None:
+                        query_id += f"|by={dimension['name']}"
+                        if granularity:
+                            query_id += f".{granularity[0]}"
+                    if filter_ is not None:
+                        query_id += f"|filter={filter_['name']}"
+                    yield {
+                        'id': query_id,
+                        'cube': cube['cube'],
+                        'metric': metric['name'],
+                        'dimension': dimension['name'] if dimension else None,
+                        'granularity': granularity[0] if granularity else None,
+                        'filter': filter_['name'] if filter_ else None,
+                        'sql': sql,
+                    }
+
+
+def metric_label(metric):
+    """从指标描述中取出简短的业务名称，如「总收入 - 已支付…」→「总收入」"""
+    description = metric.get('description') or metric['name']
+    return LABEL_SPLIT_RE.split(description.strip(), maxsplit=1)[0].strip()
+
+
+def cube_questions(cubes, dialect='postgresql', table_columns=None, as_of=None):
+    """
+    为「指标 × 过滤器」组合生成中文问题及对应 SQL
+
+    问题格式与 README 中的示例一致，如「最近30天的总收入是多少？」。
+    """
+    for cube in cubes:
+        filters = {f['name']: f for f in cube.get('filters') or []}
+        metrics = {m['name']: m for m in cube.get('metrics') or []}
+        for query in iter_cube_queries([cube], dialect, table_columns, with_dimensions=False, as_of=as_of):
+            label = metric_label(metrics[query['metric']])
+            if query['filter']:
+                question = f"{filters[query['filter']].get('description', query['filter'])}的{label}是多少？"
+            else:
+                question = f"{label}是多少？"
+            yield dict(query, question=question)
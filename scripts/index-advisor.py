@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 索引顾问
+
+功能：
+1. 从 Cube 层定义（JOIN 条件、过滤器、维度、指标）推导候选索引
+   - 单列 JOIN 索引（如 orders.user_id, order_items.product_id）
+   - 等值 + 范围过滤复合索引（如 orders(status, created_at)）
+   - JOIN + 过滤复合索引、覆盖索引（PostgreSQL 使用 INCLUDE）
+2. 在已初始化的测试数据上逐个建索引，对比 EXPLAIN 成本与实际耗时
+3. 输出带收益说明的推荐 DDL，init-test-data.py 会优先使用该文件建索引
+
+使用方式：
+    python scripts/index-advisor.py                    # 评估并生成推荐 DDL
+    python scripts/index-advisor.py --dry-run          # 只列出候选索引，不连接数据库
+    python scripts/index-advisor.py --drop-existing    # 评估时删除现有二级索引，从零证明每个索引的收益（结束后重建）
+
+输出文件：
+    scripts/output/indexes-<DB_TYPE>.sql       推荐的索引 DDL
+    scripts/output/index-advisor-report.json   每个候选索引的评估明细
+
+环境变量与 init-test-data.py 相同（DB_TYPE, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD）。
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from common import OUTPUT_DIR, SCHEMA_DIR, connect, get_db_type, median, timed_query
+from cube_sql import (
+    column_refs,
+    iter_cube_queries,
+    load_cubes,
+    load_table_columns,
+    parse_granularities,
+    parse_joins,
+)
+from sqlzen_seed import templates
+
+EQUALITY_RE = re.compile(r'\b(\w+)\.(\w+)\s*(?:=|\bIN\b)\s*(?!\s*\w+\.\w+)', re.IGNORECASE)
+RANGE_RE = re.compile(r'\b(\w+)\.(\w+)\s*(?:>=|<=|>|<|\bBETWEEN\b)', re.IGNORECASE)
+
+MAX_INDEX_COLUMNS = 5
+MAX_INDEX_NAME_LENGTH = 63
+
+
+# ============================================
+# 1. 工作负载分析与候选索引推导
+# ============================================
+
+def _find(items, name):
+    for item in items or []:
+        if item.get('name') == name:
+            return item
+    return None
+
+
+def analyze_query(cube, query):
+    """
+    分析一个 Cube 查询对每张表的列使用情况
+
+    返回 {表名: {'eq': [...], 'range': [...], 'join': [...], 'group': [...], 'used': [...]}}
+    """
+    metric = _find(cube.get('metrics'), query['metric'])
+    dimension = _find(cube.get('dimensions'), query['dimension'])
+    filter_ = _find(cube.get('filters'), query['filter'])
+    usage = defaultdict(lambda: {'eq': [], 'range': [], 'join': [], 'group': [], 'used': []})
+
+    def add(table, kind, column):
+        if column not in usage[table][kind]:
+            usage[table][kind].append(column)
+        if column not in usage[table]['used']:
+            usage[table]['used'].append(column)
+
+    for join_sql in ((dimension or {}).get('join'), metric.get('join')):
+        for _, _, condition in parse_joins(join_sql):
+            for table, column in column_refs(condition):
+                if column != 'id':
+                    add(table, 'join', column)
+                else:
+                    add(table, 'used', column)
+
+    if filter_:
+        sql = filter_['sql']
+        for table, column in EQUALITY_RE.findall(sql):
+            add(table, 'eq', column)
+        for table, column in RANGE_RE.findall(sql):
+            add(table, 'range', column)
+        for table, column in column_refs(sql):
+            if column not in usage[table]['eq']:
+                add(table, 'range', column)
+
+    if dimension:
+        group_sql = dimension.get('column')
+        for name, sql, _ in parse_granularities(dimension):
+            if name == query['granularity']:
+                group_sql = sql
+        for table, column in column_refs(group_sql):
+            add(table, 'group', column)
+
+    for table, column in column_refs(metric['sql']):
+        add(table, 'used', column)
+
+    return usage
+
+
+def derive_candidates(cubes, queries, table_columns):
+    """根据工作负载推导候选索引，返回 {(表, 键列, INCLUDE 列): 支持的查询 id 集合}"""
+    cube_map = {cube['cube']: cube for cube in cubes}
+    candidates = defaultdict(set)
+
+    def propose(table, key, include=()):
+        key = tuple(dict.fromkeys(key))
+        include = tuple(col for col in dict.fromkeys(include) if col not in key)
+        if not key or table not in table_columns:
+            return
+        if key == ('id',) or len(key) + len(include) > MAX_INDEX_COLUMNS:
+            return
+        candidates[(table, key, include)].add(query['id'])
+
+    for query in queries:
+        usage = analyze_query(cube_map[query['cube']], query)
+        for table, cols in usage.items():
+            filter_key = cols['eq'] + cols['range'][:1]
+            for join_col in cols['join']:
+                propose(table, [join_col])
+                if filter_key:
+                    propose(table, [join_col] + filter_key)
+                    propose(table, [join_col] + filter_key, cols['used'])
+                else:
+                    propose(table, [join_col], cols['used'])
+            if filter_key:
+                propose(table, filter_key)
+                propose(table, filter_key, cols['used'])
+            for group_col in cols['group']:
+                propose(table, cols['eq'] + [group_col])
+                propose(table, cols['eq'] + [group_col], cols['used'])
+
+    return candidates
+
+
+def index_name(table, key, include):
+    name = f"idx_{table}_{'_'.join(key)}"
+    if include:
+        name += f"_inc_{'_'.join(include)}"
+    if len(name) > MAX_INDEX_NAME_LENGTH:
+        digest = hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
+        name = f"{name[:MAX_INDEX_NAME_LENGTH - 9]}_{digest}"
+    return name
+
+
+def index_ddl(db_type, table, key, include):
+    name = index_name(table, key, include)
+    if db_type == 'mysql':
+        return f"CREATE INDEX {name} ON {table} ({', '.join(key + include)})"
+    ddl = f"CREATE INDEX {name} ON {table} ({', '.join(key)})"
+    if include:
+        ddl += f" INCLUDE ({', '.join(include)})"
+    return ddl
+
+
+# ============================================
+# 2. 数据库侧评估
+# ============================================
+
+def existing_indexes(cursor, db_type, table):
+    """返回表上现有的非唯一二级索引 {索引名: (列, ...)}"""
+    indexes = {}
+    if db_type == 'mysql':
+        cursor.execute("""
+            SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND NON_UNIQUE = 1
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+        """, (table,))
+        for name, column in cursor.fetchall():
+            indexes[name] = indexes.get(name, ()) + (column,)
+        return indexes
+
+    # 按 pg_index.indkey 读取全部列（包括 INCLUDE 列），与候选索引的 key + include 比较
+    cursor.execute("""
+        SELECT i.relname, a.attname
+        FROM pg_index x
+        JOIN pg_class t ON t.oid = x.indrelid
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN LATERAL unnest(x.indkey) WITH ORDINALITY AS k(attnum, position) ON true
+        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+        WHERE t.relname = %s AND t.relnamespace = current_schema()::regnamespace
+          AND NOT x.indisunique AND NOT x.indisprimary
+        ORDER BY i.relname, k.position
+    """, (table,))
+    for name, column in cursor.fetchall():
+        indexes[name] = indexes.get(name, ()) + (column,)
+    return indexes
+
+
+def index_definition(cursor, db_type, table, name):
+    """现有索引的 CREATE INDEX 语句（用于 --drop-existing 评估后重建）"""
+    if db_type == 'mysql':
+        cursor.execute("""
+            SELECT COLUMN_NAME, SUB_PART, INDEX_TYPE FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+            ORDER BY SEQ_IN_INDEX
+        """, (table, name))
+        rows = cursor.fetchall()
+        columns = ', '.join(f"{column}({sub_part})" if sub_part else column for column, sub_part, _ in rows)
+        kind = 'FULLTEXT ' if rows and rows[0][2] == 'FULLTEXT' else ''
+        return f"CREATE {kind}INDEX {name} ON {table} ({columns})"
+    cursor.execute("SELECT pg_get_indexdef(%s::regclass)", (name,))
+    return cursor.fetchall()[0][0]
+
+
+def explain_cost(cursor, db_type, sql):
+    """读取优化器估算的查询总成本"""
+    if db_type == 'mysql':
+        cursor.execute(f"EXPLAIN FORMAT=JSON {sql}")
+        plan = json.loads(cursor.fetchall()[0][0])
+        return float(plan['query_block']['cost_info']['query_cost'])
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = cursor.fetchall()[0][0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return float(plan[0]['Plan']['Total Cost'])
+
+
+def measure(cursor, db_type, sql, repeat):
+    """返回 (EXPLAIN 成本, 耗时中位数毫秒)，先执行一次预热"""
+    cost = explain_cost(cursor, db_type, sql)
+    timed_query(cursor, sql)
+    timings = [timed_query(cursor, sql)[1] for _ in range(repeat)]
+    return cost, median(timings)
+
+
+def analyze_table(cursor, db_type, table):
+    cursor.execute(f"ANALYZE TABLE {table}" if db_type == 'mysql' else f"ANALYZE {table}")
+    if cursor.description:
+        cursor.fetchall()
+
+
+def evaluate(cursor, db_type, queries, candidates, repeat):
+    """逐个创建候选索引，对比受影响查询的成本和耗时"""
+    print(f"\n⏱️  测量基线（{len(queries)} 个查询，每个执行 {repeat} 次）...")
+    baseline = {}
+    for query in queries:
+        try:
+            baseline[query['id']] = measure(cursor, db_type, query['sql'], repeat)
+        except Exception as e:
+            print(f"⚠️  跳过无法执行的查询 {query['id']}: {e}")
+    queries_by_id = {query['id']: query for query in queries if query['id'] in baseline}
+
+    results = []
+    for i, ((table, key, include), supported) in enumerate(candidates, 1):
+        affected = [qid for qid in supported if qid in queries_by_id]
+        if not affected:
+            continue
+        ddl = index_ddl(db_type, table, list(key), list(include))
+        name = index_name(table, key, include)
+        print(f"  [{i}/{len(candidates)}] {ddl}")
+        try:
+            cursor.execute(ddl)
+            analyze_table(cursor, db_type, table)
+            base_cost = base_ms = new_cost = new_ms = 0.0
+            for qid in affected:
+                cost, ms = measure(cursor, db_type, queries_by_id[qid]['sql'], repeat)
+                base_cost += baseline[qid][0]
+                base_ms += baseline[qid][1]
+                new_cost += cost
+                new_ms += ms
+        except Exception as e:
+            print(f"    ⚠️  评估失败: {e}")
+            continue
+        finally:
+            try:
+                cursor.execute(f"DROP INDEX {name} ON {table}" if db_type == 'mysql' else f"DROP INDEX IF EXISTS {name}")
+            except Exception:
+                pass
+
+        cost_gain = (base_cost - new_cost) / base_cost if base_cost else 0.0
+        time_gain = (base_ms - new_ms) / base_ms if base_ms else 0.0
+        print(f"    成本 {base_cost:.1f} → {new_cost:.1f} ({cost_gain:+.1%})，"
+              f"耗时 {base_ms:.2f}ms → {new_ms:.2f}ms ({time_gain:+.1%})")
+        results.append({
+            'name': name,
+            'table': table,
+            'key': list(key),
+            'include': list(include),
+            'ddl': ddl,
+            'queries': sorted(affected),
+            'baseline_cost': round(base_cost, 2),
+            'indexed_cost': round(new_cost, 2),
+            'cost_gain': round(cost_gain, 4),
+            'baseline_ms': round(base_ms, 3),
+            'indexed_ms': round(new_ms, 3),
+            'time_gain': round(time_gain, 4),
+        })
+    return results
+
+
+def select_recommendations(results, min_gain):
+    """保留成本和耗时都有实际收益的索引，并去掉被更宽索引前缀覆盖的冗余索引"""
+    proven = [r for r in results if r['cost_gain'] >= min_gain and r['time_gain'] >= min_gain]
+    proven.sort(key=lambda r: (r['baseline_ms'] - r['indexed_ms']), reverse=True)
+
+    selected = []
+    for result in proven:
+        columns = result['key'] + result['include']
+        redundant = False
+        for chosen in selected:
+            if chosen['table'] != result['table']:
+                continue
+            chosen_columns = chosen['key'] + chosen['include']
+            if chosen['key'][:len(result['key'])] == result['key'] and set(columns) <= set(chosen_columns):
+                redundant = True
+                break
+        if not redundant:
+            selected.append(result)
+    return selected
+
+
+# ============================================
+# 3. 输出
+# ============================================
+
+def write_outputs(output_dir, db_type, recommendations, results, workload_size):
+    """
+    写入推荐 DDL 和评估报告
+
+    init-test-data.py 用 DDL 文件代替默认索引，所以文件中包含默认索引（templates/indexes.sql）
+    和推荐索引；没有推荐时不写 DDL 文件（并删除上次的结果），重新加载时使用默认索引。
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    ddl_path = output_dir / f'indexes-{db_type}.sql'
+    report_path = output_dir / 'index-advisor-report.json'
+
+    if recommendations:
+        default_sql = templates.create_indexes_sql().strip()
+        default_names = set(re.findall(r'CREATE\s+INDEX\s+(\w+)', default_sql, re.IGNORECASE))
+        lines = [
+            f"-- 由 scripts/index-advisor.py 生成于 {datetime.now().isoformat(timespec='seconds')}",
+            f"-- 数据库类型: {db_type}，评估查询数: {workload_size}",
+            "-- init-test-data.py 会在数据导入完成后执行本文件中的索引（代替默认索引）",
+            "",
+            "-- 默认索引（sqlzen_seed/templates/indexes.sql）",
+            default_sql,
+            "",
+        ]
+        for rec in recommendations:
+            if rec['name'] in default_names:
+                continue
+            lines.append(f"-- 支持 {len(rec['queries'])} 个 Cube 查询，"
+                         f"EXPLAIN 成本 {-rec['cost_gain']:+.1%}，耗时 {-rec['time_gain']:+.1%}")
+            lines.append(f"{rec['ddl']};")
+            lines.append("")
+        ddl_path.write_text('\n'.join(lines), encoding='utf-8')
+    else:
+        ddl_path.unlink(missing_ok=True)
+        ddl_path = None
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'db_type': db_type,
+        'workload_size': workload_size,
+        'recommended': [rec['name'] for rec in recommendations],
+        'candidates': results,
+    }
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    return ddl_path, report_path
+
+
+def restore_indexes(cursor, db_type, dropped, applied):
+    """重建 --drop-existing 删除的索引；与已创建的推荐索引列相同的不再重复创建"""
+    restored = set()
+    for table, columns, ddl in dropped:
+        if (table, columns) in applied:
+            continue
+        try:
+            cursor.execute(ddl)
+            restored.add(table)
+            print(f"♻️  重建索引: {ddl}")
+        except Exception as e:
+            print(f"❌ 重建索引失败，请手动执行: {ddl};（{e}）")
+    for table in sorted(restored):
+        analyze_table(cursor, db_type, table)
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='基于 Cube 定义推导并验证索引')
+    parser.add_argument('--cubes', nargs='*', help='要分析的 Cube 文件名（默认：种子数据对应的 Cube）')
+    parser.add_argument('--all-cubes', action='store_true', help='分析 schema/cubes/ 下全部 Cube 文件')
+    parser.add_argument('--max-queries', type=int, default=80, help='参与评估的最大查询数（默认：80）')
+    parser.add_argument('--max-candidates', type=int, default=20, help='评估的最大候选索引数（默认：20）')
+    parser.add_argument('--repeat', type=int, default=5, help='每个查询的计时次数（默认：5）')
+    parser.add_argument('--min-gain', type=float, default=0.05,
+                        help='成本和耗时都需达到的最小改善比例（默认：0.05）')
+    parser.add_argument('--drop-existing', action='store_true',
+                        help='评估时删除 Cube 涉及表上的现有二级索引（以无索引为基线），结束后重建')
+    parser.add_argument('--apply', action='store_true', help='评估后保留（创建）推荐的索引')
+    parser.add_argument('--dry-run', action='store_true', help='只列出候选索引，不连接数据库')
+    parser.add_argument('--output-dir', default=str(OUTPUT_DIR), help='输出目录（默认：scripts/output）')
+    parser.add_argument('--seed', type=int, default=0, help='查询抽样的随机种子（默认：0）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("SQL-Zen 索引顾问")
+    print("=" * 60)
+
+    try:
+        db_type = get_db_type()
+        cubes = load_cubes(SCHEMA_DIR, ['*'] if args.all_cubes else args.cubes)
+        table_columns = load_table_columns(SCHEMA_DIR)
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    queries = list(iter_cube_queries(cubes, db_type, table_columns))
+    if len(queries) > args.max_queries:
+        queries = random.Random(args.seed).sample(queries, args.max_queries)
+    print(f"\n📊 Cube: {', '.join(cube['cube'] for cube in cubes)}，工作负载 {len(queries)} 个查询")
+
+    candidates = derive_candidates(cubes, queries, table_columns)
+    ranked = sorted(candidates.items(), key=lambda item: (-len(item[1]), item[0]))[:args.max_candidates]
+    print(f"🔍 推导出 {len(candidates)} 个候选索引，评估前 {len(ranked)} 个：")
+    for (table, key, include), supported in ranked:
+        print(f"  - {index_ddl(db_type, table, list(key), list(include))}  （{len(supported)} 个查询）")
+
+    if args.dry_run:
+        return
+
+    try:
+        conn = connect(db_type)
+    except Exception as e:
+        print(f"❌ 数据库连接失败: {e}")
+        sys.exit(1)
+    cursor = conn.cursor()
+
+    tables = sorted({table for (table, _, _), _ in ranked})
+    known = {}
+    # --drop-existing 删除的索引 [(表, 列, CREATE INDEX 语句)]，评估结束后重建
+    dropped = []
+    applied = set()
+    try:
+        for table in tables:
+            for name, columns in existing_indexes(cursor, db_type, table).items():
+                if args.drop_existing:
+                    try:
+                        ddl = index_definition(cursor, db_type, table, name)
+                        cursor.execute(f"DROP INDEX {name} ON {table}" if db_type == 'mysql' else f"DROP INDEX {name}")
+                        dropped.append((table, columns, ddl))
+                        print(f"🗑️  删除现有索引 {name}（评估结束后重建）")
+                        continue
+                    except Exception as e:
+                        print(f"⚠️  无法删除索引 {name}（可能被外键使用）: {e}")
+                known[(table, columns)] = name
+        ranked = [item for item in ranked if (item[0][0], item[0][1] + item[0][2]) not in known]
+
+        results = evaluate(cursor, db_type, queries, ranked, args.repeat)
+        recommendations = select_recommendations(results, args.min_gain)
+
+        if args.apply:
+            for rec in recommendations:
+                cursor.execute(rec['ddl'])
+                analyze_table(cursor, db_type, rec['table'])
+                applied.add((rec['table'], tuple(rec['key']) + tuple(rec['include'])))
+            print(f"\n✅ 已创建 {len(recommendations)} 个推荐索引")
+    finally:
+        restore_indexes(cursor, db_type, dropped, applied)
+        cursor.close()
+        conn.close()
+
+    ddl_path, report_path = write_outputs(Path(args.output_dir), db_type, recommendations, results, len(queries))
+    print("\n" + "=" * 60)
+    if recommendations:
+        print(f"🎉 推荐 {len(recommendations)} 个索引：")
+        for rec in recommendations:
+            print(f"  {rec['ddl']};  -- 耗时 {-rec['time_gain']:+.1%}")
+    else:
+        print("⚠️  没有索引在当前数据量下证明有收益，可以加大数据量后重新评估")
+        print("   未生成 DDL 文件，init-test-data.py 将使用默认索引")
+    print()
+    if ddl_path:
+        print(f"📄 {ddl_path}")
+    print(f"📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()
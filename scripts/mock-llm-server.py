@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 本地模拟 LLM 服务
+
+模拟 Anthropic Messages API（POST /v1/messages），按脚本回放工具调用轮次，
+用于离线、可复现地压测 SQLZenAgent.processQueryWithTools 自身的开销：
+
+    第 1 轮  execute_bash: ls schema/cubes
+    第 2 轮  execute_bash: cat schema/cubes/<问题对应的 Cube 文件>
+    第 3 轮  execute_sql:  问题对应的 Cube SQL
+    第 4 轮  end_turn:     基于查询结果的文本回答
+
+问题到 SQL 的映射来自 Cube 层「指标 × 过滤器」组合（与 cache-warmer.py 相同的问题文本），
+未匹配的问题按哈希稳定地分配一个 Cube 查询。也可以用 --script 指定自定义剧本。
+
+使用方式：
+    python scripts/mock-llm-server.py --port 8787 --latency-ms 800 --jitter-ms 200
+
+    # 另一个终端，让 SQL-Zen 指向模拟服务
+    export ANTHROPIC_BASE_URL=http://127.0.0.1:8787
+    export ANTHROPIC_API_KEY=mock
+    sql-zen ask "最近30天的总收入是多少？"
+
+    # 查看请求统计
+    curl http://127.0.0.1:8787/stats
+
+自定义剧本（JSON）：
+    {
+      "scenarios": [
+        {
+          "match": "收入",
+          "turns": [
+            {"tool": "execute_bash", "input": {"command": "cat schema/cubes/business-metrics.yaml"}},
+            {"tool": "execute_sql", "input": {"sql": "SELECT SUM(total_amount) FROM orders"}},
+            {"text": "总收入如上。"}
+          ]
+        }
+      ]
+    }
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import SCHEMA_DIR, percentile
+from cube_sql import cube_questions, load_cubes, load_table_columns
+
+CUBE_FILES_BY_NAME = {}
+
+
+# ============================================
+# 1. 剧本
+# ============================================
+
+def normalize_question(question):
+    return re.sub(r'\s+', ' ', question.lower()).strip()
+
+
+class Script:
+    """问题 → 工具调用轮次"""
+
+    def __init__(self, scenarios, cube_queries):
+        self.scenarios = scenarios
+        self.by_question = {normalize_question(q['question']): q for q in cube_queries}
+        self.cube_queries = cube_queries
+
+    @classmethod
+    def load(cls, script_path, dialect):
+        scenarios = []
+        if script_path:
+            with open(script_path, encoding='utf-8') as f:
+                scenarios = json.load(f).get('scenarios', [])
+        cubes = load_cubes(SCHEMA_DIR)
+        for cube in cubes:
+            CUBE_FILES_BY_NAME[cube['cube']] = cube['_file']
+        cube_queries = list(cube_questions(cubes, dialect, load_table_columns(SCHEMA_DIR)))
+        return cls(scenarios, cube_queries)
+
+    def turns_for(self, question):
+        for scenario in self.scenarios:
+            if re.search(scenario.get('match', ''), question):
+                return scenario['turns']
+
+        query = self.by_question.get(normalize_question(question))
+        if query is None and self.cube_queries:
+            digest = hashlib.md5(normalize_question(question).encode('utf-8')).hexdigest()
+            query = self.cube_queries[int(digest, 16) % len(self.cube_queries)]
+        if query is None:
+            return [{'text': '没有可用的 Cube 定义。'}]
+
+        cube_file = CUBE_FILES_BY_NAME.get(query['cube'], 'business-metrics.yaml')
+        return [
+            {'tool': 'execute_bash', 'input': {'command': 'ls schema/cubes'}},
+            {'tool': 'execute_bash', 'input': {'command': f'cat schema/cubes/{cube_file}'}},
+            {'tool': 'execute_sql', 'input': {'sql': query['sql']}},
+            {'text': None},
+        ]
+
+
+# ============================================
+# 2. Messages API 响应
+# ============================================
+
+def _text_of(content):
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if block.get('type') == 'text':
+            parts.append(block.get('text', ''))
+        elif block.get('type') == 'tool_result':
+            inner = block.get('content')
+            parts.append(inner if isinstance(inner, str) else _text_of(inner))
+    return '\n'.join(parts)
+
+
+def estimate_tokens(payload):
+    """粗略估算 token 数（约 4 字符 / token）"""
+    return max(1, len(json.dumps(payload, ensure_ascii=False)) // 4)
+
+
+def build_response(request, script, message_id):
+    messages = request.get('messages') or []
+    question = _text_of(messages[0]['content']) if messages else ''
+    turn = sum(1 for m in messages if m.get('role') == 'assistant')
+    turns = script.turns_for(question) if request.get('tools') else [{'text': None}]
+    step = turns[min(turn, len(turns) - 1)]
+
+    if 'tool' in step and turn < len(turns):
+        content = [{
+            'type': 'tool_use',
+            'id': f"toolu_mock_{message_id}_{turn}",
+            'name': step['tool'],
+            'input': step.get('input', {}),
+        }]
+        stop_reason = 'tool_use'
+    else:
+        text = step.get('text')
+        if not text:
+            last_result = _text_of(messages[-1]['content']) if messages and messages[-1].get('role') == 'user' else ''
+            text = f"根据查询结果回答「{question}」：\n{last_result[:500]}"
+        content = [{'type': 'text', 'text': text}]
+        stop_reason = 'end_turn'
+
+    response = {
+        'id': f"msg_mock_{message_id}",
+        'type': 'message',
+        'role': 'assistant',
+        'model': request.get('model', 'mock-model'),
+        'content': content,
+        'stop_reason': stop_reason,
+        'stop_sequence': None,
+        'usage': {
+            'input_tokens': estimate_tokens([request.get('system'), messages, request.get('tools')]),
+            'output_tokens': estimate_tokens(content),
+        },
+    }
+    return response, turn
+
+
+# ============================================
+# 3. HTTP 服务
+# ============================================
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.errors_injected = 0
+        self.by_turn = {}
+        self.by_stop_reason = {}
+        self.latencies_ms = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def begin(self):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self.requests
+
+    def end(self, latency_ms, turn=None, stop_reason=None, injected_error=False):
+        with self.lock:
+            self.in_flight -= 1
+            self.latencies_ms.append(latency_ms)
+            if injected_error:
+                self.errors_injected += 1
+            if turn is not None:
+                self.by_turn[turn] = self.by_turn.get(turn, 0) + 1
+            if stop_reason:
+                self.by_stop_reason[stop_reason] = self.by_stop_reason.get(stop_reason, 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            uptime = time.time() - self.started
+            return {
+                'requests': self.requests,
+                'errorsInjected': self.errors_injected,
+                'requestsPerSecond': round(self.requests / uptime, 3) if uptime else 0,
+                'byTurn': {str(k): v for k, v in sorted(self.by_turn.items())},
+                'byStopReason': self.by_stop_reason,
+                'avgApiTime': round(sum(self.latencies_ms) / len(self.latencies_ms), 2) if self.latencies_ms else 0,
+                'p95ApiTime': round(percentile(self.latencies_ms, 95), 2),
+                'maxInFlight': self.max_in_flight,
+                'uptime': int(uptime * 1000),
+            }
+
+
+def make_handler(script, stats, options):
+    rng = random.Random(options.seed)
+    rng_lock = threading.Lock()
+
+    class MockMessagesHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            if options.verbose:
+                sys.stderr.write("%s - %s\n" % (self.address_string(), format % args))
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('request-id', f"req_mock_{stats.requests}")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip('/') == '/stats':
+                self._send_json(200, stats.snapshot())
+            else:
+                self._send_json(200, {'status': 'ok'})
+
+        def do_POST(self):
+            if not self.path.split('?')[0].rstrip('/').endswith('/v1/messages'):
+                self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}})
+                return
+
+            message_id = stats.begin()
+            started = time.perf_counter()
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+            except json.JSONDecodeError as e:
+                stats.end((time.perf_counter() - started) * 1000)
+                self._send_json(400, {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': str(e)}})
+                return
+
+            with rng_lock:
+                jitter = rng.uniform(-options.jitter_ms, options.jitter_ms) if options.jitter_ms else 0
+                inject_error = rng.random() < options.error_rate
+
+            if inject_error:
+                time.sleep(max(0, options.latency_ms + jitter) / 1000)
+                stats.end((time.perf_counter() - started) * 1000, injected_error=True)
+                self._send_json(529, {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Overloaded'}})
+                return
+
+            response, turn = build_response(request, script, message_id)
+            delay_ms = options.latency_ms + jitter + options.ms_per_output_token * response['usage']['output_tokens']
+            time.sleep(max(0, delay_ms) / 1000)
+            stats.end((time.perf_counter() - started) * 1000, turn, response['stop_reason'])
+            self._send_json(200, response)
+
+    return MockMessagesHandler
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='模拟 Anthropic Messages API，回放脚本化的工具调用')
+    parser.add_argument('--host', default='127.0.0.1', help='监听地址（默认：127.0.0.1）')
+    parser.add_argument('--port', type=int, default=8787, help='监听端口（默认：8787）')
+    parser.add_argument('--latency-ms', type=float, default=800, help='每个请求的基础延迟（毫秒，默认：800）')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='延迟随机抖动范围 ±（毫秒，默认：0）')
+    parser.add_argument('--ms-per-output-token', type=float, default=0,
+                        help='按输出 token 数追加的延迟（毫秒/token，默认：0）')
+    parser.add_argument('--error-rate', type=float, default=0, help='返回 529 overloaded 的比例（默认：0）')
+    parser.add_argument('--dialect', default='mysql', choices=['mysql', 'postgresql'],
+                        help='execute_sql 使用的 SQL 方言（默认：mysql，与 Agent 的执行连接一致）')
+    parser.add_argument('--script', help='自定义剧本 JSON 文件')
+    parser.add_argument('--seed', type=int, default=0, help='延迟抖动和错误注入的随机种子（默认：0）')
+    parser.add_argument('--verbose', action='store_true', help='打印每个请求的访问日志')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    try:
+        script = Script.load(options.script, options.dialect)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"❌ 剧本加载失败: {e}")
+        sys.exit(1)
+
+    stats = Stats()
+    server = ThreadingHTTPServer((options.host, options.port), make_handler(script, stats, options))
+    server.daemon_threads = True
+
+    print("=" * 60)
+    print("SQL-Zen 模拟 LLM 服务")
+    print("=" * 60)
+    print(f"🚀 监听 http://{options.host}:{options.port}/v1/messages")
+    print(f"⏱️  延迟 {options.latency_ms}ms ±{options.jitter_ms}ms，错误注入 {options.error_rate:.0%}")
+    print(f"📜 Cube 问题 {len(script.cube_queries)} 个，自定义场景 {len(script.scenarios)} 个")
+    print(f"\n  export ANTHROPIC_BASE_URL=http://{options.host}:{options.port}")
+    print("  export ANTHROPIC_API_KEY=mock\n")
+
+    # 压测脚本通常用 SIGTERM 结束服务，同样输出统计
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n📊 请求统计：")
+        print(json.dumps(stats.snapshot(), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
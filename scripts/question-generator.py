@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 自然语言问题负载生成器
+
+根据 Cube 层的指标、维度（含时间粒度）和过滤器，套用中英文问题模板生成大量问题变体，
+每个问题附带期望执行的 Cube SQL，用于 Agent 压测和查询缓存命中率评估。
+
+- 同一个「指标 × 维度 × 过滤器」组合有多种说法（改写），缓存按问题文本命中，改写不会命中
+- --repeat-rate 控制重复提问的比例，重复的问题按 Zipf 分布偏向热门问题
+- 每行带相对时间戳 ts（秒），按固定到达率（或 --poisson 泊松到达）排列，供负载驱动回放
+
+使用方式：
+    python scripts/question-generator.py --count 5000 > questions.jsonl
+    python scripts/question-generator.py --count 20000 --repeat-rate 0.4 --rate 50 --output questions.jsonl
+    python scripts/question-generator.py --lang zh --cubes business-metrics.yaml --count 1000
+
+输出（JSONL，每行一个问题）：
+    {"seq": 0, "ts": 0.0, "question": "最近30天，各城市的总收入是多少？", "lang": "zh",
+     "template": "zh.by.each", "query_id": "business_metrics.revenue|by=city|filter=last_30_days",
+     "repeat": false, "sql": "SELECT ..."}
+
+每行都包含 question 和 sql 字段，可以直接作为 cache-warmer.py --questions 的输入。
+SQL 方言默认取 DB_TYPE（与 cache-warmer.py 和 Agent 连接的数据库一致），也可以用 --dialect 指定。
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from common import SCHEMA_DIR, get_db_type
+from cube_sql import SUPPORTED_DIALECTS, iter_cube_queries, load_cubes, load_table_columns, metric_label
+
+# 时间粒度 -> (中文单位, 英文形容词, 英文单位)
+GRANULARITY_WORDS = {
+    'day': ('天', 'daily', 'day'),
+    'week': ('周', 'weekly', 'week'),
+    'month': ('月', 'monthly', 'month'),
+    'year': ('年', 'yearly', 'year'),
+}
+
+# 英文缩写展开
+EN_WORDS = {'avg': 'average', 'aov': 'AOV', 'clv': 'CLV'}
+
+LAST_N_DAYS_RE = re.compile(r'^last_(\d+)_days$')
+WINDOW_DAYS_RE = re.compile(r'last_(\d+)_days')
+
+# 时间粒度覆盖的天数，粒度不小于过滤器时间窗口的组合（如「本月每年」）不生成问题
+GRANULARITY_DAYS = {'day': 1, 'week': 7, 'month': 28, 'year': 365}
+MONTH_FILTERS = ('this_month', 'last_month')
+
+
+# ============================================
+# 1. 中英文标签
+# ============================================
+
+def humanize(name):
+    """snake_case 名称转为英文短语：avg_order_value -> average order value"""
+    return ' '.join(EN_WORDS.get(word, word) for word in name.split('_'))
+
+
+def dimension_label(dimension):
+    """「城市维度，用户所在城市」->「城市」"""
+    description = (dimension.get('description') or dimension['name']).strip()
+    label = re.split(r'[，,（(]', description, maxsplit=1)[0].strip()
+    if '所在' in label:
+        label = label.split('所在', 1)[1]
+    return label[:-2] if label.endswith('维度') and len(label) > 2 else label
+
+
+def filter_phrase_en(name):
+    """过滤器名称转为英文短语：last_30_days -> ' in the last 30 days'"""
+    match = LAST_N_DAYS_RE.match(name)
+    if match:
+        return f" in the last {match.group(1)} days"
+    if name.startswith(('this_', 'last_')):
+        return f" {humanize(name)}"
+    return f" ({humanize(name)})"
+
+
+def labels_for(cube, query):
+    """取出一个查询组合的中英文标签"""
+    metric = next(m for m in cube['metrics'] if m['name'] == query['metric'])
+    labels = {
+        'metric_zh': metric_label(metric),
+        'metric_en': humanize(metric['name']),
+        'filter_zh': '',
+        'filter_en': '',
+        'dim_zh': None,
+        'dim_en': None,
+        'unit_zh': None,
+        'adj_en': None,
+        'unit_en': None,
+    }
+    if query['filter']:
+        filter_ = next(f for f in cube['filters'] if f['name'] == query['filter'])
+        labels['filter_zh'] = filter_.get('description') or query['filter']
+        labels['filter_en'] = filter_phrase_en(query['filter'])
+    if query['dimension']:
+        dimension = next(d for d in cube['dimensions'] if d['name'] == query['dimension'])
+        labels['dim_zh'] = dimension_label(dimension)
+        labels['dim_en'] = humanize(dimension['name'])
+    if query['granularity']:
+        labels['unit_zh'], labels['adj_en'], labels['unit_en'] = GRANULARITY_WORDS.get(
+            query['granularity'], (query['granularity'], query['granularity'], query['granularity']))
+    return labels
+
+
+# ============================================
+# 2. 问题模板
+# ============================================
+
+# 模板名 -> 格式串；{f} 为过滤器短语（可能为空），{f_de}/{f_pre} 为带「的」/「，」的中文过滤器短语
+TEMPLATES = {
+    'zh': {
+        'total': {
+            'zh.total.what': '{f_de}{metric}是多少？',
+            'zh.total.check': '帮我查一下{f_de}{metric}',
+            'zh.total.stat': '统计{f_de}{metric}',
+            'zh.total.how_much': '{f_pre}{metric}有多少？',
+        },
+        'by': {
+            'zh.by.each': '{f_pre}各{dim}的{metric}是多少？',
+            'zh.by.group': '按{dim}统计{f_de}{metric}',
+            'zh.by.top': '{f_pre}哪个{dim}的{metric}最高？',
+            'zh.by.dist': '{f_pre}{metric}按{dim}的分布如何？',
+        },
+        'time': {
+            'zh.time.every': '{f_pre}每{unit}的{metric}是多少？',
+            'zh.time.trend': '{f_pre}{metric}按{unit}的变化趋势',
+            'zh.time.list': '列出{f_de}每{unit}{metric}',
+        },
+    },
+    'en': {
+        'total': {
+            'en.total.what': 'What is the {metric}{f}?',
+            'en.total.show': 'Show me the {metric}{f}',
+            'en.total.tell': 'Tell me the {metric}{f}',
+        },
+        'by': {
+            'en.by.what': 'What is the {metric} by {dim}{f}?',
+            'en.by.breakdown': 'Break down {metric} by {dim}{f}',
+            'en.by.top': 'Which {dim} has the highest {metric}{f}?',
+        },
+        'time': {
+            'en.time.adj': 'Show {adj} {metric}{f}',
+            'en.time.per': 'What is the {metric} per {unit}{f}?',
+            'en.time.trend': 'How has {metric} changed {adj}{f}?',
+        },
+    },
+}
+
+
+def render_variants(query, labels, langs):
+    """生成一个查询组合的全部问题变体：[(语言, 模板名, 问题)]"""
+    kind = 'time' if query['granularity'] else ('by' if query['dimension'] else 'total')
+    variants = []
+    for lang in langs:
+        if lang == 'zh':
+            f = labels['filter_zh']
+            values = {
+                'f': f,
+                'f_de': f"{f}的" if f else '',
+                'f_pre': f"{f}，" if f else '',
+                'metric': labels['metric_zh'],
+                'dim': labels['dim_zh'],
+                'unit': labels['unit_zh'],
+            }
+        else:
+            values = {
+                'f': labels['filter_en'],
+                'metric': labels['metric_en'],
+                'dim': labels['dim_en'],
+                'adj': labels['adj_en'],
+                'unit': labels['unit_en'],
+            }
+        for name, template in TEMPLATES[lang][kind].items():
+            variants.append((lang, name, template.format(**values)))
+    return variants
+
+
+def window_days(filter_name):
+    """过滤器的时间窗口天数，非时间过滤器返回 None"""
+    if not filter_name:
+        return None
+    if filter_name in MONTH_FILTERS:
+        return 31
+    match = WINDOW_DAYS_RE.search(filter_name)
+    return int(match.group(1)) if match else None
+
+
+def build_catalog(cubes, dialect, table_columns, langs, as_of=None):
+    """展开全部问题变体，返回 [{question, lang, template, query_id, ..., sql}]"""
+    cubes_by_name = {cube['cube']: cube for cube in cubes}
+    catalog = []
+    for query in iter_cube_queries(cubes, dialect, table_columns, all_granularities=True, as_of=as_of):
+        window = window_days(query['filter'])
+        if window and query['granularity'] and GRANULARITY_DAYS.get(query['granularity'], 0) >= window:
+            continue
+        labels = labels_for(cubes_by_name[query['cube']], query)
+        for lang, template, question in render_variants(query, labels, langs):
+            catalog.append({
+                'question': question,
+                'lang': lang,
+                'template': template,
+                'query_id': query['id'],
+                'cube': query['cube'],
+                'metric': query['metric'],
+                'dimension': query['dimension'],
+                'granularity': query['granularity'],
+                'filter': query['filter'],
+                'sql': query['sql'],
+            })
+    return catalog
+
+
+# ============================================
+# 3. 负载流
+# ============================================
+
+def iter_workload(catalog, count, repeat_rate, zipf_s, rate, poisson, seed):
+    """
+    按到达顺序产出问题
+
+    以 repeat_rate 的概率重复一个已经出现过的问题，按出现顺序的 Zipf 分布抽取
+    （越早出现的问题越热门）；否则从目录中抽取一个尚未出现的新问题，目录用完后只重复。
+    """
+    rng = random.Random(seed)
+    pending = list(range(len(catalog)))
+    rng.shuffle(pending)
+    history = []
+    weights = []
+    ts = 0.0
+    for seq in range(count):
+        repeat = bool(history) and (not pending or rng.random() < repeat_rate)
+        if repeat:
+            index = rng.choices(history, weights=weights)[0]
+        else:
+            index = pending.pop()
+            history.append(index)
+            weights.append(1 / len(history) ** zipf_s)
+        yield dict({'seq': seq, 'ts': round(ts, 6)}, **catalog[index], repeat=repeat)
+        ts += rng.expovariate(rate) if poisson else 1 / rate
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='根据 Cube 元数据生成自然语言问题负载（JSONL）')
+    parser.add_argument('--count', type=int, default=1000, help='生成的问题数（默认：1000）')
+    parser.add_argument('--lang', choices=['zh', 'en', 'both'], default='both', help='问题语言（默认：both）')
+    parser.add_argument('--repeat-rate', type=float, default=0.3, help='重复提问的比例（默认：0.3）')
+    parser.add_argument('--zipf', type=float, default=1.0, help='重复问题热度分布的 Zipf 指数（默认：1.0）')
+    parser.add_argument('--rate', type=float, default=10, help='到达率（问题/秒，默认：10）')
+    parser.add_argument('--poisson', action='store_true', help='按泊松过程生成到达时间（默认：固定间隔）')
+    parser.add_argument('--cubes', nargs='*', help='Cube 文件名（默认：init-test-data.py 生成的三个 Cube，* 表示全部）')
+    parser.add_argument('--dialect', choices=SUPPORTED_DIALECTS,
+                        help='SQL 方言（默认：环境变量 DB_TYPE，未设置时为 postgresql）')
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help='SQL 中的 CURRENT_DATE 固定为该日期（与 init-test-data.py --as-of 一致）')
+    parser.add_argument('--seed', type=int, default=42, help='随机种子（默认：42）')
+    parser.add_argument('--output', help='输出文件（默认：标准输出）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not 0 <= args.repeat_rate <= 1:
+        print("❌ --repeat-rate 需要在 0 到 1 之间", file=sys.stderr)
+        sys.exit(1)
+    langs = ['zh', 'en'] if args.lang == 'both' else [args.lang]
+    if not args.dialect:
+        try:
+            args.dialect = get_db_type()
+        except ValueError as e:
+            print(f"❌ {e}，请用 --dialect 指定 SQL 方言", file=sys.stderr)
+            sys.exit(1)
+
+    cubes = load_cubes(SCHEMA_DIR, args.cubes)
+    catalog = build_catalog(cubes, args.dialect, load_table_columns(SCHEMA_DIR), langs, args.as_of)
+    if not catalog:
+        print("❌ 没有可用的 Cube 查询，请先运行 init-test-data.py 生成 Cube 文件", file=sys.stderr)
+        sys.exit(1)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    repeats = 0
+    distinct = set()
+    try:
+        for item in iter_workload(catalog, args.count, args.repeat_rate, args.zipf, args.rate, args.poisson, args.seed):
+            repeats += item['repeat']
+            distinct.add(item['question'])
+            out.write(json.dumps(item, ensure_ascii=False) + '\n')
+    finally:
+        if args.output:
+            out.close()
+
+    # 统计信息写到 stderr，不影响标准输出的 JSONL
+    print(f"✅ 生成 {args.count} 个问题（目录 {len(catalog)} 个变体，不同问题 {len(distinct)} 个，"
+          f"重复 {repeats} 次）", file=sys.stderr)
+    if args.output:
+        print(f"📄 {Path(args.output)}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
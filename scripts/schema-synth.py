@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 通用 Schema 数据合成器
+
+init-test-data.py 的生成逻辑只针对 users/products/orders/order_items 四张表。
+本脚本读取任意 schema/tables/*.yaml 和 schema/joins/*.yaml，为任意表集合生成
+外键一致的合成数据：
+
+1. 解析列类型、primary_key、unique、foreign_key、enum（含描述中的枚举提示）
+2. 结合 JOIN 定义中的关系确定外键：one_to_one 按行号一一对应父表；one_to_many 以及
+   通过关联表实现的 many_to_many（关联表上的两个外键）都从父表中随机取值
+3. 拓扑排序得到加载顺序（父表先于子表）
+4. 按块并行生成（每块使用独立的确定性随机种子，结果与进程数无关），流式写入数据库（每块一个事务）或 CSV
+5. 外键按父表被引用列的实际取值生成（整数 id 或按行号生成的唯一编码）；父表行数为 0 时拒绝执行
+6. 同一行中的时间列按列定义顺序递增（如 created_at ≤ paid_at ≤ shipped_at ≤ completed_at）
+
+生成的数据只保证类型、唯一性、外键和同行时间先后，不模拟业务规则：状态与时间列无关
+（cancelled 订单也可能有 paid_at），汇总列（如 orders.total_amount）与明细表无关。
+需要业务一致的电商数据请使用 init-test-data.py。
+
+使用方式：
+    python scripts/schema-synth.py --dry-run                          # 查看加载计划
+    python scripts/schema-synth.py --config synth.yaml --create-tables
+    python scripts/schema-synth.py --rows users=1000000 orders=5000000 --workers 8
+    python scripts/schema-synth.py --sink csv --out-dir /tmp/synth     # 只生成 CSV 文件
+
+配置文件（YAML 或 JSON）：
+    schema_dir: schema          # 可选，默认为仓库的 schema/
+    default_rows: 1000          # 未列出的表的行数（包括被引用但不在本次生成范围内的父表）
+    chunk_size: 10000
+    seed: 42
+    as_of: "2026-01-01"         # 时间列的基准日期
+    history_days: 365           # 时间列的分布范围
+    tables:
+      users: 100000
+      orders: 1000000
+
+环境变量与 init-test-data.py 相同（DB_TYPE, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD）。
+"""
+
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from common import SCHEMA_DIR, connect, get_db_type
+
+DEFAULT_ROWS = 1000
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_HISTORY_DAYS = 365
+NULL_RATE = 0.1
+
+CITIES = ['北京', '上海', '广州', '深圳', '杭州', '成都', '武汉', '西安', '南京', '重庆']
+
+TYPE_RE = re.compile(r'^\s*(\w+)\s*(?:\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\))?', re.IGNORECASE)
+RANGE_HINT_RE = re.compile(r'(-?\d+(?:\.\d+)?)\s*[-~～到]\s*(-?\d+(?:\.\d+)?)')
+ENUM_HINT_RE = re.compile(r'\b([a-z][a-z0-9_]*(?:\s*[/|,，、]\s*[a-z][a-z0-9_]*)+)\b')
+ENUM_HINT_WORDS = ('状态', '类型', '方式', '取值', '可选', '枚举', 'status', 'type')
+JOIN_CONDITION_RE = re.compile(r'(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)')
+
+
+# ============================================
+# 1. 解析表和关系定义
+# ============================================
+
+def _require_yaml():
+    try:
+        import yaml
+    except ImportError:
+        print("❌ 请先安装 PyYAML: pip install pyyaml")
+        sys.exit(1)
+    return yaml
+
+
+def parse_type(type_str):
+    """'DECIMAL(10, 2)' -> ('DECIMAL', 10, 2)"""
+    match = TYPE_RE.match(str(type_str or 'TEXT'))
+    if not match:
+        return 'TEXT', None, None
+    base = match.group(1).upper()
+    length = int(match.group(2)) if match.group(2) else None
+    scale = int(match.group(3)) if match.group(3) else None
+    return base, length, scale
+
+
+def _enum_values(column):
+    """enum 字段（字符串列表或 {value, description} 列表），或描述中的枚举提示"""
+    enum = column.get('enum')
+    if enum:
+        return [item['value'] if isinstance(item, dict) else item for item in enum]
+    description = str(column.get('description') or '')
+    name = column['name'].lower()
+    if any(word in description or word in name for word in ENUM_HINT_WORDS):
+        match = ENUM_HINT_RE.search(description)
+        if match:
+            return [value.strip() for value in re.split(r'[/|,，、]', match.group(1)) if value.strip()]
+    return None
+
+
+def _foreign_key(column):
+    fk = column.get('foreign_key')
+    if isinstance(fk, str) and '.' in fk:
+        table, col = fk.split('.', 1)
+        return table.strip(), col.strip()
+    if isinstance(fk, dict) and fk.get('table'):
+        return fk['table'], fk.get('column', 'id')
+    return None
+
+
+def load_tables(schema_dir):
+    """读取 tables/*.yaml，返回 {表名: 表定义}"""
+    yaml = _require_yaml()
+    tables = {}
+    for path in sorted((schema_dir / 'tables').glob('*.yaml')):
+        doc = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+        table = doc.get('table')
+        if not isinstance(table, dict) or not table.get('name') or not doc.get('columns'):
+            continue
+        columns = []
+        for col in doc['columns']:
+            if not isinstance(col, dict) or 'name' not in col:
+                continue
+            base, length, scale = parse_type(col.get('type'))
+            columns.append({
+                'name': col['name'],
+                'type': str(col.get('type') or 'TEXT'),
+                'base': base,
+                'length': length,
+                'scale': scale,
+                'primary_key': bool(col.get('primary_key')),
+                'unique': bool(col.get('unique')),
+                'nullable': bool(col.get('nullable')),
+                'foreign_key': _foreign_key(col),
+                'enum': _enum_values(col),
+                'description': str(col.get('description') or ''),
+            })
+        tables[table['name']] = {'name': table['name'], 'columns': columns, 'file': path.name}
+    return tables
+
+
+def load_relationships(schema_dir):
+    """
+    读取 joins/*.yaml 中的关系，支持两种格式：
+      relationships: [{from, to, type, join: "a.id = b.a_id"}]
+      relationship: {from_table, to_table, type, join_sql: "JOIN b ON a.id = b.a_id"}
+    返回 [(子表, 子列, 父表, 父列, 关系类型)]
+    """
+    yaml = _require_yaml()
+    edges = []
+    for path in sorted((schema_dir / 'joins').glob('*.yaml')):
+        doc = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+        items = list(doc.get('relationships') or [])
+        if isinstance(doc.get('relationship'), dict):
+            items.append(doc['relationship'])
+        for item in items:
+            rel_type = item.get('type', 'one_to_many')
+            condition = item.get('join') or item.get('join_sql') or ''
+            for left_table, left_col, right_table, right_col in JOIN_CONDITION_RE.findall(condition):
+                # 引用 id 的一侧是父表
+                if left_col == 'id' and right_col != 'id':
+                    edges.append((right_table, right_col, left_table, left_col, rel_type))
+                elif right_col == 'id' and left_col != 'id':
+                    edges.append((left_table, left_col, right_table, right_col, rel_type))
+    return edges
+
+
+def apply_relationships(tables, edges):
+    """把 JOIN 定义中的关系合并到列定义上（列上已声明的 foreign_key 优先）"""
+    for child, child_col, parent, parent_col, rel_type in edges:
+        if child not in tables:
+            continue
+        for column in tables[child]['columns']:
+            if column['name'] != child_col:
+                continue
+            if column['foreign_key'] is None:
+                column['foreign_key'] = (parent, parent_col)
+            if column['foreign_key'] == (parent, parent_col):
+                column['relationship'] = rel_type
+
+
+def load_order(tables):
+    """按外键依赖拓扑排序（Kahn 算法），自引用不计入依赖"""
+    deps = {name: set() for name in tables}
+    for name, table in tables.items():
+        for column in table['columns']:
+            fk = column['foreign_key']
+            if fk and fk[0] in tables and fk[0] != name:
+                deps[name].add(fk[0])
+
+    order = []
+    ready = sorted(name for name, parents in deps.items() if not parents)
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for other in sorted(deps):
+            if name in deps[other]:
+                deps[other].discard(name)
+                if not deps[other] and other not in order and other not in ready:
+                    ready.append(other)
+    cyclic = [name for name in tables if name not in order]
+    if cyclic:
+        raise ValueError(f"外键存在循环依赖: {', '.join(cyclic)}")
+    return order
+
+
+# ============================================
+# 2. 列值生成规则
+# ============================================
+
+def column_rule(table, column, row_counts, history_days):
+    """为列选择生成规则（在主进程中计算，传给工作进程）"""
+    name = column['name'].lower()
+    base = column['base']
+    # 非整数主键（如编码）同样按行号生成唯一值，外键才能引用到
+    unique = column['unique'] or column['primary_key']
+    rule = {'name': column['name'], 'nullable': column['nullable'] and not unique}
+
+    if column['primary_key'] and base in ('SERIAL', 'BIGSERIAL', 'INT', 'INTEGER', 'BIGINT', 'SMALLINT'):
+        return dict(rule, kind='pk', nullable=False)
+
+    fk = column['foreign_key']
+    if fk:
+        parent_rows = row_counts[fk[0]]
+        return dict(rule, kind='fk', parent_rows=parent_rows, parent_key=None,
+                    one_to_one=column.get('relationship') == 'one_to_one',
+                    self_ref=fk[0] == table['name'])
+
+    if column['enum']:
+        return dict(rule, kind='enum', values=column['enum'])
+
+    if base in ('INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'TINYINT', 'DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'):
+        low, high = (1, 100) if any(w in name for w in ('quantity', 'count', 'stock')) else (0, 1000)
+        hint = RANGE_HINT_RE.search(column['description'])
+        if hint:
+            low, high = float(hint.group(1)), float(hint.group(2))
+        if base in ('DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'):
+            scale = column['scale'] if column['scale'] is not None else 2
+            if column['length']:
+                high = min(high, 10 ** (column['length'] - scale) - 1)
+            return dict(rule, kind='decimal', low=low, high=max(low, high), scale=scale)
+        if unique:
+            return dict(rule, kind='row_id')
+        return dict(rule, kind='int', low=int(low), high=int(max(low, high)))
+
+    if base in ('BOOLEAN', 'BOOL', 'TINYINT(1)'):
+        return dict(rule, kind='bool')
+    if base in ('TIMESTAMP', 'DATETIME', 'TIMESTAMPTZ'):
+        return dict(rule, kind='timestamp', days=history_days)
+    if base == 'DATE':
+        return dict(rule, kind='date', days=history_days)
+    if base in ('JSON', 'JSONB'):
+        return dict(rule, kind='json')
+
+    max_length = column['length'] or 255
+    if 'email' in name:
+        return dict(rule, kind='email', max_length=max_length, table=table['name'])
+    if unique:
+        return dict(rule, kind='unique_text', max_length=max_length, prefix=column['name'])
+    if 'phone' in name or 'mobile' in name:
+        return dict(rule, kind='phone')
+    if name == 'city':
+        return dict(rule, kind='enum', values=CITIES)
+    if name in ('name', 'title'):
+        return dict(rule, kind='unique_text', max_length=max_length, prefix=f"{table['name']}_{name}")
+    return dict(rule, kind='text', max_length=max_length, long=base == 'TEXT')
+
+
+def _value(rule, rng, row_id, as_of):
+    if rule['nullable'] and rng.random() < NULL_RATE:
+        return None
+    kind = rule['kind']
+    if kind in ('pk', 'row_id'):
+        return row_id
+    if kind == 'fk':
+        if rule['self_ref']:
+            parent_id = rng.randint(1, row_id - 1) if row_id > 1 else None
+        elif rule['one_to_one']:
+            parent_id = (row_id - 1) % rule['parent_rows'] + 1
+        else:
+            parent_id = rng.randint(1, rule['parent_rows'])
+        if parent_id is None or rule['parent_key'] is None:
+            return parent_id
+        # 被引用列不是从 1 开始的整数 id 时（如唯一编码），按父表第 parent_id 行的取值生成
+        return _value(rule['parent_key'], rng, parent_id, as_of)
+    if kind == 'enum':
+        return rng.choice(rule['values'])
+    if kind == 'int':
+        return rng.randint(rule['low'], rule['high'])
+    if kind == 'decimal':
+        return round(rng.uniform(rule['low'], rule['high']), rule['scale'])
+    if kind == 'bool':
+        return rng.random() < 0.5
+    if kind == 'timestamp':
+        return as_of - timedelta(days=rng.randint(0, rule['days']), seconds=rng.randint(0, 86399))
+    if kind == 'date':
+        return (as_of - timedelta(days=rng.randint(0, rule['days']))).date()
+    if kind == 'json':
+        return json.dumps({'id': row_id, 'tag': f"t{rng.randint(1, 20)}"})
+    if kind == 'email':
+        return f"{rule['table']}{row_id}@example.com"[-rule['max_length']:]
+    if kind == 'unique_text':
+        return f"{rule['prefix']}_{row_id}"[-rule['max_length']:]
+    if kind == 'phone':
+        return f"138{rng.randint(10000000, 99999999)}"
+    text = f"{rule['name']}_{rng.randint(1, 10 ** 6)}"
+    if rule.get('long'):
+        text = ' '.join([text] * rng.randint(1, 5))
+    return text[:rule['max_length']]
+
+
+def generate_chunk(task):
+    """
+    生成一个数据块（在工作进程中执行）
+
+    随机数种子由 (seed, 表名, 块序号) 决定，结果与进程数和执行顺序无关。
+    """
+    table, rules, chunk_index, start_id, count, seed, as_of = task
+    rng = random.Random(f"{seed}:{table}:{chunk_index}")
+    ordered = [[i for i, rule in enumerate(rules) if rule['kind'] == kind] for kind in ('timestamp', 'date')]
+    ordered = [indexes for indexes in ordered if len(indexes) > 1]
+    rows = []
+    for row_id in range(start_id, start_id + count):
+        row = [_value(rule, rng, row_id, as_of) for rule in rules]
+        for indexes in ordered:
+            _order_values(row, indexes)
+        rows.append(tuple(row))
+    return table, chunk_index, rows
+
+
+def _order_values(row, indexes):
+    """把同一行中非 NULL 的时间值按列顺序从早到晚重新排列"""
+    present = [i for i in indexes if row[i] is not None]
+    for i, value in zip(present, sorted(row[i] for i in present)):
+        row[i] = value
+
+
+# ============================================
+# 3. 数据写入
+# ============================================
+
+MYSQL_TYPE_MAP = {'SERIAL': 'INT AUTO_INCREMENT', 'BIGSERIAL': 'BIGINT AUTO_INCREMENT', 'STRING': 'TEXT'}
+POSTGRES_TYPE_MAP = {'STRING': 'TEXT', 'DATETIME': 'TIMESTAMP', 'DOUBLE': 'DOUBLE PRECISION'}
+
+
+def create_table_sql(table, db_type):
+    """根据 YAML 定义生成建表语句（不创建外键约束，以加快批量导入）"""
+    type_map = MYSQL_TYPE_MAP if db_type == 'mysql' else POSTGRES_TYPE_MAP
+    parts = []
+    for column in table['columns']:
+        col_type = type_map.get(column['base'], column['type'])
+        definition = f"{column['name']} {col_type}"
+        if column['primary_key']:
+            definition += ' PRIMARY KEY'
+        elif column['unique']:
+            definition += ' UNIQUE'
+        parts.append(definition)
+    suffix = ' ENGINE=InnoDB DEFAULT CHARSET=utf8mb4' if db_type == 'mysql' else ''
+    return f"CREATE TABLE {table['name']} (\n    " + ',\n    '.join(parts) + f"\n){suffix}"
+
+
+class CsvSink:
+    """每张表写一个 CSV 文件（NULL 写为空字段）"""
+
+    def __init__(self, out_dir):
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.files = {}
+
+    def prepare(self, tables, order):
+        pass
+
+    def write(self, table, columns, rows):
+        if table not in self.files:
+            f = open(self.out_dir / f'{table}.csv', 'w', newline='', encoding='utf-8')
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            self.files[table] = (f, writer)
+        self.files[table][1].writerows(['' if v is None else v for v in row] for row in rows)
+
+    def finish(self, tables):
+        for f, _ in self.files.values():
+            f.close()
+
+
+class DatabaseSink:
+    """PostgreSQL 使用 COPY，MySQL 使用批量 INSERT，每块一个事务"""
+
+    def __init__(self, db_type, create_tables):
+        self.db_type = db_type
+        self.create_tables = create_tables
+        self.conn = connect(db_type)
+        # common.connect() 开启了 autocommit，这里改为显式提交，中断时不会留下半个块
+        self.conn.autocommit = False
+        self.cursor = self.conn.cursor()
+
+    def prepare(self, tables, order):
+        if not self.create_tables:
+            return
+        for name in reversed(order):
+            self.cursor.execute(f"DROP TABLE IF EXISTS {name}" + ('' if self.db_type == 'mysql' else ' CASCADE'))
+        for name in order:
+            self.cursor.execute(create_table_sql(tables[name], self.db_type))
+        self.conn.commit()
+
+    def write(self, table, columns, rows):
+        try:
+            if self.db_type == 'mysql':
+                placeholders = ', '.join(['%s'] * len(columns))
+                self.cursor.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+            else:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow(['' if v is None else v for v in row])
+                buffer.seek(0)
+                self.cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def finish(self, tables):
+        if self.db_type != 'mysql':
+            # 显式写入了 id，需要把序列推进到最大值之后
+            for name, table in tables.items():
+                for column in table['columns']:
+                    if column['primary_key'] and column['base'] in ('SERIAL', 'BIGSERIAL'):
+                        self.cursor.execute(
+                            f"SELECT setval(pg_get_serial_sequence('{name}', '{column['name']}'), "
+                            f"COALESCE(MAX({column['name']}), 1)) FROM {name}")
+            self.conn.commit()
+        self.cursor.close()
+        self.conn.close()
+
+
+# ============================================
+# 4. 加载计划与执行
+# ============================================
+
+def build_plan(tables, order, row_counts, chunk_size, seed, as_of, history_days):
+    """
+    为每张表生成列规则和块任务
+
+    row_counts 为 defaultdict，未列出的表（包括范围外的父表）取 default_rows。
+    """
+    plan = []
+    empty_parents = []
+    for name in order:
+        table = tables[name]
+        rules = [column_rule(table, column, row_counts, history_days) for column in table['columns']]
+        rows = row_counts[name]
+        for rule, column in zip(rules, table['columns']):
+            if rule['kind'] != 'fk' or rule['self_ref']:
+                continue
+            parent, parent_col = column['foreign_key']
+            if rows and not rule['parent_rows']:
+                empty_parents.append(f"{name}.{column['name']} → {parent}")
+            rule['parent_key'] = parent_key_rule(tables.get(parent), parent_col, row_counts, history_days)
+        tasks = []
+        for chunk_index, start in enumerate(range(0, rows, chunk_size)):
+            count = min(chunk_size, rows - start)
+            tasks.append((name, rules, chunk_index, start + 1, count, seed, as_of))
+        plan.append({'table': name, 'rows': rows, 'rules': rules, 'tasks': tasks})
+    if empty_parents:
+        raise ValueError(f"被引用的表行数为 0，无法生成外键: {', '.join(empty_parents)}")
+    return plan
+
+
+def parent_key_rule(parent, parent_col, row_counts, history_days):
+    """
+    被引用列的生成规则（不含 NULL）
+
+    被引用列是主键或唯一整数列时返回 None，外键直接取 1..行数；父表不在本次生成范围内时同样按 1..行数取值。
+    """
+    if parent is None:
+        return None
+    for column in parent['columns']:
+        if column['name'] == parent_col:
+            rule = column_rule(parent, column, row_counts, history_days)
+            return None if rule['kind'] in ('pk', 'row_id') else dict(rule, nullable=False)
+    return None
+
+
+def run_plan(plan, sink, tables, order, workers):
+    """并行生成、按块顺序流式写入"""
+    sink.prepare(tables, order)
+    totals = {}
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        for step in plan:
+            started = time.perf_counter()
+            columns = [rule['name'] for rule in step['rules']]
+            chunks = pool.imap(generate_chunk, step['tasks']) if pool else map(generate_chunk, step['tasks'])
+            for _, chunk_index, rows in chunks:
+                sink.write(step['table'], columns, rows)
+            elapsed = time.perf_counter() - started
+            totals[step['table']] = (step['rows'], elapsed)
+            rate = step['rows'] / elapsed if elapsed else 0
+            print(f"✅ {step['table']}: {step['rows']} 行，{len(step['tasks'])} 块，{elapsed:.2f}s（{rate:,.0f} 行/秒）")
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    sink.finish(tables)
+    return totals
+
+
+def load_config(path):
+    if not path:
+        return {}
+    text = Path(path).read_text(encoding='utf-8')
+    if str(path).endswith('.json'):
+        return json.loads(text)
+    return _require_yaml().safe_load(text) or {}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='根据 schema/ 下的表和关系定义生成外键一致的合成数据')
+    parser.add_argument('--config', help='行数等配置（YAML 或 JSON）')
+    parser.add_argument('--schema-dir', help='Schema 目录（默认：仓库的 schema/）')
+    parser.add_argument('--tables', nargs='*', help='只生成这些表（默认：全部）')
+    parser.add_argument('--rows', nargs='*', default=[], help='行数覆盖，如 users=100000 orders=1000000')
+    parser.add_argument('--chunk-size', type=int, help=f'每块行数（默认：{DEFAULT_CHUNK_SIZE}）')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='生成进程数（默认：CPU 核数）')
+    parser.add_argument('--seed', type=int, help='随机种子（默认：42）')
+    parser.add_argument('--sink', choices=['db', 'csv'], default='db', help='写入目标（默认：db）')
+    parser.add_argument('--out-dir', default='synth-output', help='CSV 输出目录（--sink csv 时使用）')
+    parser.add_argument('--create-tables', action='store_true', help='按 YAML 定义删除并重建表（--sink db 时使用）')
+    parser.add_argument('--dry-run', action='store_true', help='只打印加载计划')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = load_config(args.config)
+
+    schema_dir = Path(args.schema_dir or config.get('schema_dir') or SCHEMA_DIR)
+    chunk_size = args.chunk_size or config.get('chunk_size', DEFAULT_CHUNK_SIZE)
+    seed = args.seed if args.seed is not None else config.get('seed', 42)
+    history_days = config.get('history_days', DEFAULT_HISTORY_DAYS)
+    as_of = config.get('as_of')
+    as_of = datetime.combine(date.fromisoformat(str(as_of)), datetime.min.time()) if as_of \
+        else datetime.combine(date.today(), datetime.min.time())
+
+    print("=" * 60)
+    print("SQL-Zen 通用 Schema 数据合成")
+    print("=" * 60)
+
+    tables = load_tables(schema_dir)
+    apply_relationships(tables, load_relationships(schema_dir))
+    if args.tables:
+        missing = [name for name in args.tables if name not in tables]
+        if missing:
+            print(f"❌ 未找到表定义: {', '.join(missing)}")
+            sys.exit(1)
+        tables = {name: tables[name] for name in args.tables}
+
+    row_counts = defaultdict(lambda: config.get('default_rows', DEFAULT_ROWS))
+    row_counts.update(config.get('tables') or {})
+    for item in args.rows:
+        name, _, value = item.partition('=')
+        row_counts[name] = int(value)
+
+    try:
+        order = load_order(tables)
+        plan = build_plan(tables, order, row_counts, chunk_size, seed, as_of, history_days)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"\n📋 加载顺序（块大小 {chunk_size}，{args.workers} 个进程，种子 {seed}）：")
+    for step in plan:
+        fks = [f"{r['name']}→{c['foreign_key'][0]}" for r, c in zip(step['rules'], tables[step['table']]['columns'])
+               if r['kind'] == 'fk']
+        print(f"  {step['table']}: {step['rows']} 行" + (f"（{', '.join(fks)}）" if fks else ''))
+        for rule, column in zip(step['rules'], tables[step['table']]['columns']):
+            if rule['kind'] == 'fk' and column['foreign_key'][0] not in tables:
+                print(f"    ⚠️  {column['name']} 引用的表 {column['foreign_key'][0]} 不在本次生成范围内，"
+                      f"按 1..{rule['parent_rows']} 取值")
+
+    if args.dry_run:
+        return
+
+    if args.sink == 'csv':
+        sink = CsvSink(args.out_dir)
+    else:
+        try:
+            sink = DatabaseSink(get_db_type(), args.create_tables)
+        except Exception as e:
+            print(f"❌ 数据库连接失败: {e}")
+            sys.exit(1)
+
+    print()
+    started = time.perf_counter()
+    totals = run_plan(plan, sink, tables, order, args.workers)
+    elapsed = time.perf_counter() - started
+    total_rows = sum(rows for rows, _ in totals.values())
+    print(f"\n🎉 完成：{len(totals)} 张表，{total_rows} 行，耗时 {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
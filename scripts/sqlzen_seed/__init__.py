@@ -0,0 +1,24 @@
+"""
+SQL-Zen 测试数据生成包
+
+init-test-data.py 的实现，拆分为可单独导入的模块：
+
+- generators   用户、商品、订单数据生成（只依赖标准库）
+- golden       business_metrics Cube 的标准答案累计
+- checkpoint   分块加载的检查点（断点续传）
+- metrics      阶段性能指标
+- capacity     导入后的容量报告（行数、表/索引大小、缓存命中率）
+- backends     写入后端注册表（postgresql / mysql / sqlite / file / duckdb），驱动在选中时才导入
+- templates    建表 SQL 和 Schema/Cube YAML 模板，按需从文件读取
+- cli          命令行入口（python -m sqlzen_seed 或 sqlzen-seed）
+
+在代码中直接驱动生成器：
+    from sqlzen_seed.generators import generate_orders, generate_users, product_catalog
+
+    users = generate_users(1000, now=anchor)
+    orders, items = generate_orders([u[0] for u in users], product_catalog(), 5000, now=anchor)
+
+导入本包不会导入任何数据库驱动，也不会读取模板文件。
+"""
+
+__version__ = '0.1.0'
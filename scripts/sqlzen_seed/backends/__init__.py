@@ -0,0 +1,64 @@
+"""
+写入后端注册表
+
+后端按名称注册为「模块:类名」字符串，只有被选中时才导入对应模块和数据库驱动：
+
+    from sqlzen_seed.backends import get_backend
+
+    backend = get_backend('sqlite', {'database': '/tmp/test.db'})
+    backend.connect()
+
+第三方后端可以通过 register_backend 注册：
+
+    register_backend('clickhouse', 'my_package.clickhouse_backend:ClickHouseBackend')
+"""
+
+import importlib
+
+BACKENDS = {
+    'postgresql': 'sqlzen_seed.backends.postgres:PostgresBackend',
+    'mysql': 'sqlzen_seed.backends.mysql:MySQLBackend',
+    'sqlite': 'sqlzen_seed.backends.sqlite:SQLiteBackend',
+    'file': 'sqlzen_seed.backends.file:FileBackend',
+    'duckdb': 'sqlzen_seed.backends.duckdb:DuckDBBackend',
+}
+
+ALIASES = {
+    'postgres': 'postgresql',
+    'pg': 'postgresql',
+    'csv': 'file',
+}
+
+
+def register_backend(name, target):
+    """注册后端：target 为「模块:类名」"""
+    if ':' not in target:
+        raise ValueError(f"后端需要写成「模块:类名」的形式: {target}")
+    BACKENDS[name] = target
+
+
+def available_backends():
+    return sorted(BACKENDS)
+
+
+def resolve_backend_name(name):
+    """返回规范的后端名称，未注册时抛出 ValueError"""
+    name = ALIASES.get((name or '').lower(), (name or '').lower())
+    if name not in BACKENDS:
+        raise ValueError(f"不支持的数据库类型: {name}（支持: {', '.join(available_backends())}）")
+    return name
+
+
+def get_backend_class(name):
+    module_name, class_name = BACKENDS[resolve_backend_name(name)].split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_backend(name, config=None):
+    """
+    创建后端实例（不建立连接）
+
+    config 为空时由后端从环境变量读取（DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD）。
+    """
+    backend_class = get_backend_class(name)
+    return backend_class(config if config is not None else backend_class.config_from_env())
@@ -0,0 +1,199 @@
+"""
+写入后端基类
+
+子类实现 connect()，按需覆盖事务、批量插入和序列处理。
+所有写入都显式包含 id 列，后端不依赖自增主键生成 id。
+"""
+
+import os
+from pathlib import Path
+
+from ..metrics import StageRecorder
+from .. import templates
+
+# 续传时按此顺序删除检查点之后写入的行（子表在前）
+SEED_TABLES = ('order_items', 'orders', 'users', 'products')
+
+# 容量报告中的表顺序
+REPORT_TABLES = ('users', 'products', 'orders', 'order_items')
+
+
+def split_sql_statements(sql):
+    """按分号拆分 SQL 脚本，去掉注释行（scripts/common.py 也从这里导入）"""
+    statements = []
+    for statement in sql.split(';'):
+        lines = [line for line in statement.strip().splitlines() if not line.strip().startswith('--')]
+        statement = '\n'.join(lines).strip()
+        if statement:
+            statements.append(statement)
+    return statements
+
+
+class Backend:
+    """写入后端基类"""
+
+    # 后端名称（注册表中的键）
+    name = None
+    # 建表模板和索引顾问输出文件使用的方言
+    dialect = None
+    # 参数占位符
+    placeholder = '%s'
+    # 是否支持建索引
+    supports_indexes = True
+    # config['database'] 是否为本地数据库文件（相对路径放在数据目录下）
+    database_file = False
+    # 默认端口和用户
+    default_port = None
+    default_user = None
+
+    def __init__(self, config):
+        self.config = config
+        self.conn = None
+        self.cursor = None
+
+    @classmethod
+    def config_from_env(cls):
+        """按 init-test-data.py 的约定从环境变量读取连接配置"""
+        return {
+            'host': os.getenv('DB_HOST', 'localhost'),
+            'port': int(os.getenv('DB_PORT', str(cls.default_port))),
+            'database': os.getenv('DB_NAME', 'test'),
+            'user': os.getenv('DB_USER', cls.default_user),
+            'password': os.getenv('DB_PASSWORD', ''),
+        }
+
+    @classmethod
+    def tenant_config(cls, config, tenant):
+        """
+        多租户加载时某个租户的连接配置
+
+        默认在数据库名（或数据库文件名）后加「_租户名」，每个租户一个数据库；
+        需要其他隔离方式（如 PostgreSQL 的 schema）的后端覆盖此方法。
+        """
+        root, ext = os.path.splitext(config['database'])
+        return dict(config, database=f"{root}_{tenant}{ext}")
+
+    @classmethod
+    def locate(cls, config, directory):
+        """
+        把相对路径的数据库文件放到 directory（--data-dir 或 --output-dir）下
+
+        只对 database_file 为 True 的后端生效，服务型数据库的配置原样返回。
+        """
+        if not cls.database_file or Path(config['database']).is_absolute():
+            return config
+        return dict(config, database=str(Path(directory) / config['database']))
+
+    def describe(self):
+        return f"{self.config['host']}:{self.config['port']}/{self.config['database']}"
+
+    def connect(self):
+        raise NotImplementedError
+
+    def close(self):
+        if self.cursor is not None:
+            self.cursor.close()
+        if self.conn is not None:
+            self.conn.close()
+
+    # ---------- 建表 ----------
+
+    def create_tables(self):
+        """删除并重建 users/products/orders/order_items"""
+        for statement in split_sql_statements(templates.create_tables_sql(self.dialect)):
+            self.cursor.execute(statement)
+        self.conn.commit()
+
+    # ---------- 事务 ----------
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def end(self):
+        """事务结束后的清理（提交或回滚之后调用）"""
+        pass
+
+    # ---------- 写入 ----------
+
+    def insert_rows(self, table, columns, rows):
+        """批量插入（显式写入 id 列）"""
+        if not rows:
+            return
+        placeholders = ', '.join([self.placeholder] * len(columns))
+        self.cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+    def write_chunk(self, batches, stage=None, label=None):
+        """
+        在一个事务中写入一块数据：batches 为 [(表名, 列名列表, 行列表)]
+
+        stage 为 metrics.StageRecorder，按表记录驱动耗时、行数和发送字节数。
+        label 不为空时（镜像写入）按「label:表名」记录驱动耗时，行数只由主库计入一次。
+        """
+        stage = stage or StageRecorder('chunk')
+        self.begin()
+        try:
+            for table, columns, rows in batches:
+                with stage.driver(f'{label}:{table}' if label else table, None if label else rows):
+                    self.insert_rows(table, columns, rows)
+            with stage.driver():
+                self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            self.end()
+
+    # ---------- 查询与维护 ----------
+
+    def execute(self, statement):
+        self.cursor.execute(statement)
+
+    def user_cities(self):
+        """[(用户 id, 城市)]，按 id 排序"""
+        self.cursor.execute("SELECT id, city FROM users ORDER BY id")
+        return self.cursor.fetchall()
+
+    def discard_after(self, last_ids):
+        """删除 id 大于 last_ids 中对应值的行（数据库已提交、检查点未记录的块），返回删除行数"""
+        removed = 0
+        for table in SEED_TABLES:
+            self.cursor.execute(f"DELETE FROM {table} WHERE id > {self.placeholder}", (last_ids[table],))
+            removed += max(self.cursor.rowcount, 0)
+        self.conn.commit()
+        return removed
+
+    def reset_sequences(self):
+        """显式写入 id 后推进自增序列（需要时由子类实现）"""
+        pass
+
+    # ---------- 容量统计 ----------
+
+    def count_rows(self, table):
+        self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        return self.cursor.fetchone()[0]
+
+    def table_stats(self, table):
+        """
+        单表的存储统计，不支持的项不返回
+
+        tableBytes（表数据）、indexBytes（全部索引）、toastBytes（行外存储），
+        heapHitRatio / indexHitRatio（缓存命中率）
+        """
+        return {}
+
+    def database_stats(self):
+        """整个库的统计：cacheHitRatio（缓存命中率）、cacheBytes（缓存大小）等，不支持的项不返回"""
+        return {}
+
+    def capacity_stats(self, tables=REPORT_TABLES):
+        """实际行数和存储统计：{'tables': {表名: {...}}, 'database': {...}}"""
+        return {
+            'tables': {table: dict(rows=self.count_rows(table), **self.table_stats(table)) for table in tables},
+            'database': self.database_stats(),
+        }
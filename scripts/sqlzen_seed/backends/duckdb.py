@@ -0,0 +1,73 @@
+"""
+DuckDB 后端：嵌入式列存数据库文件，不需要数据库服务
+
+既可以作为主后端（--backend duckdb），也可以作为分析镜像（--duckdb-mirror），
+与主库写入同样的数据，供 cube-benchmark.py 对比行存和列存的聚合查询性能。
+
+每块数据先写成临时 CSV，再用 COPY 批量导入（DuckDB 的逐行 executemany 很慢）。
+"""
+
+import csv
+import os
+import tempfile
+
+from .base import SEED_TABLES, Backend
+
+
+class DuckDBBackend(Backend):
+    name = 'duckdb'
+    dialect = 'duckdb'
+    placeholder = '?'
+    # 列存按块的最小/最大值裁剪，不需要二级索引
+    supports_indexes = False
+    database_file = True
+
+    @classmethod
+    def config_from_env(cls):
+        database = os.getenv('DB_NAME', 'test')
+        if not os.path.splitext(database)[1]:
+            database += '.duckdb'
+        return {'database': database}
+
+    def describe(self):
+        return self.config['database']
+
+    def connect(self):
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError("请先安装 DuckDB: pip install duckdb")
+        os.makedirs(os.path.dirname(os.path.abspath(self.config['database'])), exist_ok=True)
+        self.conn = duckdb.connect(self.config['database'])
+        self.cursor = self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = self.cursor = None
+
+    def begin(self):
+        self.conn.begin()
+
+    def insert_rows(self, table, columns, rows):
+        if not rows:
+            return
+        fd, path = tempfile.mkstemp(prefix=f'sqlzen-{table}-', suffix='.csv')
+        try:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows)
+            self.conn.execute(f"COPY {table} ({', '.join(columns)}) FROM '{path}' (HEADER false)")
+        finally:
+            os.remove(path)
+
+    def discard_after(self, last_ids):
+        removed = 0
+        for table in SEED_TABLES:
+            removed += self.conn.execute(f"DELETE FROM {table} WHERE id > ?", (last_ids[table],)).fetchone()[0]
+        return removed
+
+    def database_stats(self):
+        # 先把 WAL 合并进数据文件，否则刚写入的数据不计入已用块
+        self.conn.execute("CHECKPOINT")
+        row = self.conn.execute("SELECT block_size, used_blocks FROM pragma_database_size()").fetchone()
+        return {'databaseBytes': row[0] * row[1]}
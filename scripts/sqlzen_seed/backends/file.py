@@ -0,0 +1,124 @@
+"""
+文件后端：每张表写一个 CSV（带表头），不需要数据库
+
+DB_NAME 作为输出目录。每块数据先在内存中暂存，commit 时追加写入并 fsync，
+因此检查点之后只可能多出整块数据，续传时按 id 截掉。
+生成的 CSV 可以直接用 COPY / LOAD DATA 导入其他数据库。
+"""
+
+import csv
+import os
+from pathlib import Path
+
+from .base import Backend, SEED_TABLES
+from ..generators import ORDER_COLUMNS, ORDER_ITEM_COLUMNS, PRODUCT_COLUMNS, USER_COLUMNS
+
+TABLE_COLUMNS = {
+    'users': USER_COLUMNS,
+    'products': PRODUCT_COLUMNS,
+    'orders': ORDER_COLUMNS,
+    'order_items': ORDER_ITEM_COLUMNS,
+}
+
+
+class FileBackend(Backend):
+    name = 'file'
+    dialect = 'postgresql'
+    supports_indexes = False
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.directory = Path(config['directory'])
+        self.pending = {}
+
+    @classmethod
+    def config_from_env(cls):
+        return {'directory': os.getenv('DB_NAME', 'data')}
+
+    @classmethod
+    def tenant_config(cls, config, tenant):
+        return dict(config, directory=str(Path(config['directory']) / tenant))
+
+    def describe(self):
+        return str(self.directory)
+
+    def path(self, table):
+        return self.directory / f'{table}.csv'
+
+    def connect(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def close(self):
+        self.pending = {}
+
+    def create_tables(self):
+        for table, columns in TABLE_COLUMNS.items():
+            with open(self.path(table), 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(columns)
+
+    def begin(self):
+        self.pending = {}
+
+    def insert_rows(self, table, columns, rows):
+        if rows:
+            self.pending.setdefault(table, []).extend(rows)
+
+    def commit(self):
+        for table, rows in self.pending.items():
+            with open(self.path(table), 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows)
+                f.flush()
+                os.fsync(f.fileno())
+        self.pending = {}
+
+    def rollback(self):
+        self.pending = {}
+
+    def execute(self, statement):
+        # CSV 文件没有 SQL 引擎：索引阶段按 supports_indexes 跳过，其他语句同样忽略并提示
+        print(f"⚠️  文件后端不执行 SQL，已跳过: {statement.strip().splitlines()[0][:80]}")
+
+    def _scan(self, table):
+        """
+        逐条读取 CSV 记录（第一条为表头），同时给出该记录结束处的字节偏移
+
+        按行流式读取，内存占用与文件大小无关；带换行的引号字段由 csv 模块跨行拼接。
+        """
+        with open(self.path(table), 'rb') as f:
+            lines = (line.decode('utf-8') for line in iter(f.readline, b''))
+            for record in csv.reader(lines):
+                yield record, f.tell()
+
+    def user_cities(self):
+        records = self._scan('users')
+        header, _ = next(records)
+        city = header.index('city')
+        return [(int(row[0]), row[city]) for row, _ in records]
+
+    def discard_after(self, last_ids):
+        # 每块按 id 递增追加，第一条超出检查点的记录之后全部丢弃：原地截断，不重写文件
+        removed = 0
+        for table in SEED_TABLES:
+            records = self._scan(table)
+            _, end = next(records)
+            cut, extra = None, 0
+            for row, row_end in records:
+                if cut is None and int(row[0]) > last_ids[table]:
+                    cut = end
+                if cut is not None:
+                    extra += 1
+                end = row_end
+            if cut is None:
+                continue
+            with open(self.path(table), 'r+b') as f:
+                f.truncate(cut)
+                f.flush()
+                os.fsync(f.fileno())
+            removed += extra
+        return removed
+
+    def count_rows(self, table):
+        return sum(1 for _ in self._scan(table)) - 1
+
+    def table_stats(self, table):
+        return {'tableBytes': self.path(table).stat().st_size, 'indexBytes': 0}
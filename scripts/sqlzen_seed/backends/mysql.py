@@ -0,0 +1,58 @@
+"""
+MySQL 后端（mysql-connector-python）
+
+AUTO_INCREMENT 会随显式写入的 id 自动调整，不需要重置序列。
+多租户加载时每个租户一个数据库（DB_NAME_租户名），连接时自动创建。
+"""
+
+from .base import Backend
+
+
+class MySQLBackend(Backend):
+    name = 'mysql'
+    dialect = 'mysql'
+    default_port = 3306
+    default_user = 'root'
+
+    @classmethod
+    def tenant_config(cls, config, tenant):
+        return dict(super().tenant_config(config, tenant), create_database=True)
+
+    def connect(self):
+        try:
+            import mysql.connector
+        except ImportError:
+            raise ImportError("请先安装 MySQL 驱动: pip install mysql-connector-python")
+        config = dict(self.config)
+        # 租户数据库可能还不存在：先不指定数据库连接，创建后再切换
+        database = config.pop('database') if config.pop('create_database', False) else None
+        self.conn = mysql.connector.connect(**config)
+        self.cursor = self.conn.cursor()
+        if database:
+            self.cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}` DEFAULT CHARACTER SET utf8mb4")
+            self.cursor.execute(f"USE `{database}`")
+
+    def table_stats(self, table):
+        # information_schema 的统计默认有缓存（information_schema_stats_expiry），先刷新
+        self.cursor.execute(f"ANALYZE TABLE {table}")
+        self.cursor.fetchall()
+        self.cursor.execute("""
+            SELECT DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """, (table,))
+        table_bytes, index_bytes = self.cursor.fetchone()
+        # InnoDB 的行外存储（BLOB/TEXT 溢出页）计入 DATA_LENGTH，不单独统计
+        return {'tableBytes': int(table_bytes), 'indexBytes': int(index_bytes)}
+
+    def database_stats(self):
+        self.cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_buffer_pool_read%'")
+        status = {name: int(value) for name, value in self.cursor.fetchall() if str(value).isdigit()}
+        self.cursor.execute("SELECT @@innodb_buffer_pool_size")
+        cache_bytes = int(self.cursor.fetchone()[0])
+        requests = status.get('Innodb_buffer_pool_read_requests', 0)
+        # Innodb_buffer_pool_reads 为未命中、需要读磁盘的次数
+        misses = status.get('Innodb_buffer_pool_reads', 0)
+        return {
+            'cacheHitRatio': round(1 - misses / requests, 4) if requests else None,
+            'cacheBytes': cache_bytes,
+        }
@@ -0,0 +1,93 @@
+"""
+PostgreSQL 后端（psycopg2）
+
+多租户加载时每个租户一个 schema（config['schema']），连接后自动创建并设置 search_path。
+"""
+
+from .base import Backend
+from .. import templates
+
+
+class PostgresBackend(Backend):
+    name = 'postgresql'
+    dialect = 'postgresql'
+    default_port = 5432
+    default_user = 'postgres'
+
+    @classmethod
+    def tenant_config(cls, config, tenant):
+        return dict(config, schema=tenant)
+
+    def describe(self):
+        location = super().describe()
+        return f"{location}?schema={self.config['schema']}" if self.config.get('schema') else location
+
+    def connect(self):
+        try:
+            import psycopg2
+        except ImportError:
+            raise ImportError("请先安装 PostgreSQL 驱动: pip install psycopg2-binary")
+        config = dict(self.config)
+        schema = config.pop('schema', None)
+        self.conn = psycopg2.connect(**config)
+        self.conn.autocommit = True
+        self.cursor = self.conn.cursor()
+        if schema:
+            # 建表、插入、序列和统计查询都使用不带 schema 前缀的表名，由 search_path 定位
+            self.cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+            self.cursor.execute(f'SET search_path TO "{schema}"')
+
+    def create_tables(self):
+        # PostgreSQL 可以一次执行整个脚本
+        self.cursor.execute(templates.create_tables_sql(self.dialect))
+
+    def begin(self):
+        self.conn.autocommit = False
+
+    def end(self):
+        self.conn.autocommit = True
+
+    def insert_rows(self, table, columns, rows):
+        if not rows:
+            return
+        from psycopg2.extras import execute_values
+        execute_values(self.cursor, f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s", rows)
+
+    def reset_sequences(self):
+        """显式写入 id 后，把序列推进到当前最大 id"""
+        for table in ('users', 'products', 'orders', 'order_items'):
+            self.cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}")
+
+    def table_stats(self, table):
+        self.cursor.execute("""
+            SELECT pg_relation_size(c.oid), pg_indexes_size(c.oid),
+                   CASE WHEN c.reltoastrelid = 0 THEN 0 ELSE pg_total_relation_size(c.reltoastrelid) END,
+                   s.heap_blks_hit, s.heap_blks_read, s.idx_blks_hit, s.idx_blks_read
+            FROM pg_class c
+            LEFT JOIN pg_statio_user_tables s ON s.relid = c.oid
+            WHERE c.oid = %s::regclass
+        """, (table,))
+        table_bytes, index_bytes, toast_bytes, heap_hit, heap_read, idx_hit, idx_read = self.cursor.fetchone()
+        return {
+            'tableBytes': table_bytes,
+            'indexBytes': index_bytes,
+            'toastBytes': toast_bytes,
+            'heapHitRatio': _ratio(heap_hit, heap_read),
+            'indexHitRatio': _ratio(idx_hit, idx_read),
+        }
+
+    def database_stats(self):
+        self.cursor.execute("""
+            SELECT blks_hit, blks_read, pg_database_size(datname),
+                   pg_size_bytes(current_setting('shared_buffers'))
+            FROM pg_stat_database WHERE datname = current_database()
+        """)
+        hit, read, database_bytes, cache_bytes = self.cursor.fetchone()
+        return {'cacheHitRatio': _ratio(hit, read), 'cacheBytes': cache_bytes, 'databaseBytes': database_bytes}
+
+
+def _ratio(hit, read):
+    """命中次数 / 总访问次数（没有访问时为 None）"""
+    hit, read = hit or 0, read or 0
+    return round(hit / (hit + read), 4) if hit + read else None
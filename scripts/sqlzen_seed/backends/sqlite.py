@@ -0,0 +1,68 @@
+"""
+SQLite 后端（标准库 sqlite3）
+
+DB_NAME 作为数据库文件路径（没有扩展名时补 .db，相对路径放在 --data-dir / --output-dir 下），
+不需要数据库服务，适合本地快速试用。
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+from .base import Backend
+from .. import templates
+
+
+def _adapt(value):
+    # sqlite3 的默认 datetime 适配器已弃用，统一写成 ISO 文本
+    return value.isoformat(sep=' ') if isinstance(value, datetime) else value
+
+
+class SQLiteBackend(Backend):
+    name = 'sqlite'
+    dialect = 'sqlite'
+    placeholder = '?'
+    database_file = True
+
+    @classmethod
+    def config_from_env(cls):
+        database = os.getenv('DB_NAME', 'test')
+        if not os.path.splitext(database)[1]:
+            database += '.db'
+        return {'database': database}
+
+    def describe(self):
+        return self.config['database']
+
+    def connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.config['database'])), exist_ok=True)
+        self.conn = sqlite3.connect(self.config['database'])
+        self.cursor = self.conn.cursor()
+
+    def create_tables(self):
+        self.conn.executescript(templates.create_tables_sql(self.dialect))
+        self.conn.commit()
+
+    def insert_rows(self, table, columns, rows):
+        if not rows:
+            return
+        super().insert_rows(table, columns, [tuple(_adapt(value) for value in row) for row in rows])
+
+    def table_stats(self, table):
+        # dbstat 虚拟表需要 SQLITE_ENABLE_DBSTAT_VTAB，不可用时只统计行数
+        try:
+            self.cursor.execute("""
+                SELECT m.type, SUM(d.pgsize) FROM dbstat d JOIN sqlite_master m ON m.name = d.name
+                WHERE m.tbl_name = ? GROUP BY m.type
+            """, (table,))
+        except sqlite3.OperationalError:
+            return {}
+        sizes = dict(self.cursor.fetchall())
+        return {'tableBytes': sizes.get('table', 0), 'indexBytes': sizes.get('index', 0)}
+
+    def database_stats(self):
+        self.cursor.execute("PRAGMA page_count")
+        page_count = self.cursor.fetchone()[0]
+        self.cursor.execute("PRAGMA page_size")
+        page_size = self.cursor.fetchone()[0]
+        return {'databaseBytes': page_count * page_size}
@@ -0,0 +1,151 @@
+"""
+数据加载后的容量报告
+
+按表汇总实际行数、表数据/索引/TOAST 大小、索引与表数据的比例、每行字节数和缓存命中率，
+并按放大倍数线性估算生产数据量下的存储和缓存需求。同时写出 JSON 和 Markdown：
+
+    report = build_report(backend.capacity_stats(), backend, params)
+    write_report(report, OUTPUT_DIR / 'capacity-report.json', OUTPUT_DIR / 'capacity-report.md')
+
+各项统计由后端提供（backends.base.Backend.capacity_stats），后端不支持的项记为 None。
+"""
+
+import json
+from datetime import datetime
+
+# 默认估算的放大倍数
+DEFAULT_SCALES = (10, 100)
+
+# 计入合计大小的字段
+SIZE_KEYS = ('tableBytes', 'indexBytes', 'toastBytes')
+
+
+def format_bytes(value):
+    if value is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if abs(value) < 1024 or unit == 'TB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+def format_ratio(value):
+    return '-' if value is None else f"{value * 100:.1f}%"
+
+
+def _sum(values):
+    values = [value for value in values if value is not None]
+    return sum(values) if values else None
+
+
+def _table_entry(stats, scales):
+    entry = {key: stats.get(key) for key in ('rows',) + SIZE_KEYS + ('heapHitRatio', 'indexHitRatio')}
+    has_sizes = any(stats.get(key) is not None for key in SIZE_KEYS)
+    total = sum(stats.get(key) or 0 for key in SIZE_KEYS) if has_sizes else None
+    rows = entry['rows']
+    entry['totalBytes'] = total
+    entry['bytesPerRow'] = round(total / rows, 1) if total is not None and rows else None
+    entry['indexRatio'] = (round(entry['indexBytes'] / entry['tableBytes'], 3)
+                           if entry['indexBytes'] is not None and entry['tableBytes'] else None)
+    entry['projected'] = {str(scale): {'rows': rows * scale,
+                                       'totalBytes': total * scale if total is not None else None,
+                                       'indexBytes': entry['indexBytes'] * scale
+                                       if entry['indexBytes'] is not None else None}
+                          for scale in scales}
+    return entry
+
+
+def build_report(stats, backend, params=None, scales=DEFAULT_SCALES):
+    """由 Backend.capacity_stats() 的结果生成报告（放大估算假设每行字节数不变）"""
+    tables = {table: _table_entry(table_stats, scales) for table, table_stats in stats['tables'].items()}
+    totals = {key: _sum(entry[key] for entry in tables.values()) for key in ('rows', 'totalBytes') + SIZE_KEYS}
+    totals['bytesPerRow'] = (round(totals['totalBytes'] / totals['rows'], 1)
+                             if totals['totalBytes'] is not None and totals['rows'] else None)
+    totals['indexRatio'] = (round(totals['indexBytes'] / totals['tableBytes'], 3)
+                            if totals['indexBytes'] is not None and totals['tableBytes'] else None)
+    totals['projected'] = {
+        str(scale): {key: _sum(entry['projected'][str(scale)][key] for entry in tables.values())
+                     for key in ('rows', 'totalBytes', 'indexBytes')}
+        for scale in scales
+    }
+    return {
+        'generatedAt': datetime.now().isoformat(timespec='seconds'),
+        'backend': backend.name,
+        'location': backend.describe(),
+        'params': params or {},
+        'scales': list(scales),
+        'database': stats['database'],
+        'tables': tables,
+        'totals': totals,
+    }
+
+
+def format_markdown(report):
+    database = report['database']
+    lines = [
+        '# 容量报告',
+        '',
+        f"- 后端: {report['backend']}（{report['location']}）",
+        f"- 生成时间: {report['generatedAt']}",
+    ]
+    if 'databaseBytes' in database:
+        lines.append(f"- 数据库大小: {format_bytes(database['databaseBytes'])}")
+    if 'cacheHitRatio' in database:
+        lines.append(f"- 缓存命中率: {format_ratio(database['cacheHitRatio'])}"
+                     f"（缓存 {format_bytes(database.get('cacheBytes'))}）")
+    lines += [
+        '',
+        '## 各表',
+        '',
+        '| 表 | 行数 | 表数据 | 索引 | TOAST | 合计 | 字节/行 | 索引/表 | 表缓存命中 | 索引缓存命中 |',
+        '|----|-----:|-------:|-----:|------:|-----:|--------:|--------:|-----------:|-------------:|',
+    ]
+    rows = list(report['tables'].items()) + [('**合计**', report['totals'])]
+    for table, entry in rows:
+        lines.append(
+            f"| {table} | {entry['rows']} | {format_bytes(entry['tableBytes'])} | {format_bytes(entry['indexBytes'])} "
+            f"| {format_bytes(entry['toastBytes'])} | {format_bytes(entry['totalBytes'])} "
+            f"| {entry['bytesPerRow'] if entry['bytesPerRow'] is not None else '-'} "
+            f"| {entry['indexRatio'] if entry['indexRatio'] is not None else '-'} "
+            f"| {format_ratio(entry.get('heapHitRatio'))} | {format_ratio(entry.get('indexHitRatio'))} |")
+
+    scales = [str(scale) for scale in report['scales']]
+    if scales:
+        lines += [
+            '',
+            '## 按数据量放大估算',
+            '',
+            '假设每行字节数和索引/表比例不变，线性放大。索引大小可作为缓存（shared_buffers / innodb_buffer_pool_size）'
+            '的下限参考。',
+            '',
+            '| 表 | 当前 | ' + ' | '.join(f'×{scale}' for scale in scales) + ' |',
+            '|----|-----:|' + '-----:|' * len(scales),
+        ]
+        for table, entry in rows:
+            lines.append(f"| {table} | {format_bytes(entry['totalBytes'])} | "
+                         + ' | '.join(format_bytes(entry['projected'][scale]['totalBytes']) for scale in scales)
+                         + ' |')
+        totals = report['totals']
+        lines.append(f"| 索引（建议常驻缓存） | {format_bytes(totals['indexBytes'])} | "
+                     + ' | '.join(format_bytes(totals['projected'][scale]['indexBytes']) for scale in scales)
+                     + ' |')
+    return '\n'.join(lines) + '\n'
+
+
+def format_table(report):
+    """控制台摘要"""
+    header = f"{'表':<20} {'行数':>12} {'合计':>12} {'索引':>12} {'字节/行':>10} {'索引/表':>8}"
+    lines = [header, '-' * len(header)]
+    for table, entry in report['tables'].items():
+        lines.append(
+            f"{table:<20} {entry['rows']:>12} {format_bytes(entry['totalBytes']):>12} "
+            f"{format_bytes(entry['indexBytes']):>12} "
+            f"{entry['bytesPerRow'] if entry['bytesPerRow'] is not None else '-':>10} "
+            f"{entry['indexRatio'] if entry['indexRatio'] is not None else '-':>8}")
+    return '\n'.join(lines)
+
+
+def write_report(report, json_path, markdown_path):
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    markdown_path.write_text(format_markdown(report), encoding='utf-8')
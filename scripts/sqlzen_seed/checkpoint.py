@@ -0,0 +1,127 @@
+"""
+分块加载的检查点（断点续传）
+"""
+
+import json
+import os
+import random
+from datetime import datetime
+
+from .golden import GoldenAnswers
+
+# 加载阶段（按顺序执行）
+SEED_STAGES = ['products', 'users', 'orders', 'indexes', 'done']
+
+# 续传时必须与上次一致的参数
+CHECKPOINT_PARAMS = ('db_type', 'database', 'users', 'orders', 'chunk_size', 'seed', 'as_of', 'history_days',
+                     'mirror', 'tenant')
+
+
+def _to_json_state(value):
+    """random.getstate() 的元组转换为 JSON 列表"""
+    return [_to_json_state(v) for v in value] if isinstance(value, (tuple, list)) else value
+
+
+def _from_json_state(value):
+    return tuple(_from_json_state(v) for v in value) if isinstance(value, list) else value
+
+
+class Checkpoint:
+    """
+    分块加载的检查点
+
+    每块数据提交后记录：当前阶段、下一块序号、各表最后提交的 id 和随机数状态。
+    标准答案的完整累计状态只在阶段结束时写入检查点；订单阶段每块只把该块的增量追加到
+    <检查点>.golden.jsonl，检查点的写入量不随已加载的订单数增长。
+    续传时删除 id 大于最后提交 id 的行（数据库已提交但检查点未写入的块），
+    恢复随机数状态和标准答案后从下一块继续，生成的数据与一次跑完完全相同。
+    """
+
+    def __init__(self, path, params, now):
+        self.path = path
+        self.journal_path = path.with_suffix('.golden.jsonl')
+        self.params = params
+        self.now = now
+        self.stage = SEED_STAGES[0]
+        self.chunk = 0
+        self.last_ids = {'products': 0, 'users': 0, 'orders': 0, 'order_items': 0}
+        self.rng_state = None
+        self.golden_state = None
+
+    @classmethod
+    def load(cls, path, params):
+        """读取检查点，参数与本次运行不一致时抛出 ValueError"""
+        data = json.loads(path.read_text(encoding='utf-8'))
+        mismatched = [key for key in CHECKPOINT_PARAMS if data['params'].get(key) != params.get(key)]
+        if mismatched:
+            detail = ', '.join(f"{key}={data['params'].get(key)}" for key in mismatched)
+            raise ValueError(f"检查点参数与本次运行不一致（{detail}），请使用相同参数续传或去掉 --resume 重新开始")
+        checkpoint = cls(path, params, datetime.fromisoformat(data['now']))
+        checkpoint.stage = data['stage']
+        checkpoint.chunk = data['chunk']
+        checkpoint.last_ids = data['last_ids']
+        checkpoint.rng_state = _from_json_state(data['rng_state'])
+        checkpoint.golden_state = data['golden']
+        return checkpoint
+
+    def done(self, stage):
+        return SEED_STAGES.index(self.stage) > SEED_STAGES.index(stage)
+
+    def restore_golden(self, as_of):
+        """
+        恢复标准答案：阶段结束时的完整状态，加上订单阶段已记录块的增量
+
+        检查点之后追加的增量（对应的块续传时会被删除后重新生成）从文件中截掉。
+        """
+        golden = GoldenAnswers.from_state(self.golden_state) if self.golden_state else GoldenAnswers(as_of)
+        if self.stage != 'orders' or not self.journal_path.exists():
+            return golden
+        with open(self.journal_path, 'r+', encoding='utf-8') as f:
+            valid = 0
+            for line in iter(f.readline, ''):
+                entry = json.loads(line) if line.endswith('\n') else None
+                if entry is None or entry['chunk'] > self.chunk:
+                    break
+                golden.merge(GoldenAnswers.from_state(entry['golden']))
+                valid = f.tell()
+            f.truncate(valid)
+        return golden
+
+    def advance(self, stage, chunk, golden=None, golden_chunk=None, **last_ids):
+        """
+        记录一块已提交（先写临时文件再替换，避免写到一半中断）
+
+        golden 为完整的标准答案（阶段结束时传入）；golden_chunk 为本块的增量，追加到增量文件。
+        """
+        self.stage = stage
+        self.chunk = chunk
+        self.last_ids.update(last_ids)
+        self.rng_state = random.getstate()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if golden_chunk is not None:
+            # 先追加增量再替换检查点：中断在两者之间时，多出的增量按块序号忽略
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'chunk': chunk, 'golden': golden_chunk.to_state()}, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        if golden is not None:
+            self.golden_state = golden.to_state()
+        data = {
+            'params': self.params,
+            'now': self.now.isoformat(),
+            'stage': self.stage,
+            'chunk': self.chunk,
+            'last_ids': self.last_ids,
+            'rng_state': _to_json_state(self.rng_state),
+            'golden': self.golden_state,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        if stage != 'orders':
+            # 完整状态已写入检查点（或重新开始），增量文件不再需要
+            self.journal_path.unlink(missing_ok=True)
+
+    def finish_stage(self, stage, golden=None):
+        self.advance(SEED_STAGES[SEED_STAGES.index(stage) + 1], 0, golden)
@@ -0,0 +1,439 @@
+"""
+命令行入口（与 scripts/init-test-data.py 兼容）
+
+    python scripts/init-test-data.py --users 1000 --orders 5000 --seed 42
+    python -m sqlzen_seed --backend sqlite --users 1000 --orders 5000
+    sqlzen-seed --backend file --output-dir ./output     # pip install ./scripts 后
+    python -m sqlzen_seed --duckdb-mirror                 # 同时写入 DuckDB 分析镜像
+    python -m sqlzen_seed --tenants 50 --parallel 8       # 50 个租户，按 Zipf 分布抽取数据量
+
+后端默认取环境变量 DB_TYPE（默认 postgresql），--backend 优先。
+在仓库内运行时 Schema 写入仓库根目录的 schema/、生成物写入 scripts/output/；
+安装后在其他目录运行时分别为当前目录下的 schema/ 和 output/。
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+from . import templates
+from .backends import available_backends, get_backend, get_backend_class, resolve_backend_name
+from .backends.base import split_sql_statements
+from .capacity import DEFAULT_SCALES, build_report, format_bytes, format_table, write_report
+from .checkpoint import Checkpoint
+from .generators import (MIN_USER_HISTORY_DAYS, ORDER_COLUMNS, ORDER_ITEM_COLUMNS, PRODUCT_COLUMNS,
+                         PRODUCTS_DATA, USER_COLUMNS, generate_orders, generate_products, generate_users,
+                         product_catalog)
+from .golden import GoldenAnswers
+from .metrics import SeedMetrics
+from .tenants import TENANT_DISTRIBUTIONS, run_tenants
+
+# Schema 文件分组（写入时打印的标题）
+SCHEMA_GROUPS = {
+    'tables': "📄 生成 Schema 层文件...",
+    'joins': "🔗 生成关系定义文件...",
+    'cubes': "📊 生成 Cube 层文件...",
+}
+
+
+def default_dirs():
+    """返回 (Schema 目录, 生成物输出目录)"""
+    scripts_dir = Path(__file__).resolve().parent.parent
+    repo_root = scripts_dir.parent
+    if (repo_root / 'package.json').exists():
+        return repo_root / 'schema', scripts_dir / 'output'
+    return Path.cwd() / 'schema', Path.cwd() / 'output'
+
+
+def load_env():
+    # 加载 .env 文件
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        print("⚠️  dotenv 未安装，将只使用系统环境变量")
+
+
+def display_path(path, base):
+    try:
+        return path.relative_to(base)
+    except ValueError:
+        return path
+
+
+def positive_int(value):
+    """argparse 参数类型：正整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"需要正整数: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"需要正整数: {value}")
+    return number
+
+
+def parse_args(argv=None):
+    schema_dir, output_dir = default_dirs()
+    parser = argparse.ArgumentParser(description='初始化 SQL-Zen 测试数据库并生成 Schema/Cube 文件')
+    parser.add_argument('--backend',
+                        help=f"写入后端: {', '.join(available_backends())}（默认：环境变量 DB_TYPE 或 postgresql）")
+    parser.add_argument('--users', type=positive_int, default=100, help='用户数（默认：100）')
+    parser.add_argument('--orders', type=positive_int, default=500, help='订单数（默认：500）')
+    parser.add_argument('--chunk-size', type=positive_int, default=10000, help='每个事务提交的行数（默认：10000）')
+    parser.add_argument('--seed', type=int, help='随机种子（不指定时每次生成不同的数据）')
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help='时间基准日期 YYYY-MM-DD，所有时间列相对该日生成（默认：今天）')
+    parser.add_argument('--history-days', type=positive_int, default=90,
+                        help=f'订单时间的分布范围（天，默认：90）；用户注册时间至少覆盖 {MIN_USER_HISTORY_DAYS} 天')
+    parser.add_argument('--schema-dir', type=Path, default=schema_dir,
+                        help='Schema/Cube 文件输出目录（默认：仓库根目录的 schema/）')
+    parser.add_argument('--output-dir', type=Path, default=output_dir,
+                        help='检查点、指标、标准答案等生成物的目录（默认：scripts/output/）')
+    parser.add_argument('--data-dir', type=Path,
+                        help='文件后端的 CSV 目录（默认：环境变量 DB_NAME，未设置时为 <output-dir>/data）；'
+                             'SQLite / DuckDB 相对路径数据库文件的目录（默认：<output-dir>）')
+    parser.add_argument('--duckdb-mirror', nargs='?', const='', metavar='PATH',
+                        help='同时把数据写入 DuckDB 文件作为分析镜像（默认路径：<output-dir>/seed.duckdb）')
+    parser.add_argument('--tenants', type=positive_int,
+                        help='多租户：加载的租户数（PostgreSQL 每个租户一个 schema，MySQL 每个租户一个数据库）')
+    parser.add_argument('--tenant-sizes', choices=sorted(TENANT_DISTRIBUTIONS), default='zipf',
+                        help='租户数据量分布，--users/--orders 为平均值（默认：zipf）')
+    parser.add_argument('--tenant-skew', type=float,
+                        help='分布的偏斜程度：zipf 为指数、lognormal 为 sigma（默认：1.0）')
+    parser.add_argument('--tenant-prefix', default='tenant', help='租户名前缀（默认：tenant，生成 tenant_001 …）')
+    parser.add_argument('--tenants-dir', type=Path,
+                        help='各租户的 schema/、标准答案和日志目录（默认：<output-dir>/tenants）')
+    parser.add_argument('--parallel', type=positive_int, default=min(4, multiprocessing.cpu_count()),
+                        help='同时加载的租户数，即并发连接数（默认：min(4, CPU 核数)）')
+    parser.add_argument('--capacity-scales', type=positive_int, nargs='*', default=list(DEFAULT_SCALES),
+                        help='容量报告中估算的数据量放大倍数（默认：10 100）')
+    parser.add_argument('--resume', action='store_true', help='从检查点继续上次中断的加载')
+    parser.add_argument('--state-file', type=Path, help='检查点文件（默认：<output-dir>/seed-state.json）')
+    parser.add_argument('--metrics-file', type=Path, help='阶段指标 JSON（默认：<output-dir>/seed-metrics.json）')
+    parser.add_argument('--profile', action='store_true', help='每个阶段写出 cProfile 数据（<output-dir>/profiles/）')
+    parser.add_argument('--trace-mem', action='store_true', help='每个阶段写出 tracemalloc 分配最多的代码行')
+    args = parser.parse_args(argv)
+    args.state_file = args.state_file or args.output_dir / 'seed-state.json'
+    args.metrics_file = args.metrics_file or args.output_dir / 'seed-metrics.json'
+    if args.duckdb_mirror == '':
+        args.duckdb_mirror = args.output_dir / 'seed.duckdb'
+    args.tenants_dir = args.tenants_dir or args.output_dir / 'tenants'
+    # 单租户加载；多租户时由 tenants.plan_tenants 为每个租户设置
+    args.tenant = None
+    # 索引顾问的推荐结果在顶层输出目录，各租户共用
+    args.indexes_dir = args.output_dir
+    return args
+
+
+def create_backend(args):
+    """按 --backend / DB_TYPE 创建后端，不支持的类型直接退出"""
+    try:
+        name = resolve_backend_name(args.backend or os.getenv('DB_TYPE', 'postgresql'))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    config = None
+    if name == 'file' and (args.data_dir or not os.getenv('DB_NAME')):
+        # 多租户时 data_dir / output_dir 已经是各租户自己的目录
+        config = {'directory': str(args.data_dir or args.output_dir / 'data')}
+    else:
+        backend_class = get_backend_class(name)
+        config = backend_class.config_from_env()
+        if args.tenant:
+            config = backend_class.tenant_config(config, args.tenant)
+        config = backend_class.locate(config, args.data_dir or args.output_dir)
+    return get_backend(name, config)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_env()
+    if args.tenants:
+        run_tenants(args, seed)
+    else:
+        seed(args)
+
+
+def seed(args):
+    """
+    加载一个数据库（或一个租户），生成 Schema 文件和标准答案
+
+    成功时返回 {'location': 连接位置, 'counts': {表名: 行数}}，失败时打印原因并返回 None。
+    """
+    backend = create_backend(args)
+    mirror = get_backend('duckdb', {'database': str(args.duckdb_mirror)}) if args.duckdb_mirror else None
+    schema_dir = args.schema_dir
+    output_dir = args.output_dir
+    golden_answers_file = output_dir / 'golden-answers.json'
+    capacity_json_file = output_dir / 'capacity-report.json'
+    capacity_markdown_file = output_dir / 'capacity-report.md'
+    # 索引顾问（scripts/index-advisor.py）的推荐结果，存在时优先使用
+    advised_indexes_file = args.indexes_dir / f'indexes-{backend.name}.sql'
+    params = {
+        'db_type': backend.name,
+        'database': backend.config.get('database', backend.describe()),
+        'users': args.users,
+        'orders': args.orders,
+        'chunk_size': args.chunk_size,
+        'seed': args.seed,
+        'as_of': args.as_of.isoformat() if args.as_of else None,
+        'history_days': args.history_days,
+        'mirror': str(args.duckdb_mirror) if mirror else None,
+        'tenant': args.tenant,
+    }
+    state_file = args.state_file
+    metrics_file = args.metrics_file
+    metrics = SeedMetrics(profile=args.profile, trace_mem=args.trace_mem, dump_dir=metrics_file.parent / 'profiles')
+
+    print("=" * 60)
+    print("SQL-Zen 测试数据初始化" + (f"（租户 {args.tenant}）" if args.tenant else ""))
+    print("=" * 60)
+    print()
+
+    checkpoint = None
+    if args.resume:
+        if not state_file.exists():
+            print(f"❌ 未找到检查点文件: {state_file}")
+            return
+        try:
+            checkpoint = Checkpoint.load(state_file, params)
+        except (ValueError, KeyError) as e:
+            print(f"❌ 无法续传: {e}")
+            return
+        print(f"🔁 从检查点继续: 阶段 {checkpoint.stage}，第 {checkpoint.chunk} 块")
+
+    # 连接数据库
+    print(f"📦 连接数据库 ({backend.name.upper()}): {backend.describe()}")
+    if mirror:
+        print(f"🦆 分析镜像 (DUCKDB): {mirror.describe()}")
+    try:
+        backend.connect()
+        if mirror:
+            mirror.connect()
+        print("✅ 数据库连接成功")
+    except ImportError as e:
+        print(f"❌ {e}")
+        return
+    except Exception as e:
+        print(f"❌ 数据库连接失败: {e}")
+        print("\n请检查环境变量配置：")
+        print("  DB_TYPE, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD")
+        return
+
+    if checkpoint is None:
+        # 创建表
+        print("\n📋 创建数据库表...")
+        try:
+            with metrics.stage('create_tables') as stage, stage.driver():
+                backend.create_tables()
+                if mirror:
+                    mirror.create_tables()
+            print("✅ 表创建成功: users, products, orders, order_items")
+        except Exception as e:
+            print(f"❌ 表创建失败: {e}")
+            return
+
+        if args.seed is not None:
+            random.seed(args.seed)
+        # 时间基准取基准日的最后一秒，「N 天前」的行都落在基准日前第 N 天
+        as_of = args.as_of or date.today()
+        checkpoint = Checkpoint(state_file, params, datetime.combine(as_of, datetime.max.time()).replace(microsecond=0))
+        checkpoint.advance('products', 0)
+    else:
+        with metrics.stage('discard_uncommitted') as stage, stage.driver():
+            removed = backend.discard_after(checkpoint.last_ids)
+            if mirror:
+                removed += mirror.discard_after(checkpoint.last_ids)
+        if removed:
+            print(f"🧹 删除检查点之后写入的 {removed} 行")
+        random.setstate(checkpoint.rng_state)
+
+    def write_chunk(batches, stage):
+        # 先提交主库再提交镜像；两者之间中断时，续传会把两边都截到检查点
+        backend.write_chunk(batches, stage)
+        if mirror:
+            mirror.write_chunk(batches, stage, label=mirror.name)
+
+    now = checkpoint.now
+    chunk_size = args.chunk_size
+    user_history_days = max(args.history_days, MIN_USER_HISTORY_DAYS)
+    print(f"\n📅 时间基准 {now.date()}，订单覆盖 {args.history_days} 天，用户注册覆盖 {user_history_days} 天")
+
+    # 插入商品数据
+    product_data = product_catalog()
+    if not checkpoint.done('products'):
+        print("\n📦 插入商品数据...")
+        with metrics.stage('products') as stage:
+            with stage.generate():
+                products = generate_products(now)
+            write_chunk([('products', PRODUCT_COLUMNS, products)], stage)
+            checkpoint.last_ids['products'] = len(products)
+            checkpoint.finish_stage('products')
+        print(f"✅ 插入 {len(product_data)} 个商品")
+
+    # 插入用户数据（分块提交）
+    if not checkpoint.done('users'):
+        print("\n👥 插入用户数据...")
+        with metrics.stage('users') as stage:
+            chunk = checkpoint.chunk
+            while chunk * chunk_size < args.users:
+                start_id = chunk * chunk_size + 1
+                with stage.generate():
+                    users = generate_users(min(chunk_size, args.users - chunk * chunk_size), start_id, now,
+                                           user_history_days)
+                write_chunk([('users', USER_COLUMNS, users)], stage)
+                chunk += 1
+                with stage.checkpoint():
+                    checkpoint.advance('users', chunk, users=users[-1][0])
+                print(f"  ↳ 用户 {checkpoint.last_ids['users']}/{args.users}")
+            checkpoint.finish_stage('users')
+        print(f"✅ 插入 {args.users} 个用户")
+
+    with metrics.stage('load_users') as stage, stage.driver():
+        user_rows = backend.user_cities()
+    user_ids = [row[0] for row in user_rows]
+    user_cities = dict(user_rows)
+
+    # 插入订单数据（订单和明细在同一事务中分块提交）
+    golden = checkpoint.restore_golden(now.date())
+    if not checkpoint.done('orders'):
+        print("\n🛒 插入订单数据...")
+        with metrics.stage('orders') as stage:
+            chunk = checkpoint.chunk
+            while chunk * chunk_size < args.orders:
+                with stage.generate():
+                    # 本块的标准答案增量单独累计，检查点只追加增量
+                    golden_chunk = GoldenAnswers(now.date())
+                    orders, order_items = generate_orders(
+                        user_ids, product_data, min(chunk_size, args.orders - chunk * chunk_size), user_cities,
+                        golden_chunk, start_id=chunk * chunk_size + 1,
+                        start_item_id=checkpoint.last_ids['order_items'] + 1, now=now,
+                        history_days=args.history_days)
+                    golden.merge(golden_chunk)
+                write_chunk([
+                    ('orders', ORDER_COLUMNS, orders),
+                    ('order_items', ORDER_ITEM_COLUMNS, order_items),
+                ], stage)
+                chunk += 1
+                with stage.checkpoint():
+                    checkpoint.advance('orders', chunk, golden_chunk=golden_chunk, orders=orders[-1][0],
+                                       order_items=order_items[-1][0])
+                print(f"  ↳ 订单 {checkpoint.last_ids['orders']}/{args.orders}")
+            checkpoint.finish_stage('orders', golden)
+        print(f"✅ 插入 {args.orders} 个订单")
+        print(f"✅ 插入 {checkpoint.last_ids['order_items']} 条订单明细")
+
+    backend.reset_sequences()
+
+    # 创建索引（数据导入后再建索引，避免逐行维护索引的开销）
+    if not checkpoint.done('indexes'):
+        if not backend.supports_indexes:
+            print(f"\n🗂️  跳过索引（{backend.name} 后端不支持）")
+            checkpoint.finish_stage('indexes', golden)
+        else:
+            if advised_indexes_file.exists():
+                print(f"\n🗂️  创建索引（使用索引顾问推荐: {advised_indexes_file.name}）...")
+                indexes_sql = advised_indexes_file.read_text(encoding='utf-8')
+            else:
+                print("\n🗂️  创建索引（默认索引）...")
+                indexes_sql = templates.create_indexes_sql()
+            created = 0
+            with metrics.stage('indexes') as stage:
+                for statement in split_sql_statements(indexes_sql):
+                    try:
+                        table = re.search(r'\bON\s+(\w+)', statement, re.IGNORECASE)
+                        with stage.driver(table.group(1) if table else None):
+                            backend.execute(statement)
+                        created += 1
+                    except Exception as e:
+                        # 续传时上次已创建的索引会报已存在
+                        print(f"⚠️  索引创建失败: {e}")
+                backend.commit()
+                checkpoint.finish_stage('indexes', golden)
+            print(f"✅ 创建 {created} 个索引")
+
+    # 容量报告（实际行数、表和索引大小、缓存命中率）
+    print("\n📏 生成容量报告...")
+    try:
+        with metrics.stage('capacity_report') as stage, stage.driver():
+            capacity = build_report(backend.capacity_stats(), backend, params, args.capacity_scales)
+        write_report(capacity, capacity_json_file, capacity_markdown_file)
+        print(format_table(capacity))
+        print(f"📄 {capacity_markdown_file}")
+    except Exception as e:
+        capacity = None
+        print(f"⚠️  容量报告生成失败: {e}")
+
+    if mirror:
+        size = mirror.database_stats().get('databaseBytes')
+        print(f"\n🦆 DuckDB 镜像: {mirror.describe()}（{format_bytes(size)}）")
+        print("   对比两个引擎的 Cube 查询: python scripts/cube-benchmark.py --duckdb " + mirror.describe())
+        mirror.close()
+
+    # 关闭数据库连接
+    backend.close()
+    print("\n✅ 数据库初始化完成")
+
+    with metrics.stage('schema_files'):
+        print("\n" + "=" * 60)
+        print("生成 Schema 文件")
+        print("=" * 60)
+
+        group = None
+        for relative in templates.write_schema_files(schema_dir):
+            if relative.parts[0] != group:
+                group = relative.parts[0]
+                print("\n" + SCHEMA_GROUPS.get(group, f"📄 生成 {group} 文件..."))
+            print(f"✅ {schema_dir.name}/{relative.as_posix()}")
+
+    # 写入标准答案
+    print("\n🎯 生成标准答案...")
+    with metrics.stage('golden_answers'):
+        golden.write(golden_answers_file)
+    print(f"✅ {display_path(golden_answers_file, schema_dir.parent)}（基准日期 {golden.as_of}）")
+
+    # 阶段指标
+    metrics.write(metrics_file)
+    print("\n⏱️  阶段耗时：")
+    print(metrics.format_table())
+    print(f"📄 {metrics_file}")
+
+    # 完成
+    print("\n" + "=" * 60)
+    print("🎉 初始化完成！")
+    print("=" * 60)
+    print()
+    if capacity:
+        counts = {table: entry['rows'] for table, entry in capacity['tables'].items()}
+    else:
+        counts = {'users': args.users, 'products': len(PRODUCTS_DATA), 'orders': args.orders,
+                  'order_items': checkpoint.last_ids['order_items']}
+    print("数据概览：")
+    print(f"  - 用户: {counts['users']} 人")
+    print(f"  - 商品: {counts['products']} 个")
+    print(f"  - 订单: {counts['orders']} 个")
+    print(f"  - 订单明细: {counts['order_items']} 条")
+    print()
+    print("现在可以测试 ask 命令了：")
+    print()
+    print("  # 收入查询")
+    print('  sql-zen ask "最近30天的总收入是多少？"')
+    print()
+    print("  # 订单统计")
+    print('  sql-zen ask "上个月有多少订单？完成率是多少？"')
+    print()
+    print("  # 用户分析")
+    print('  sql-zen ask "哪个城市的用户消费最多？"')
+    print()
+    print("  # 商品分析")
+    print('  sql-zen ask "哪个类别的商品利润率最高？"')
+    print()
+    print("  # 复杂查询")
+    print('  sql-zen ask "列出销量前5的商品及其收入"')
+    print()
+    return {'location': backend.describe(), 'counts': counts}
@@ -0,0 +1,134 @@
+"""
+模拟数据生成
+
+只依赖标准库，使用全局 random 模块（调用方负责设置种子或恢复状态）。
+所有行都显式包含 id，时间列相对传入的 now 生成。
+"""
+
+import random
+from datetime import datetime, timedelta
+
+# 商品表、用户表、订单表中的列（与 generate_* 返回的元组顺序一致）
+PRODUCT_COLUMNS = ['id', 'name', 'category', 'price', 'cost', 'stock', 'status', 'created_at']
+USER_COLUMNS = ['id', 'name', 'email', 'phone', 'city', 'country', 'status', 'created_at', 'updated_at']
+ORDER_COLUMNS = ['id', 'user_id', 'total_amount', 'status', 'payment_method', 'shipping_address',
+                 'created_at', 'paid_at', 'shipped_at', 'completed_at']
+ORDER_ITEM_COLUMNS = ['id', 'order_id', 'product_id', 'quantity', 'unit_price', 'subtotal', 'created_at']
+
+CITIES = ['北京', '上海', '广州', '深圳', '杭州', '成都', '武汉', '西安', '南京', '重庆']
+CATEGORIES = ['电子产品', '服装', '食品', '家居', '图书']
+PAYMENT_METHODS = ['alipay', 'wechat', 'credit_card', 'bank_transfer']
+ORDER_STATUSES = ['pending', 'paid', 'shipped', 'completed', 'cancelled']
+
+# 用户注册时间的最短分布范围（天）
+MIN_USER_HISTORY_DAYS = 365
+
+PRODUCTS_DATA = [
+    ('iPhone 15 Pro', '电子产品', 8999.00, 6500.00),
+    ('MacBook Pro 14', '电子产品', 16999.00, 12000.00),
+    ('AirPods Pro 2', '电子产品', 1899.00, 1200.00),
+    ('iPad Air', '电子产品', 4799.00, 3200.00),
+    ('Apple Watch', '电子产品', 2999.00, 2000.00),
+    ('运动T恤', '服装', 199.00, 80.00),
+    ('牛仔裤', '服装', 399.00, 150.00),
+    ('羽绒服', '服装', 1299.00, 500.00),
+    ('运动鞋', '服装', 699.00, 280.00),
+    ('休闲外套', '服装', 599.00, 220.00),
+    ('有机牛奶', '食品', 68.00, 40.00),
+    ('进口坚果', '食品', 128.00, 70.00),
+    ('咖啡豆', '食品', 98.00, 45.00),
+    ('智能台灯', '家居', 299.00, 120.00),
+    ('床上四件套', '家居', 499.00, 180.00),
+    ('Python编程', '图书', 89.00, 35.00),
+    ('数据结构', '图书', 79.00, 30.00),
+]
+
+
+def product_catalog():
+    """商品目录（id 从 1 开始）：[(id, 名称, 类别, 售价, 成本)]"""
+    return [(i, name, category, price, cost) for i, (name, category, price, cost) in enumerate(PRODUCTS_DATA, start=1)]
+
+
+def generate_products(now):
+    """生成商品行：[(id, 名称, 类别, 售价, 成本, 库存, 状态, 创建时间)]"""
+    return [(i, name, category, price, cost, random.randint(10, 100), 'active', now)
+            for i, name, category, price, cost in product_catalog()]
+
+
+def generate_users(n=100, start_id=1, now=None, history_days=365):
+    """
+    生成用户数据（显式指定 id，从 start_id 开始）
+
+    now 为时间基准，分块生成时各块使用同一个基准，保证断点续传前后数据一致；
+    注册时间分布在基准之前的 history_days 天内。
+    """
+    now = now or datetime.now()
+    users = []
+    for i in range(start_id, start_id + n):
+        name = f"用户{i:04d}"
+        email = f"user{i:04d}@example.com"
+        phone = f"138{random.randint(10000000, 99999999)}"
+        city = random.choice(CITIES)
+        status = random.choices(['active', 'inactive'], weights=[0.9, 0.1])[0]
+        created_at = now - timedelta(days=random.randint(1, history_days), seconds=random.randint(0, 86399))
+        users.append((i, name, email, phone, city, 'China', status, created_at, created_at))
+    return users
+
+
+def generate_orders(user_ids, product_data, n=500, user_cities=None, golden=None,
+                    start_id=1, start_item_id=1, now=None, history_days=90):
+    """
+    生成订单数据（订单 id 从 start_id 开始，明细 id 从 start_item_id 开始）
+
+    下单时间分布在 now 之前的 history_days 天内。
+
+    传入 golden（GoldenAnswers）时，每生成一个订单就累计到标准答案中，
+    user_cities 为 {用户ID: 城市}，用于城市维度的统计。
+    """
+    now = now or datetime.now()
+    orders = []
+    order_items = []
+    item_id = start_item_id
+    
+    for i in range(start_id, start_id + n):
+        user_id = random.choice(user_ids)
+        created_at = now - timedelta(days=random.randint(0, history_days), seconds=random.randint(0, 86399))
+        
+        # 随机选择 1-5 个商品
+        num_items = random.randint(1, 5)
+        selected_products = random.sample(product_data, min(num_items, len(product_data)))
+        
+        total_amount = 0
+        items = []
+        categories = []
+        for prod_id, _, category, price, _ in selected_products:
+            quantity = random.randint(1, 3)
+            subtotal = price * quantity
+            total_amount += subtotal
+            items.append((item_id, i, prod_id, quantity, price, subtotal, created_at))
+            item_id += 1
+            categories.append(category)
+        
+        # 订单状态和时间
+        status = random.choices(
+            ORDER_STATUSES, 
+            weights=[0.05, 0.15, 0.10, 0.60, 0.10]
+        )[0]
+        
+        payment_method = random.choice(PAYMENT_METHODS) if status != 'pending' else None
+        paid_at = created_at + timedelta(hours=random.randint(1, 24)) if status in ['paid', 'shipped', 'completed'] else None
+        shipped_at = (paid_at + timedelta(days=random.randint(1, 3))) if (status in ['shipped', 'completed'] and paid_at) else None
+        completed_at = (shipped_at + timedelta(days=random.randint(1, 7))) if (status == 'completed' and shipped_at) else None
+        
+        orders.append((
+            i, user_id, total_amount, status, payment_method,
+            f"{random.choice(CITIES)}市某某区某某路{random.randint(1, 999)}号",
+            created_at, paid_at, shipped_at, completed_at
+        ))
+        order_items.extend(items)
+        
+        if golden is not None:
+            golden.add_order(created_at, status, total_amount, payment_method,
+                             (user_cities or {}).get(user_id), categories)
+    
+    return orders, order_items
@@ -0,0 +1,159 @@
+"""
+标准答案（Ground Truth）
+
+生成订单时同步累计 business_metrics Cube 的指标，不需要再对大表执行参考查询。
+"""
+
+import json
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+PAID_STATUSES = ('paid', 'shipped', 'completed')
+
+# business_metrics Cube 的过滤器：(日期, 订单状态, 基准日期) -> 是否命中
+GOLDEN_FILTERS = {
+    'last_7_days': lambda day, status, as_of: day >= as_of - timedelta(days=7),
+    'last_30_days': lambda day, status, as_of: day >= as_of - timedelta(days=30),
+    'last_90_days': lambda day, status, as_of: day >= as_of - timedelta(days=90),
+    'this_month': lambda day, status, as_of: (day.year, day.month) == (as_of.year, as_of.month),
+    'last_month': lambda day, status, as_of: (
+        (day.year, day.month) == ((as_of.replace(day=1) - timedelta(days=1)).year,
+                                  (as_of.replace(day=1) - timedelta(days=1)).month)
+    ),
+    'paid_only': lambda day, status, as_of: status in PAID_STATUSES,
+}
+
+# business_metrics Cube 的时间粒度：日期 -> 分组键
+GOLDEN_TIME_GRANULARITIES = {
+    'day': lambda day: day,
+    'week': lambda day: day - timedelta(days=day.weekday()),
+    'month': lambda day: day.replace(day=1),
+    'year': lambda day: day.replace(month=1, day=1),
+}
+
+
+class GoldenAnswers:
+    """
+    在生成订单的同时累计 business_metrics Cube 的标准答案
+
+    按 (日期, 状态, 维度, 维度值) 累计订单数和金额，最后按 Cube 的指标、过滤器和维度汇总，
+    键与 cube_sql.iter_cube_queries 的查询 id 一致（如 business_metrics.revenue|by=city|filter=last_30_days）。
+    结果与在 CURRENT_DATE = as_of 当天执行 Cube SQL 的结果一致：
+    category 维度需要 JOIN order_items，订单金额会按明细行重复累计，这里保持相同的口径。
+    """
+
+    def __init__(self, as_of=None):
+        self.as_of = as_of or date.today()
+        # (日期, 状态, 维度, 维度值) -> [订单数, 金额]
+        self.cells = defaultdict(lambda: [0, Decimal('0')])
+
+    def add_order(self, created_at, status, total_amount, payment_method, city, categories):
+        day = created_at.date()
+        amount = Decimal(str(total_amount))
+        for dimension, value in ((None, None), ('city', city), ('payment_method', payment_method)):
+            cell = self.cells[(day, status, dimension, value)]
+            cell[0] += 1
+            cell[1] += amount
+        for category, item_count in Counter(categories).items():
+            cell = self.cells[(day, status, 'category', category)]
+            cell[0] += 1
+            cell[1] += amount * item_count
+
+    def to_state(self):
+        """导出累计状态（写入检查点）"""
+        return {
+            'as_of': self.as_of.isoformat(),
+            'cells': [[day.isoformat(), status, dim, value, count, str(amount)]
+                      for (day, status, dim, value), (count, amount) in self.cells.items()],
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """从检查点恢复累计状态"""
+        golden = cls(date.fromisoformat(state['as_of']))
+        for day, status, dim, value, count, amount in state['cells']:
+            golden.cells[(date.fromisoformat(day), status, dim, value)] = [count, Decimal(amount)]
+        return golden
+
+    def merge(self, other):
+        """累加另一份（如一个数据块的）累计状态"""
+        for key, (count, amount) in other.cells.items():
+            cell = self.cells[key]
+            cell[0] += count
+            cell[1] += amount
+
+    @staticmethod
+    def _metrics(counts):
+        """counts: {状态: [订单数, 金额]} -> 各指标的值"""
+        total = sum(c[0] for c in counts.values())
+        if total == 0:
+            return None
+        paid = sum(counts[s][0] for s in PAID_STATUSES if s in counts)
+        revenue = sum((counts[s][1] for s in PAID_STATUSES if s in counts), Decimal('0'))
+        completed = counts['completed'][0] if 'completed' in counts else 0
+        cancelled = counts['cancelled'][0] if 'cancelled' in counts else 0
+        return {
+            'revenue': float(round(revenue, 2)),
+            'total_orders': total,
+            'paid_orders': paid,
+            'avg_order_value': float(round(revenue / paid, 2)) if paid else None,
+            'order_completion_rate': round(completed / total * 100, 4),
+            'cancellation_rate': round(cancelled / total * 100, 4),
+        }
+
+    def _grouped(self, predicate, dimension, key_fn=None):
+        """按分组键汇总满足过滤条件的单元格，返回 {分组键: {状态: [订单数, 金额]}}"""
+        groups = defaultdict(lambda: defaultdict(lambda: [0, Decimal('0')]))
+        for (day, status, dim, value), (count, amount) in self.cells.items():
+            if dim != dimension or not predicate(day, status):
+                continue
+            group = key_fn(day) if key_fn else value
+            cell = groups[group][status]
+            cell[0] += count
+            cell[1] += amount
+        return groups
+
+    def to_dict(self):
+        filters = [(None, lambda day, status: True)]
+        for name, fn in GOLDEN_FILTERS.items():
+            filters.append((name, lambda day, status, fn=fn: fn(day, status, self.as_of)))
+
+        answers = {}
+
+        def put(metric_values, by, filter_name):
+            for metric, value in metric_values.items():
+                key = f"business_metrics.{metric}"
+                if by:
+                    key += f"|by={by}"
+                if filter_name:
+                    key += f"|filter={filter_name}"
+                answers[key] = value
+
+        for filter_name, predicate in filters:
+            overall = self._metrics(self._grouped(predicate, None).get(None, {}))
+            put(overall or {m: None for m in ('revenue', 'total_orders', 'paid_orders', 'avg_order_value',
+                                              'order_completion_rate', 'cancellation_rate')}, None, filter_name)
+
+            groupings = [(f"time.{name}", None, fn) for name, fn in GOLDEN_TIME_GRANULARITIES.items()]
+            groupings += [(dim, dim, None) for dim in ('city', 'category', 'payment_method')]
+            for by, dimension, key_fn in groupings:
+                per_metric = defaultdict(dict)
+                for group, counts in sorted(self._grouped(predicate, dimension, key_fn).items(),
+                                            key=lambda item: (item[0] is None, str(item[0]))):
+                    values = self._metrics(counts)
+                    label = group.isoformat() if isinstance(group, date) else ('null' if group is None else group)
+                    for metric, value in values.items():
+                        per_metric[metric][label] = value
+                put(per_metric, by, filter_name)
+
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'as_of': self.as_of.isoformat(),
+            'note': 'Cube 过滤器中的 CURRENT_DATE 按 as_of 计算；分组结果为 {分组值: 指标值}',
+            'answers': answers,
+        }
+
+    def write(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8')
@@ -0,0 +1,213 @@
+"""
+数据加载的阶段性能指标
+
+按阶段（建表、各表导入、建索引、生成文件……）记录：
+- 墙钟时间、CPU 时间、数据生成时间、驱动调用时间（序列化 + 网络 + 服务端执行）、检查点写入时间
+- 行数、每秒行数、发送字节数（按参数文本长度估算）、峰值 RSS
+- 驱动调用次数和耗时分布，字段名与 src/logging/performance.ts 的 PerformanceSummary 一致
+  （totalQueries, avgQueryTime, maxQueryTime, minQueryTime, uptime），时间单位均为毫秒
+
+可选：
+- profile=True     每个阶段写出 cProfile 数据（可用 snakeviz / pstats 查看）
+- trace_mem=True   每个阶段写出 tracemalloc 分配最多的代码行
+"""
+
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_MEM_TOP = 20
+
+
+def peak_rss():
+    """进程峰值常驻内存（字节），不支持的平台返回 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位为 KB，macOS 为字节
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def estimate_bytes(rows):
+    """估算发送给驱动的数据量：各参数的文本长度加分隔符"""
+    total = 0
+    for row in rows:
+        total += len(row)
+        for value in row:
+            if value is not None:
+                total += len(str(value))
+    return total
+
+
+def _round(value, digits=3):
+    return round(value, digits) if value is not None else None
+
+
+class StageRecorder:
+    """单个阶段内的计数器，由 SeedMetrics.stage() 创建"""
+
+    def __init__(self, name):
+        self.name = name
+        self.generate_ms = 0.0
+        self.driver_ms = 0.0
+        self.checkpoint_ms = 0.0
+        self.query_times = []
+        self.tables = defaultdict(lambda: {'rows': 0, 'bytesSent': 0, 'driverTime': 0.0, 'totalQueries': 0})
+
+    @contextmanager
+    def generate(self):
+        """计时数据生成"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.generate_ms += (time.perf_counter() - start) * 1000
+
+    @contextmanager
+    def checkpoint(self):
+        """计时检查点写入"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.checkpoint_ms += (time.perf_counter() - start) * 1000
+
+    @contextmanager
+    def driver(self, table=None, rows=None):
+        """计时一次驱动调用；传入 rows 时按表累计行数和字节数"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.driver_ms += elapsed
+            self.query_times.append(elapsed)
+            if table is not None:
+                stats = self.tables[table]
+                stats['driverTime'] += elapsed
+                stats['totalQueries'] += 1
+                if rows is not None:
+                    stats['rows'] += len(rows)
+                    stats['bytesSent'] += estimate_bytes(rows)
+
+
+class SeedMetrics:
+    """
+    数据加载的阶段指标收集器
+
+    用法：
+        metrics = SeedMetrics(profile=args.profile, trace_mem=args.trace_mem, dump_dir=OUTPUT_DIR / 'profiles')
+        with metrics.stage('users') as stage:
+            with stage.generate():
+                rows = generate_users(...)
+            with stage.driver('users', rows):
+                cursor.executemany(...)
+        metrics.write(OUTPUT_DIR / 'seed-metrics.json')
+    """
+
+    def __init__(self, profile=False, trace_mem=False, dump_dir=None):
+        self.profile = profile
+        self.trace_mem = trace_mem
+        self.dump_dir = dump_dir
+        self.stages = []
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+
+    def _dump_path(self, name, suffix):
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        return self.dump_dir / f"seed-{name}{suffix}"
+
+    @contextmanager
+    def stage(self, name):
+        recorder = StageRecorder(name)
+        profiler = cProfile.Profile() if self.profile else None
+        if self.trace_mem:
+            tracemalloc.start()
+        if profiler:
+            profiler.enable()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield recorder
+        finally:
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            cpu_ms = (time.process_time() - cpu_start) * 1000
+            summary = self._summarize(recorder, wall_ms, cpu_ms)
+            if profiler:
+                profiler.disable()
+                path = self._dump_path(name, '.prof')
+                profiler.dump_stats(str(path))
+                summary['profile'] = str(path)
+            if self.trace_mem:
+                snapshot = tracemalloc.take_snapshot()
+                summary['tracedPeak'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                path = self._dump_path(name, '-mem.txt')
+                top = snapshot.statistics('lineno')[:TRACE_MEM_TOP]
+                path.write_text('\n'.join(str(stat) for stat in top) + '\n', encoding='utf-8')
+                summary['memoryTrace'] = str(path)
+            self.stages.append(summary)
+
+    def _summarize(self, recorder, wall_ms, cpu_ms):
+        times = recorder.query_times
+        rows = sum(stats['rows'] for stats in recorder.tables.values())
+        return {
+            'stage': recorder.name,
+            'wallTime': _round(wall_ms),
+            'cpuTime': _round(cpu_ms),
+            'generateTime': _round(recorder.generate_ms),
+            'driverTime': _round(recorder.driver_ms),
+            'checkpointTime': _round(recorder.checkpoint_ms),
+            'rows': rows,
+            'rowsPerSecond': _round(rows / (wall_ms / 1000), 1) if rows and wall_ms else 0,
+            'bytesSent': sum(stats['bytesSent'] for stats in recorder.tables.values()),
+            'peakRss': peak_rss(),
+            'totalQueries': len(times),
+            'avgQueryTime': _round(sum(times) / len(times)) if times else 0,
+            'maxQueryTime': _round(max(times)) if times else 0,
+            'minQueryTime': _round(min(times)) if times else 0,
+            'tables': {
+                table: dict(stats, driverTime=_round(stats['driverTime']))
+                for table, stats in recorder.tables.items()
+            },
+        }
+
+    def to_dict(self):
+        tables = defaultdict(lambda: {'rows': 0, 'bytesSent': 0, 'driverTime': 0.0, 'totalQueries': 0})
+        for stage in self.stages:
+            for table, stats in stage['tables'].items():
+                for key in ('rows', 'bytesSent', 'driverTime', 'totalQueries'):
+                    tables[table][key] += stats[key]
+        return {
+            'startedAt': self.started_at.isoformat(timespec='seconds'),
+            'uptime': _round((time.perf_counter() - self.start) * 1000),
+            'peakRss': peak_rss(),
+            'stages': self.stages,
+            'tables': {table: dict(stats, driverTime=_round(stats['driverTime'])) for table, stats in tables.items()},
+        }
+
+    def write(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8')
+
+    def format_table(self):
+        """控制台摘要"""
+        header = (f"{'阶段':<20} {'耗时(ms)':>10} {'CPU(ms)':>10} {'生成(ms)':>10} {'驱动(ms)':>10} "
+                  f"{'检查点(ms)':>10} {'行数':>10} {'行/秒':>10}")
+        lines = [header, '-' * len(header)]
+        for stage in self.stages:
+            lines.append(
+                f"{stage['stage']:<20} {stage['wallTime']:>10.1f} {stage['cpuTime']:>10.1f} "
+                f"{stage['generateTime']:>10.1f} {stage['driverTime']:>10.1f} {stage['checkpointTime']:>10.1f} "
+                f"{stage['rows']:>10} {stage['rowsPerSecond']:>10.0f}")
+        return '\n'.join(lines)
@@ -0,0 +1,44 @@
+"""
+建表 SQL 和 Schema/Cube YAML 模板
+
+模板以文件形式存放在本目录，调用时才读取：
+- tables-<方言>.sql   建表语句（postgresql / mysql / sqlite / duckdb）
+- indexes.sql         默认索引（数据导入后创建）
+- schema/             写入 schema/ 目录的表、关系和 Cube 定义
+"""
+
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent
+SCHEMA_TEMPLATES_DIR = TEMPLATES_DIR / 'schema'
+
+
+def read(name):
+    """读取模板文件内容"""
+    return (TEMPLATES_DIR / name).read_text(encoding='utf-8')
+
+
+def create_tables_sql(dialect):
+    return read(f'tables-{dialect}.sql')
+
+
+def create_indexes_sql():
+    return read('indexes.sql')
+
+
+def schema_files():
+    """schema/ 下的全部模板文件，返回 [(相对路径, 模板路径)]，按 tables/joins/cubes 排序"""
+    order = {'tables': 0, 'joins': 1, 'cubes': 2}
+    files = [(path.relative_to(SCHEMA_TEMPLATES_DIR), path) for path in SCHEMA_TEMPLATES_DIR.rglob('*.yaml')]
+    return sorted(files, key=lambda item: (order.get(item[0].parts[0], 99), str(item[0])))
+
+
+def write_schema_files(schema_dir):
+    """把 Schema/Cube 模板写入 schema_dir，返回写入的相对路径列表"""
+    written = []
+    for relative, path in schema_files():
+        target = schema_dir / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(path.read_text(encoding='utf-8'), encoding='utf-8')
+        written.append(relative)
+    return written
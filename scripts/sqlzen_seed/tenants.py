@@ -0,0 +1,173 @@
+"""
+多租户加载
+
+一次运行为 T 个租户各加载一套数据，隔离方式由后端决定（Backend.tenant_config）：
+PostgreSQL 每个租户一个 schema，MySQL 每个租户一个数据库，SQLite / DuckDB 每个租户一个文件，
+文件后端每个租户一个目录。各租户的数据量按分布抽取（--users / --orders 为平均值），
+多个进程并行加载，每个租户有独立的 schema/ 目录、检查点、指标、标准答案和日志：
+
+    <tenants-dir>/tenant_001/schema/
+    <tenants-dir>/tenant_001/seed.log
+    <tenants-dir>/tenant_001/golden-answers.json
+    <tenants-dir>/tenants.json          # 租户清单（连接位置、数据量、加载结果）
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import random
+import time
+import traceback
+from datetime import datetime
+from functools import partial
+
+# 租户规模分布及默认偏斜参数（zipf 为指数，lognormal 为 sigma）
+TENANT_DISTRIBUTIONS = {'uniform': None, 'zipf': 1.0, 'lognormal': 1.0}
+
+
+def tenant_weights(count, distribution, skew=None, rng=None):
+    """各租户的相对规模，均值为 1（zipf 按排名递减，第一个租户最大）"""
+    skew = TENANT_DISTRIBUTIONS[distribution] if skew is None else skew
+    if distribution == 'uniform':
+        weights = [1.0] * count
+    elif distribution == 'zipf':
+        weights = [1 / rank ** skew for rank in range(1, count + 1)]
+    else:
+        rng = rng or random.Random()
+        weights = [rng.lognormvariate(0, skew) for _ in range(count)]
+    mean = sum(weights) / count
+    return [weight / mean for weight in weights]
+
+
+def plan_tenants(args):
+    """为每个租户生成一份参数（argparse.Namespace），与单租户加载使用同一套流程"""
+    weights = tenant_weights(args.tenants, args.tenant_sizes, args.tenant_skew, random.Random(args.seed))
+    width = max(3, len(str(args.tenants)))
+    tenants = []
+    for index, weight in enumerate(weights):
+        name = f"{args.tenant_prefix}_{index + 1:0{width}d}"
+        root = args.tenants_dir / name
+        state_file = root / 'seed-state.json'
+        tenants.append(argparse.Namespace(**dict(
+            vars(args),
+            tenant=name,
+            weight=round(weight, 4),
+            users=max(1, round(args.users * weight)),
+            orders=max(1, round(args.orders * weight)),
+            seed=args.seed + index if args.seed is not None else None,
+            schema_dir=root / 'schema',
+            output_dir=root,
+            data_dir=args.data_dir / name if args.data_dir else None,
+            duckdb_mirror=root / 'seed.duckdb' if args.duckdb_mirror else None,
+            state_file=state_file,
+            metrics_file=root / 'seed-metrics.json',
+            # 只有上次中断过的租户才续传，其余租户重新加载
+            resume=args.resume and state_file.exists(),
+        )))
+    return tenants
+
+
+def run_tenant(seed, args):
+    """在工作进程中加载一个租户，输出写入该租户的 seed.log"""
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    log_file = args.output_dir / 'seed.log'
+    started = time.perf_counter()
+    result, error = None, None
+    with open(log_file, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        try:
+            result = seed(args)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            traceback.print_exc(file=log)
+    if result is None and error is None:
+        # seed() 失败时打印 ❌ 后返回，取日志中最后一条错误
+        errors = [line.replace('❌', '').strip() for line in log_file.read_text(encoding='utf-8').splitlines()
+                  if '❌' in line]
+        error = errors[-1] if errors else '加载未完成'
+    return {
+        'tenant': args.tenant,
+        'status': 'ok' if result else 'failed',
+        'location': result['location'] if result else None,
+        'weight': args.weight,
+        'users': args.users,
+        'orders': args.orders,
+        'seed': args.seed,
+        'resumed': args.resume,
+        'counts': result['counts'] if result else None,
+        'elapsedSeconds': round(time.perf_counter() - started, 2),
+        'schemaDir': str(args.schema_dir),
+        'log': str(log_file),
+        'error': error,
+    }
+
+
+def run_tenants(args, seed):
+    """
+    并行加载全部租户
+
+    seed 为单租户加载函数（cli.seed），每个租户在独立的进程中执行，
+    进程数即同时打开的数据库连接数（开启 --duckdb-mirror 时每个进程再加一个 DuckDB 文件）。
+    """
+    tenants = plan_tenants(args)
+    parallel = max(1, min(args.parallel, len(tenants)))
+
+    print("=" * 60)
+    print(f"SQL-Zen 多租户测试数据初始化（{len(tenants)} 个租户）")
+    print("=" * 60)
+    print(f"\n📦 规模分布 {args.tenant_sizes}，{parallel} 个进程并行，目录: {args.tenants_dir}")
+    total_users = sum(tenant.users for tenant in tenants)
+    total_orders = sum(tenant.orders for tenant in tenants)
+    largest = max(tenants, key=lambda tenant: tenant.orders)
+    smallest = min(tenants, key=lambda tenant: tenant.orders)
+    print(f"   合计 {total_users} 个用户、{total_orders} 个订单；最大 {largest.tenant}（{largest.orders} 个订单），"
+          f"最小 {smallest.tenant}（{smallest.orders} 个订单）")
+    print()
+
+    # 大租户先开始，缩短整体耗时
+    queue = sorted(tenants, key=lambda tenant: tenant.orders, reverse=True)
+    worker = partial(run_tenant, seed)
+    results = []
+    started = time.perf_counter()
+    # 每个进程只加载一个租户，避免全局随机数状态和数据库驱动在租户之间共享
+    pool = multiprocessing.Pool(parallel, maxtasksperchild=1) if parallel > 1 else None
+    try:
+        for result in (pool.imap_unordered(worker, queue) if pool else map(worker, queue)):
+            results.append(result)
+            if result['status'] == 'ok':
+                print(f"✅ {result['tenant']}: {result['users']} 个用户、{result['orders']} 个订单，"
+                      f"{result['elapsedSeconds']:.1f}s → {result['location']}")
+            else:
+                print(f"❌ {result['tenant']}: {result['error']}（详见 {result['log']}）")
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    elapsed = time.perf_counter() - started
+
+    results.sort(key=lambda result: result['tenant'])
+    failed = [result for result in results if result['status'] != 'ok']
+    manifest = {
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'tenants': len(results),
+        'failed': len(failed),
+        'distribution': args.tenant_sizes,
+        'skew': args.tenant_skew if args.tenant_skew is not None else TENANT_DISTRIBUTIONS[args.tenant_sizes],
+        'parallel': parallel,
+        'elapsedSeconds': round(elapsed, 2),
+        'results': results,
+    }
+    manifest_file = args.tenants_dir / 'tenants.json'
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    manifest_file.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"⚠️  {len(results) - len(failed)}/{len(results)} 个租户加载完成，{len(failed)} 个失败，"
+              f"可加 --resume 重试（已提交的数据不会重复写入）")
+    else:
+        print(f"🎉 {len(results)} 个租户加载完成")
+    print("=" * 60)
+    print(f"⏱️  总耗时 {elapsed:.1f}s")
+    print(f"📄 {manifest_file}")
+    return results
@@ -0,0 +1,13 @@
+"""
+scripts/ 的测试公共设置
+
+脚本之间按 scripts/ 目录导入（from common import ...），这里把 scripts/ 加入 sys.path；
+带连字符的脚本用 importlib.import_module('cache-simulator') 导入。
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
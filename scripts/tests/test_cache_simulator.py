@@ -0,0 +1,118 @@
+"""cache-simulator：SQLite 缓存模型与 evictIfNeeded 的一致性、其他策略和事件回放"""
+
+import argparse
+import importlib
+import random
+
+import pytest
+
+cache_simulator = importlib.import_module('cache-simulator')
+cache_warmer = importlib.import_module('cache-warmer')
+
+
+def _sqlite_get(cache, key, now):
+    """SQLiteCacheManager.get() 的 SQL"""
+    row = cache.execute('SELECT expires_at FROM query_cache WHERE query_hash = ?', (key,)).fetchone()
+    if row is None:
+        return False
+    if row[0] < now:
+        cache.execute('DELETE FROM query_cache WHERE query_hash = ?', (key,))
+        return False
+    cache.execute('UPDATE query_cache SET hit_count = hit_count + 1, last_accessed_at = ? WHERE query_hash = ?',
+                  (now, key))
+    return True
+
+
+@pytest.mark.parametrize('trial', range(10))
+def test_sqlite_policy_matches_cache_warmer_eviction(tmp_path, monkeypatch, trial):
+    """随机 get/set 序列下，模型与 cache-warmer.py 的 write_entry / evict_if_needed 保留相同的条目"""
+    rng = random.Random(trial)
+    ttl, max_size = rng.choice([50, 200, 1000]), rng.choice([3, 10, 25])
+    clock = [0]
+    monkeypatch.setattr(cache_warmer, 'now_ms', lambda: clock[0])
+    cache = cache_warmer.open_cache(tmp_path / 'cache.db')
+    config = {'ttl': ttl, 'max_size': max_size}
+    policy = cache_simulator.SQLiteCachePolicy(ttl, max_size)
+    try:
+        for _ in range(600):
+            clock[0] += rng.randint(0, 5)
+            question = f"q{int(rng.paretovariate(0.8)) % 60}"
+            key = cache_warmer.generate_cache_key(question)
+            if rng.random() < 0.5:
+                assert policy.get(key, clock[0]) == _sqlite_get(cache, key, clock[0])
+            else:
+                cache_warmer.write_entry(cache, config, question, 'result', ['SELECT 1'])
+                policy.set(key, clock[0], 1, 1)
+            stored = {row[0] for row in cache.execute('SELECT query_hash FROM query_cache')}
+            assert stored == set(policy.entries)
+    finally:
+        cache.close()
+
+
+def test_sqlite_policy_evicts_ten_percent_by_last_access():
+    policy = cache_simulator.SQLiteCachePolicy(10 ** 6, 20)
+    for i in range(20):
+        policy.set(f"k{i}", i, 1, 1)
+    policy.get('k0', 100)
+    policy.get('k1', 100)
+    policy.set('new', 200, 1, 1)
+    # 满时淘汰 max(1, 20 × 10%) = 2 条最久未访问的（k2、k3），k0/k1 刚被访问过
+    assert policy.evicted == 2
+    assert {'k0', 'k1', 'new'} <= set(policy.entries)
+    assert not {'k2', 'k3'} & set(policy.entries)
+
+
+def test_ttl_counts_from_write_and_is_not_refreshed_by_hits():
+    policy = cache_simulator.SQLiteCachePolicy(100, 10)
+    policy.set('k', 0, 1, 1)
+    assert policy.get('k', 100)
+    assert not policy.get('k', 101)
+    assert policy.expired == 1
+
+
+def test_lru_and_lfu_victims():
+    lru = cache_simulator.LRUPolicy(10 ** 6, 2)
+    lru.set('a', 0, 1, 1)
+    lru.set('b', 1, 1, 1)
+    lru.get('a', 2)
+    lru.set('c', 3, 1, 1)
+    assert set(lru.entries) == {'a', 'c'}
+
+    lfu = cache_simulator.LFUPolicy(10 ** 6, 2)
+    lfu.set('a', 0, 1, 1)
+    lfu.set('b', 1, 1, 1)
+    lfu.get('b', 2)
+    lfu.get('a', 3)
+    lfu.get('a', 4)
+    lfu.set('c', 5, 1, 1)
+    assert set(lfu.entries) == {'a', 'c'}
+
+
+def test_gdsf_keeps_small_expensive_entries():
+    gdsf = cache_simulator.GDSFPolicy(10 ** 6, 2)
+    gdsf.set('big', 0, 10000, 1000)
+    gdsf.set('small', 1, 100, 1000)
+    gdsf.set('new', 2, 100, 1000)
+    assert set(gdsf.entries) == {'small', 'new'}
+
+
+def test_simulate_counts_concurrent_misses():
+    key = cache_warmer.generate_cache_key('q')
+    # 第二次到达时第一次仍在处理（未命中延迟 1000ms），第三次到达时已写入缓存
+    requests = [(0.0, key, 1000.0, 10), (500.0, key, 1000.0, 10), (1500.0, key, 1000.0, 10)]
+    stats = cache_simulator.simulate(requests, cache_simulator.SQLiteCachePolicy(10 ** 6, 10), 5)
+    assert (stats['hits'], stats['misses'], stats['concurrentMisses']) == (1, 2, 1)
+    assert stats['savedLatencyMs'] == 995.0
+    assert cache_simulator.upper_bound(requests) == (round(2 / 3, 4), 1)
+
+
+@pytest.mark.parametrize('value, expected', [('300000', 300000), ('30s', 30000), ('5m', 300000), ('1h', 3600000),
+                                             ('1d', 86400000), ('1.5m', 90000)])
+def test_parse_duration(value, expected):
+    assert cache_simulator.parse_duration(value) == expected
+    assert cache_simulator.parse_duration(cache_simulator.format_duration(expected)) == expected
+
+
+def test_parse_duration_rejects_garbage():
+    with pytest.raises(argparse.ArgumentTypeError):
+        cache_simulator.parse_duration('five minutes')
@@ -0,0 +1,44 @@
+"""cache-warmer：缓存键、LIMIT 处理和预热问题排序"""
+
+import importlib
+
+import pytest
+
+cache_warmer = importlib.import_module('cache-warmer')
+
+
+def test_cache_key_normalizes_question():
+    key = cache_warmer.generate_cache_key('最近30天的总收入是多少？')
+    assert cache_warmer.generate_cache_key('  最近30天的总收入是多少？ ') == key
+    assert cache_warmer.generate_cache_key('Total  Revenue') == cache_warmer.generate_cache_key('total revenue')
+    assert len(key) == 64
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ('SELECT 1', 'SELECT 1 LIMIT 100'),
+    ('SELECT 1;\n', 'SELECT 1 LIMIT 100'),
+    ('SELECT * FROM t ORDER BY x LIMIT 5;', 'SELECT * FROM t ORDER BY x LIMIT 5'),
+    ('SELECT * FROM t limit 5 offset 10', 'SELECT * FROM t limit 5 offset 10'),
+    ('SELECT * FROM t LIMIT 10, 5', 'SELECT * FROM t LIMIT 10, 5'),
+    # 子查询中的 LIMIT 不算
+    ('SELECT (SELECT x FROM y LIMIT 1) FROM t', 'SELECT (SELECT x FROM y LIMIT 1) FROM t LIMIT 100'),
+])
+def test_apply_limit(sql, expected):
+    assert cache_warmer.apply_limit(sql, 100) == expected
+
+
+def test_apply_limit_zero_disables_limit():
+    assert cache_warmer.apply_limit('SELECT 1;', 0) == 'SELECT 1'
+
+
+def test_rank_questions_merges_repeats_and_keeps_most_frequent():
+    questions = [
+        {'question': 'a', 'sql': 'SELECT 1'},
+        {'question': 'B', 'sql': 'SELECT 2'},
+        {'question': ' b ', 'sql': 'SELECT 2'},
+        {'question': 'c', 'sql': 'SELECT 3', 'count': 5},
+        {'question': 'd', 'sql': 'SELECT 4'},
+    ]
+    ranked, total = cache_warmer.rank_questions(questions, 3)
+    assert total == 4
+    assert [(item['question'], item['count']) for item in ranked] == [('c', 5), ('B', 2), ('a', 1)]
@@ -0,0 +1,57 @@
+"""sqlzen_seed.capacity：容量汇总、放大估算，以及加载后报告中的实际行数"""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+from sqlzen_seed import cli
+from sqlzen_seed.capacity import build_report, format_bytes, format_markdown
+
+BACKEND = SimpleNamespace(name='postgresql', describe=lambda: 'localhost:5432/test')
+
+
+def test_format_bytes():
+    assert [format_bytes(v) for v in (None, 512, 2048, 5 * 1024 ** 3)] == ['-', '512 B', '2.0 KB', '5.0 GB']
+
+
+def test_report_totals_ratios_and_projection():
+    stats = {
+        'tables': {
+            'orders': {'rows': 100, 'tableBytes': 8000, 'indexBytes': 2000, 'toastBytes': 0, 'heapHitRatio': 0.99},
+            'users': {'rows': 10, 'tableBytes': 1000, 'indexBytes': None},
+            'order_items': {'rows': 0},
+        },
+        'database': {'cacheHitRatio': 0.95, 'cacheBytes': 128 * 1024 ** 2},
+    }
+    report = build_report(stats, BACKEND, {'orders': 100}, scales=(10,))
+    orders, users, items = (report['tables'][name] for name in ('orders', 'users', 'order_items'))
+    assert (orders['totalBytes'], orders['bytesPerRow'], orders['indexRatio']) == (10000, 100.0, 0.25)
+    assert orders['projected']['10'] == {'rows': 1000, 'totalBytes': 100000, 'indexBytes': 20000}
+    assert (users['totalBytes'], users['indexRatio']) == (1000, None)
+    # 后端不提供大小时记为 None，不当作 0
+    assert (items['totalBytes'], items['bytesPerRow']) == (None, None)
+
+    totals = report['totals']
+    assert (totals['rows'], totals['totalBytes'], totals['indexBytes']) == (110, 11000, 2000)
+    assert totals['projected']['10']['totalBytes'] == 110000
+    markdown = format_markdown(report)
+    assert '| orders | 100 |' in markdown and '×10' in markdown and '95.0%' in markdown
+
+
+def test_seed_report_uses_actual_row_counts(tmp_path, monkeypatch):
+    monkeypatch.delenv('DB_NAME', raising=False)
+    args = cli.parse_args(['--backend', 'sqlite', '--users', '15', '--orders', '40', '--seed', '2',
+                           '--as-of', '2025-03-15', '--output-dir', str(tmp_path),
+                           '--schema-dir', str(tmp_path / 'schema'), '--capacity-scales', '10', '1000'])
+    assert cli.seed(args) is not None
+    report = json.loads((tmp_path / 'capacity-report.json').read_text(encoding='utf-8'))
+    conn = sqlite3.connect(tmp_path / 'test.db')
+    try:
+        for table, entry in report['tables'].items():
+            assert entry['rows'] == conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+    assert report['backend'] == 'sqlite' and report['scales'] == [10, 1000]
+    assert report['database']['databaseBytes'] > 0
+    assert report['totals']['projected']['1000']['rows'] == report['totals']['rows'] * 1000
+    assert (tmp_path / 'capacity-report.md').exists()
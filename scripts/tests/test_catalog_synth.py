@@ -0,0 +1,49 @@
+"""catalog-synth：外键无环、相同种子结果相同，以及不覆盖非合成的 schema/"""
+
+import importlib
+
+import pytest
+
+pytest.importorskip('yaml')
+catalog_synth = importlib.import_module('catalog-synth')
+schema_synth = importlib.import_module('schema-synth')
+
+
+def _files(schema_dir):
+    return {path.relative_to(schema_dir).as_posix(): path.read_text(encoding='utf-8')
+            for path in sorted(schema_dir.rglob('*.yaml'))}
+
+
+def test_parents_are_earlier_tables():
+    tables = catalog_synth.build_tables(60, 12, 5)
+    seen = set()
+    for table in tables:
+        assert set(table['parents']) <= seen
+        seen.add(table['name'])
+
+
+def test_written_catalog_is_acyclic_and_deterministic(tmp_path):
+    first, counts = catalog_synth.write_catalog(tmp_path / 'a', 40, 4, 12, 9)
+    second, _ = catalog_synth.write_catalog(tmp_path / 'b', 40, 4, 12, 9)
+    assert _files(first) == _files(second)
+    assert counts['tables'] == 40 and counts['cubes'] == 4
+
+    tables = schema_synth.load_tables(first)
+    schema_synth.apply_relationships(tables, schema_synth.load_relationships(first))
+    order = schema_synth.load_order(tables)
+    assert len(order) == 40
+    third, _ = catalog_synth.write_catalog(tmp_path / 'c', 40, 4, 12, 10)
+    assert _files(third) != _files(first)
+
+
+def test_rewrites_own_output_but_refuses_foreign_schema(tmp_path):
+    catalog_synth.write_catalog(tmp_path / 'out', 5, 1, 8, 1)
+    catalog_synth.write_catalog(tmp_path / 'out', 8, 1, 8, 1)
+    assert len(list((tmp_path / 'out' / 'schema' / 'tables').glob('*.yaml'))) == 8
+
+    project = tmp_path / 'project'
+    (project / 'schema' / 'tables').mkdir(parents=True)
+    (project / 'schema' / 'tables' / 'users.yaml').write_text('table: {name: users}\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='schema/'):
+        catalog_synth.write_catalog(project, 5, 1, 8, 1)
+    assert (project / 'schema' / 'tables' / 'users.yaml').exists()
@@ -0,0 +1,129 @@
+"""sqlzen_seed.checkpoint：检查点读写，以及中断后续传的结果与一次跑完相同"""
+
+import json
+import random
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from sqlzen_seed import cli
+from sqlzen_seed.backends.sqlite import SQLiteBackend
+from sqlzen_seed.checkpoint import Checkpoint
+from sqlzen_seed.golden import GoldenAnswers
+
+PARAMS = {'db_type': 'sqlite', 'database': 'test.db', 'users': 10, 'orders': 20, 'chunk_size': 5, 'seed': 1,
+          'as_of': '2025-03-15', 'history_days': 90, 'mirror': None, 'tenant': None}
+AS_OF = date(2025, 3, 15)
+SEED_ARGS = ['--backend', 'sqlite', '--users', '40', '--orders', '150', '--chunk-size', '30', '--seed', '3',
+             '--as-of', '2025-03-15']
+
+
+def test_advance_and_load_restore_state(tmp_path):
+    path = tmp_path / 'seed-state.json'
+    checkpoint = Checkpoint(path, PARAMS, datetime(2025, 3, 15, 23, 59, 59))
+    random.seed(5)
+    checkpoint.advance('users', 2, users=10)
+    expected = [random.random() for _ in range(3)]
+
+    loaded = Checkpoint.load(path, PARAMS)
+    assert (loaded.stage, loaded.chunk, loaded.now) == ('users', 2, datetime(2025, 3, 15, 23, 59, 59))
+    assert loaded.last_ids == {'products': 0, 'users': 10, 'orders': 0, 'order_items': 0}
+    random.setstate(loaded.rng_state)
+    assert [random.random() for _ in range(3)] == expected
+    assert not path.with_suffix('.tmp').exists()
+
+
+def test_stage_order(tmp_path):
+    checkpoint = Checkpoint(tmp_path / 'seed-state.json', PARAMS, datetime(2025, 3, 15))
+    assert not checkpoint.done('products')
+    checkpoint.finish_stage('products')
+    checkpoint.finish_stage('users')
+    assert checkpoint.stage == 'orders'
+    assert checkpoint.done('users') and not checkpoint.done('orders')
+
+
+def test_load_rejects_changed_params(tmp_path):
+    path = tmp_path / 'seed-state.json'
+    Checkpoint(path, PARAMS, datetime(2025, 3, 15)).advance('users', 1, users=5)
+    with pytest.raises(ValueError, match='orders=20'):
+        Checkpoint.load(path, dict(PARAMS, orders=30))
+
+
+def test_golden_is_journaled_per_chunk_and_stale_entries_are_dropped(tmp_path):
+    path = tmp_path / 'seed-state.json'
+    checkpoint = Checkpoint(path, PARAMS, datetime(2025, 3, 15, 23, 59, 59))
+    checkpoint.finish_stage('users')
+    for chunk, amount in ((1, 10), (2, 20), (3, 40)):
+        golden_chunk = GoldenAnswers(AS_OF)
+        golden_chunk.add_order(datetime(2025, 3, 14), 'paid', amount, 'alipay', '北京', ['图书'])
+        checkpoint.advance('orders', chunk, golden_chunk=golden_chunk, orders=chunk)
+    state = path.read_text(encoding='utf-8')
+    assert json.loads(state)['golden'] is None
+
+    # 第 3 块的增量已追加、检查点还停在第 2 块（两次写入之间中断）
+    path.write_text(state.replace('"chunk": 3', '"chunk": 2'), encoding='utf-8')
+    golden = Checkpoint.load(path, PARAMS).restore_golden(AS_OF)
+    assert golden.to_dict()['answers']['business_metrics.revenue'] == 30
+    assert len(checkpoint.journal_path.read_text(encoding='utf-8').splitlines()) == 2
+
+    checkpoint.finish_stage('orders', golden)
+    assert not checkpoint.journal_path.exists()
+    restored = Checkpoint.load(path, PARAMS).restore_golden(AS_OF)
+    assert restored.cells == golden.cells
+
+
+def _seed(tmp_path, name, extra=()):
+    args = cli.parse_args(SEED_ARGS + ['--output-dir', str(tmp_path / name), '--schema-dir', str(tmp_path / 'schema'),
+                                       *extra])
+    return cli.seed(args)
+
+
+def _dump(tmp_path, name):
+    conn = sqlite3.connect(tmp_path / name / 'test.db')
+    try:
+        tables = {table: conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+                  for table in ('products', 'users', 'orders', 'order_items')}
+    finally:
+        conn.close()
+    golden = json.loads((tmp_path / name / 'golden-answers.json').read_text(encoding='utf-8'))
+    golden.pop('generated_at')
+    return tables, golden
+
+
+@pytest.mark.parametrize('crash_at', [4, 6])
+def test_resume_after_crash_matches_uninterrupted_run(tmp_path, monkeypatch, capsys, crash_at):
+    monkeypatch.delenv('DB_NAME', raising=False)
+    assert _seed(tmp_path, 'full') is not None
+    expected = _dump(tmp_path, 'full')
+
+    # 第 crash_at 次提交成功后、写检查点之前中断：数据库比检查点多出一块，续传时应删除后重新生成
+    # （第 4 次是第一个订单块，第 6 次时标准答案增量文件中已有两块）
+    commit = SQLiteBackend.commit
+    calls = []
+
+    def crash_after_commit(self):
+        commit(self)
+        calls.append(1)
+        if len(calls) == crash_at:
+            raise ConnectionError('simulated crash')
+
+    monkeypatch.setattr(SQLiteBackend, 'commit', crash_after_commit)
+    with pytest.raises(ConnectionError):
+        _seed(tmp_path, 'resumed')
+    state = json.loads((tmp_path / 'resumed' / 'seed-state.json').read_text(encoding='utf-8'))
+    assert state['stage'] in ('users', 'orders')
+
+    monkeypatch.setattr(SQLiteBackend, 'commit', commit)
+    capsys.readouterr()
+    assert _seed(tmp_path, 'resumed', ['--resume']) is not None
+    assert '删除检查点之后写入的' in capsys.readouterr().out
+    assert _dump(tmp_path, 'resumed') == expected
+
+
+@pytest.mark.parametrize('option', ['--users', '--orders', '--chunk-size', '--history-days', '--tenants', '--parallel'])
+@pytest.mark.parametrize('value', ['0', '-3'])
+def test_counts_must_be_positive(option, value, capsys):
+    with pytest.raises(SystemExit):
+        cli.parse_args([option, value])
+    assert '需要正整数' in capsys.readouterr().err
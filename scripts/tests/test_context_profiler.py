@@ -0,0 +1,51 @@
+"""context-profiler：token 估算、偏大条目和限定预算的摘要"""
+
+import importlib
+
+import pytest
+
+from common import SCHEMA_DIR
+
+pytest.importorskip('yaml')
+context_profiler = importlib.import_module('context-profiler')
+
+estimate = context_profiler.make_estimator()
+
+
+def test_estimator_counts_cjk_per_char_and_other_text_per_four_chars():
+    assert estimate('订单表') == 3
+    assert estimate('abcdefgh') == 2
+    assert estimate('orders   表\n\n') == 1 + 2
+    assert context_profiler.make_estimator(chars_per_token=2)('abcdefgh') == 4
+
+
+def test_find_heavy_compares_within_kind():
+    items = [{'kind': 'column', 'name': f"c{i}", 'tokens': 10} for i in range(5)]
+    items.append({'kind': 'column', 'name': 'long', 'tokens': 40})
+    items += [{'kind': 'metric', 'name': 'm', 'tokens': 1000}]
+    heavy = context_profiler.find_heavy(items, 2, 10)
+    assert [item['name'] for item in heavy] == ['long']
+    assert heavy[0]['kindMedian'] == 10
+
+
+def test_summary_uses_most_detailed_level_within_budget():
+    sources = context_profiler.load_summary_sources(SCHEMA_DIR)
+    levels = {level: estimate(context_profiler.render_summary(sources, level))
+              for level in context_profiler.SUMMARY_LEVELS}
+    assert levels[3] >= levels[2] >= levels[1] >= levels[0]
+
+    text, level, truncated = context_profiler.build_summary(sources, levels[3], estimate)
+    assert (level, truncated) == (3, False)
+    text, level, truncated = context_profiler.build_summary(sources, levels[3] - 1, estimate)
+    assert level < 3 and not truncated and estimate(text) < levels[3]
+
+
+def test_summary_truncates_to_budget_when_even_the_shortest_level_is_too_long():
+    sources = context_profiler.load_summary_sources(SCHEMA_DIR)
+    shortest = estimate(context_profiler.render_summary(sources, 0))
+    budget = shortest // 2
+    text, level, truncated = context_profiler.build_summary(sources, budget, estimate)
+    assert (level, truncated) == (0, True)
+    assert estimate(text) <= budget
+    assert text.rstrip('\n').endswith('- …（其余见 schema/）')
+    assert context_profiler.render_summary(sources, 0).startswith(text.rsplit('\n', 2)[0])
@@ -0,0 +1,81 @@
+"""cube-benchmark 与 --duckdb-mirror：结果归一化、加速比汇总，以及镜像与主库数据一致"""
+
+import importlib
+import json
+import sqlite3
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from sqlzen_seed import cli
+
+cube_benchmark = importlib.import_module('cube-benchmark')
+
+
+def test_normalize_rows_unifies_driver_types_and_order():
+    rows = [(datetime(2025, 3, 1), Decimal('1.50')), (date(2025, 2, 1), 2), (None, 3)]
+    assert cube_benchmark.normalize_rows(rows) == [('2025-02-01', 2), ('2025-03-01', 1.5), (None, 3)]
+    assert cube_benchmark.normalize_rows([(datetime(2025, 3, 1, 8, 30),)]) == [('2025-03-01 08:30:00',)]
+
+
+def test_same_results_tolerates_float_rounding_only():
+    assert cube_benchmark.same_results([('a', 1.0)], [('a', 1.0 + 1e-9)])
+    assert not cube_benchmark.same_results([('a', 1.0)], [('a', 1.01)])
+    assert not cube_benchmark.same_results([('a', 1)], [('b', 1)])
+    assert not cube_benchmark.same_results([('a', 1)], [])
+
+
+def test_compare_speedups_matches_and_routing():
+    queries = [{'id': 'q1', 'cube': 'c'}, {'id': 'q2', 'cube': 'c'}, {'id': 'q3', 'cube': 'd'}]
+    results = {
+        'postgresql': {'q1': {'medianQueryTime': 10.0, 'result': [(1,)]},
+                       'q2': {'medianQueryTime': 4.0, 'result': [(2,)]},
+                       'q3': {'error': 'boom'}},
+        'duckdb': {'q1': {'medianQueryTime': 1.0, 'result': [(1,)]},
+                   'q2': {'medianQueryTime': 1.0, 'result': [(3,)]},
+                   'q3': {'medianQueryTime': 1.0, 'result': [(1,)]}},
+    }
+    rows, summary, by_cube = cube_benchmark.compare(queries, ['postgresql', 'duckdb'], results, 5)
+    assert rows[0]['duckdb'] == {'medianQueryTime': 1.0, 'speedup': 10.0, 'match': True}
+    assert rows[1]['duckdb']['match'] is False
+    assert 'speedup' not in rows[2]['duckdb']
+    assert summary['postgresql']['errors'] == 1
+    assert summary['duckdb']['geomeanSpeedup'] == pytest.approx(6.32, abs=0.01)
+    assert (summary['duckdb']['mismatches'], summary['duckdb']['routable']) == (1, 1)
+    assert by_cube == {'c': {'duckdb': pytest.approx(6.32, abs=0.01)}, 'd': {'duckdb': None}}
+
+
+def test_repeat_must_be_positive():
+    with pytest.raises(SystemExit):
+        cube_benchmark.parse_args(['--repeat', '0'])
+
+
+def test_duckdb_mirror_matches_primary_and_benchmarks(tmp_path, monkeypatch):
+    duckdb = pytest.importorskip('duckdb')
+    pytest.importorskip('yaml')
+    monkeypatch.delenv('DB_NAME', raising=False)
+    mirror = tmp_path / 'mirror.duckdb'
+    args = cli.parse_args(['--backend', 'sqlite', '--users', '20', '--orders', '120', '--chunk-size', '50',
+                           '--seed', '6', '--as-of', '2025-03-15', '--output-dir', str(tmp_path),
+                           '--schema-dir', str(tmp_path / 'schema'), '--duckdb-mirror', str(mirror)])
+    assert cli.seed(args) is not None
+
+    primary = sqlite3.connect(tmp_path / 'test.db')
+    analytic = duckdb.connect(str(mirror), read_only=True)
+    try:
+        for table in ('products', 'users', 'orders', 'order_items'):
+            expected = primary.execute(f"SELECT COUNT(*), SUM(id) FROM {table}").fetchone()
+            assert analytic.execute(f"SELECT COUNT(*), SUM(id) FROM {table}").fetchone() == expected
+        revenue = "SELECT ROUND(SUM(total_amount), 2) FROM orders WHERE status IN ('paid', 'shipped', 'completed')"
+        assert float(analytic.execute(revenue).fetchone()[0]) == pytest.approx(primary.execute(revenue).fetchone()[0])
+    finally:
+        primary.close()
+        analytic.close()
+
+    monkeypatch.setattr(cube_benchmark, 'SCHEMA_DIR', tmp_path / 'schema')
+    report = tmp_path / 'cube-benchmark.json'
+    cube_benchmark.main(['--engines', 'duckdb', '--duckdb', str(mirror), '--as-of', '2025-03-15',
+                         '--repeat', '1', '--warmup', '0', '--report', str(report)])
+    summary = json.loads(report.read_text(encoding='utf-8'))['summary']['duckdb']
+    assert summary['queries'] > 0 and summary['errors'] == 0
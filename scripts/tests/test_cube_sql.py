@@ -0,0 +1,129 @@
+"""cube_sql：Cube 查询渲染、方言转换和查询枚举"""
+
+from datetime import date
+
+import pytest
+
+from cube_sql import anchor_date, build_query, cube_base_table, iter_cube_queries, parse_joins, to_dialect
+
+CUBE = {
+    'cube': 'sales',
+    'dimensions': [
+        {'name': 'time', 'column': 'orders.created_at', 'granularity': [
+            {'day': {'sql': 'DATE(orders.created_at)'}},
+            {'month': {'sql': "DATE_TRUNC('month', orders.created_at)"}},
+        ]},
+        {'name': 'city', 'column': 'users.city', 'join': 'JOIN users ON orders.user_id = users.id'},
+        {'name': 'category', 'column': 'products.category', 'join': (
+            'JOIN order_items ON orders.id = order_items.order_id\n'
+            'LEFT JOIN products ON order_items.product_id = products.id'
+        )},
+    ],
+    'metrics': [
+        {'name': 'revenue', 'sql': 'SUM(orders.total_amount)'},
+        {'name': 'completion_rate', 'sql': (
+            "COUNT(CASE WHEN orders.status = 'completed' THEN 1 END)::DECIMAL /\n"
+            "NULLIF(COUNT(*), 0) * 100"
+        )},
+    ],
+    'filters': [
+        {'name': 'last_30_days', 'sql': "orders.created_at >= CURRENT_DATE - INTERVAL '30 days'"},
+    ],
+}
+METRICS = {metric['name']: metric for metric in CUBE['metrics']}
+DIMENSIONS = {dimension['name']: dimension for dimension in CUBE['dimensions']}
+FILTERS = {filter_['name']: filter_ for filter_ in CUBE['filters']}
+TABLE_COLUMNS = {
+    'orders': {'id', 'user_id', 'created_at', 'status', 'total_amount'},
+    'users': {'id', 'city'},
+    'order_items': {'order_id', 'product_id'},
+    'products': {'id', 'category'},
+}
+
+
+def test_base_table_is_first_unjoined_reference():
+    assert cube_base_table(CUBE) == 'orders'
+    assert cube_base_table({'metrics': [{'name': 'n', 'sql': 'COUNT(*)'}]}) is None
+
+
+def test_parse_joins_keeps_join_type():
+    assert parse_joins(DIMENSIONS['category']['join']) == [
+        ('INNER', 'order_items', 'orders.id = order_items.order_id'),
+        ('LEFT', 'products', 'order_items.product_id = products.id'),
+    ]
+
+
+def test_metric_only():
+    assert build_query(CUBE, METRICS['revenue']) == 'SELECT SUM(orders.total_amount) AS revenue FROM orders'
+
+
+def test_dimension_join_filter_and_grouping():
+    sql = build_query(CUBE, METRICS['revenue'], DIMENSIONS['category'], filter_=FILTERS['last_30_days'])
+    assert sql == (
+        'SELECT products.category AS category, SUM(orders.total_amount) AS revenue FROM orders '
+        'JOIN order_items ON orders.id = order_items.order_id '
+        'LEFT JOIN products ON order_items.product_id = products.id '
+        "WHERE orders.created_at >= CURRENT_DATE - INTERVAL '30 days' "
+        'GROUP BY products.category ORDER BY category'
+    )
+
+
+def test_granularity_alias_and_multiline_metric_is_squashed():
+    granularity = ('month', "DATE_TRUNC('month', orders.created_at)", '按月')
+    sql = build_query(CUBE, METRICS['completion_rate'], DIMENSIONS['time'], granularity)
+    assert sql.startswith("SELECT DATE_TRUNC('month', orders.created_at) AS time_month, "
+                          "COUNT(CASE WHEN orders.status = 'completed' THEN 1 END)::DECIMAL / NULLIF(")
+    assert sql.endswith("GROUP BY DATE_TRUNC('month', orders.created_at) ORDER BY time_month")
+    assert '\n' not in sql
+
+
+def test_unknown_column_is_skipped():
+    columns = dict(TABLE_COLUMNS, users={'id'})
+    assert build_query(CUBE, METRICS['revenue'], DIMENSIONS['city'], table_columns=columns) is None
+    assert build_query(CUBE, METRICS['revenue'], DIMENSIONS['city'], table_columns=TABLE_COLUMNS) is not None
+
+
+def test_as_of_pins_current_date():
+    sql = build_query(CUBE, METRICS['revenue'], filter_=FILTERS['last_30_days'], as_of=date(2025, 3, 15))
+    assert "DATE '2025-03-15' - INTERVAL '30 days'" in sql
+    assert 'CURRENT_DATE' not in sql
+    # CURRENT_DATE() 函数调用形式不替换
+    assert anchor_date('SELECT CURRENT_DATE()', date(2025, 3, 15)) == 'SELECT CURRENT_DATE()'
+
+
+@pytest.mark.parametrize('unit, expected', [
+    ('day', 'DATE(orders.created_at)'),
+    ('week', 'DATE_SUB(DATE(orders.created_at), INTERVAL WEEKDAY(orders.created_at) DAY)'),
+    ('month', "DATE_FORMAT(orders.created_at, '%Y-%m-01')"),
+    ('year', "DATE_FORMAT(orders.created_at, '%Y-01-01')"),
+])
+def test_mysql_date_trunc(unit, expected):
+    assert to_dialect(f"DATE_TRUNC('{unit}', orders.created_at)", 'mysql') == expected
+
+
+def test_mysql_interval_and_decimal_cast():
+    sql = "SELECT COUNT(*)::DECIMAL FROM orders WHERE created_at >= CURRENT_DATE - INTERVAL '30 days'"
+    assert to_dialect(sql, 'mysql') == (
+        'SELECT COUNT(*) FROM orders WHERE created_at >= CURRENT_DATE - INTERVAL 30 DAY')
+
+
+def test_duckdb_keeps_postgres_syntax_but_casts_to_double():
+    sql = "SELECT COUNT(*)::DECIMAL / 2, DATE_TRUNC('month', created_at)"
+    assert to_dialect(sql, 'duckdb') == "SELECT COUNT(*)::DOUBLE / 2, DATE_TRUNC('month', created_at)"
+
+
+def test_unsupported_dialect():
+    with pytest.raises(ValueError):
+        to_dialect('SELECT 1', 'oracle')
+
+
+def test_iter_cube_queries_ids():
+    ids = [query['id'] for query in iter_cube_queries([CUBE], table_columns=TABLE_COLUMNS)]
+    # 每个指标：无维度 + 3 个维度（时间只取第一个粒度），各自再乘以「无过滤 + 1 个过滤器」
+    assert len(ids) == len(set(ids)) == 2 * 4 * 2
+    assert 'sales.revenue' in ids
+    assert 'sales.revenue|by=time.day|filter=last_30_days' in ids
+    assert 'sales.completion_rate|by=category' in ids
+
+    all_ids = {query['id'] for query in iter_cube_queries([CUBE], all_granularities=True)}
+    assert 'sales.revenue|by=time.month' in all_ids
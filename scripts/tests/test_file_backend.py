@@ -0,0 +1,54 @@
+"""sqlzen_seed.backends.file：流式计数、续传截断和 SQL 语句的处理"""
+
+import csv
+
+from sqlzen_seed.backends.file import FileBackend
+from sqlzen_seed.generators import ORDER_COLUMNS, USER_COLUMNS
+
+
+def _backend(tmp_path):
+    backend = FileBackend({'directory': str(tmp_path)})
+    backend.connect()
+    backend.create_tables()
+    return backend
+
+
+def _user(user_id):
+    row = {column: f"{column}_{user_id}" for column in USER_COLUMNS}
+    row.update(id=user_id, city='北京' if user_id % 2 else '上海')
+    return tuple(row[column] for column in USER_COLUMNS)
+
+
+def _order(order_id):
+    row = {column: '' for column in ORDER_COLUMNS}
+    # 带换行的引号字段跨多行，计数和截断都应按记录而不是按行
+    row.update(id=order_id, user_id=1, shipping_address=f"北京市\n第 {order_id} 号")
+    return tuple(row[column] for column in ORDER_COLUMNS)
+
+
+def test_discard_after_truncates_uncheckpointed_chunks(tmp_path):
+    backend = _backend(tmp_path)
+    for start in (1, 4, 7):
+        backend.write_chunk([('users', USER_COLUMNS, [_user(i) for i in range(start, start + 3)]),
+                             ('orders', ORDER_COLUMNS, [_order(i) for i in range(start, start + 3)])])
+    assert backend.count_rows('users') == backend.count_rows('orders') == 9
+    assert backend.user_cities()[:2] == [(1, '北京'), (2, '上海')]
+
+    removed = backend.discard_after({'products': 0, 'users': 6, 'orders': 3, 'order_items': 0})
+    assert removed == 3 + 6
+    assert backend.count_rows('users') == 6 and backend.count_rows('orders') == 3
+    with open(backend.path('orders'), newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert [row[0] for row in rows[1:]] == ['1', '2', '3']
+    assert rows[-1][ORDER_COLUMNS.index('shipping_address')] == "北京市\n第 3 号"
+
+    assert backend.discard_after({'products': 0, 'users': 6, 'orders': 3, 'order_items': 0}) == 0
+    backend.write_chunk([('orders', ORDER_COLUMNS, [_order(4)])])
+    assert backend.count_rows('orders') == 4
+
+
+def test_execute_is_a_logged_no_op(tmp_path, capsys):
+    backend = _backend(tmp_path)
+    backend.execute('CREATE INDEX idx_orders_user_id ON orders (user_id)')
+    assert '文件后端不执行 SQL' in capsys.readouterr().out
+    assert backend.count_rows('orders') == 0
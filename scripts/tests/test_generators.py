@@ -0,0 +1,68 @@
+"""sqlzen_seed.generators 与 --as-of / --history-days：时间列相对基准日期生成"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlzen_seed import cli
+from sqlzen_seed.generators import MIN_USER_HISTORY_DAYS, generate_orders, generate_users, product_catalog
+
+NOW = datetime(2025, 3, 15, 23, 59, 59)
+
+
+def test_orders_fall_within_history_days():
+    random.seed(1)
+    orders, items = generate_orders(list(range(1, 11)), product_catalog(), 500, now=NOW, history_days=730)
+    created = [order[6] for order in orders]
+    assert min(created) >= NOW - timedelta(days=731) and max(created) <= NOW
+    assert max(created) - min(created) > timedelta(days=600)
+    assert {item[1] for item in items} == {order[0] for order in orders}
+
+
+def test_order_ids_continue_from_start_ids():
+    random.seed(1)
+    orders, items = generate_orders([1], product_catalog(), 3, start_id=11, start_item_id=101, now=NOW)
+    assert [order[0] for order in orders] == [11, 12, 13]
+    assert items[0][0] == 101 and [item[0] for item in items] == list(range(101, 101 + len(items)))
+
+
+def test_users_are_registered_before_now():
+    random.seed(1)
+    users = generate_users(200, start_id=5, now=NOW, history_days=MIN_USER_HISTORY_DAYS)
+    assert users[0][0] == 5
+    assert all(NOW - timedelta(days=MIN_USER_HISTORY_DAYS + 1) <= user[7] < NOW for user in users)
+
+
+def _seed(tmp_path, name, history_days):
+    args = cli.parse_args(['--backend', 'sqlite', '--users', '30', '--orders', '300', '--seed', '4',
+                           '--as-of', '2025-03-15', '--history-days', str(history_days),
+                           '--output-dir', str(tmp_path / name), '--schema-dir', str(tmp_path / 'schema')])
+    assert cli.seed(args) is not None
+    conn = sqlite3.connect(tmp_path / name / 'test.db')
+    try:
+        return (conn.execute("SELECT MIN(created_at), MAX(created_at) FROM orders").fetchone(),
+                conn.execute("SELECT MIN(created_at) FROM users").fetchone()[0],
+                conn.execute("SELECT * FROM orders ORDER BY id").fetchall())
+    finally:
+        conn.close()
+
+
+def test_as_of_and_history_days_anchor_all_time_columns(tmp_path, monkeypatch):
+    monkeypatch.delenv('DB_NAME', raising=False)
+    (first, last), first_user, rows = _seed(tmp_path, 'a', 1000)
+    # 订单在基准日前 1000 天内，用户注册时间的范围随订单历史放大（至少 MIN_USER_HISTORY_DAYS 天）
+    assert '2022-06-18' <= first and last <= '2025-03-15 23:59:59'
+    assert '2022-06-18' <= first_user < '2024-03-15'
+    assert _seed(tmp_path, 'b', 1000)[2] == rows
+
+    (first, last), first_user, _ = _seed(tmp_path, 'c', 30)
+    assert '2025-02-13' <= first and last <= '2025-03-15 23:59:59'
+    assert '2024-03-15' <= first_user
+
+
+@pytest.mark.parametrize('value', ['2025-02-30', '15/03/2025'])
+def test_invalid_as_of_is_rejected(value):
+    with pytest.raises(SystemExit):
+        cli.parse_args(['--as-of', value])
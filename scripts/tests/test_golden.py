@@ -0,0 +1,105 @@
+"""sqlzen_seed.golden：标准答案累计，以及与 Cube SQL 实际执行结果的一致性"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from sqlzen_seed.golden import GoldenAnswers
+
+AS_OF = date(2025, 3, 15)
+
+
+def _golden():
+    golden = GoldenAnswers(AS_OF)
+    golden.add_order(datetime(2025, 3, 14, 10), 'completed', 100.5, 'alipay', '北京', ['电子产品', '电子产品'])
+    golden.add_order(datetime(2025, 3, 1, 9), 'paid', 50, 'wechat', '上海', ['图书'])
+    golden.add_order(datetime(2025, 1, 20, 8), 'cancelled', 30, 'alipay', '北京', ['图书'])
+    return golden
+
+
+def test_overall_metrics():
+    answers = _golden().to_dict()['answers']
+    assert answers['business_metrics.revenue'] == 150.5
+    assert answers['business_metrics.total_orders'] == 3
+    assert answers['business_metrics.paid_orders'] == 2
+    assert answers['business_metrics.avg_order_value'] == 75.25
+    assert answers['business_metrics.order_completion_rate'] == pytest.approx(33.3333)
+    assert answers['business_metrics.cancellation_rate'] == pytest.approx(33.3333)
+
+
+def test_filters_use_as_of():
+    answers = _golden().to_dict()['answers']
+    assert answers['business_metrics.total_orders|filter=last_7_days'] == 1
+    assert answers['business_metrics.total_orders|filter=last_30_days'] == 2
+    assert answers['business_metrics.total_orders|filter=this_month'] == 2
+    assert answers['business_metrics.total_orders|filter=last_month'] is None
+    assert answers['business_metrics.revenue|filter=paid_only'] == 150.5
+
+
+def test_grouped_metrics():
+    answers = _golden().to_dict()['answers']
+    assert answers['business_metrics.revenue|by=city'] == {'上海': 50.0, '北京': 100.5}
+    assert answers['business_metrics.total_orders|by=time.month'] == {'2025-01-01': 1, '2025-03-01': 2}
+    assert answers['business_metrics.total_orders|by=time.week|filter=last_30_days'] == {
+        '2025-02-24': 1, '2025-03-10': 1}
+    # category 维度 JOIN order_items，订单金额按明细行重复累计（与 Cube SQL 的口径一致）
+    assert answers['business_metrics.revenue|by=category'] == {'图书': 50.0, '电子产品': 201.0}
+
+
+def test_state_round_trip():
+    golden = _golden()
+    restored = GoldenAnswers.from_state(golden.to_state())
+    assert restored.as_of == AS_OF
+    assert restored.cells == golden.cells
+    assert isinstance(next(iter(restored.cells.values()))[1], Decimal)
+
+
+def _normalize(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def test_matches_cube_sql_on_duckdb(tmp_path, monkeypatch):
+    """生成数据后在 DuckDB 上执行 business_metrics 的全部 Cube 查询，结果应与标准答案一致"""
+    duckdb = pytest.importorskip('duckdb')
+    pytest.importorskip('yaml')
+    from cube_sql import iter_cube_queries, load_cubes, load_table_columns
+    from sqlzen_seed import cli
+
+    database = tmp_path / 'seed.duckdb'
+    monkeypatch.setenv('DB_NAME', str(database))
+    result = cli.seed(cli.parse_args([
+        '--backend', 'duckdb', '--users', '60', '--orders', '400', '--seed', '7', '--as-of', AS_OF.isoformat(),
+        '--history-days', '120', '--output-dir', str(tmp_path / 'out'), '--schema-dir', str(tmp_path / 'schema'),
+    ]))
+    assert result is not None
+    answers = json.loads((tmp_path / 'out' / 'golden-answers.json').read_text(encoding='utf-8'))['answers']
+
+    schema_dir = tmp_path / 'schema'
+    cubes = load_cubes(schema_dir, ['business-metrics.yaml'])
+    conn = duckdb.connect(str(database), read_only=True)
+    checked = 0
+    try:
+        for query in iter_cube_queries(cubes, 'duckdb', load_table_columns(schema_dir),
+                                       all_granularities=True, as_of=AS_OF):
+            rows = conn.execute(query['sql']).fetchall()
+            expected = answers[query['id']]
+            if query['dimension'] is None:
+                actual = _normalize(rows[0][0])
+                assert actual == pytest.approx(expected, abs=0.01), query['id']
+            else:
+                actual = {('null' if key is None else _normalize(key)): _normalize(value) for key, value in rows}
+                assert actual.keys() == expected.keys(), query['id']
+                for key, value in expected.items():
+                    assert actual[key] == pytest.approx(value, abs=0.01), (query['id'], key)
+            checked += 1
+    finally:
+        conn.close()
+    assert checked == len([key for key in answers if key.startswith('business_metrics.')])
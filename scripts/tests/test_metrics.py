@@ -0,0 +1,70 @@
+"""sqlzen_seed.metrics：阶段计时、按表累计和 --profile / --trace-mem 输出"""
+
+import json
+import sqlite3
+
+from sqlzen_seed import cli
+from sqlzen_seed.metrics import SeedMetrics, StageRecorder, estimate_bytes
+
+
+def test_estimate_bytes_counts_text_length_and_separators():
+    assert estimate_bytes([(1, 'ab', None), (10, 'c', 2.5)]) == (3 + 1 + 2) + (3 + 2 + 1 + 3)
+
+
+def test_stage_records_driver_calls_per_table():
+    metrics = SeedMetrics()
+    with metrics.stage('orders') as stage:
+        with stage.generate():
+            rows = [(1, 'a'), (2, 'b')]
+        with stage.driver('orders', rows):
+            pass
+        with stage.driver('order_items', rows[:1]):
+            pass
+        with stage.driver():
+            pass
+        with stage.checkpoint():
+            pass
+    with metrics.stage('indexes') as stage:
+        with stage.driver('orders'):
+            pass
+
+    orders, indexes = metrics.stages
+    assert (orders['stage'], orders['rows'], orders['totalQueries']) == ('orders', 3, 3)
+    assert orders['tables']['orders']['rows'] == 2
+    assert orders['bytesSent'] == estimate_bytes(rows) + estimate_bytes(rows[:1])
+    assert orders['wallTime'] >= orders['driverTime'] >= 0
+    assert indexes['rows'] == 0 and indexes['tables']['orders']['totalQueries'] == 1
+
+    totals = metrics.to_dict()['tables']
+    assert totals['orders']['rows'] == 2 and totals['orders']['totalQueries'] == 2
+    assert 'orders' in metrics.format_table()
+
+
+def test_profile_and_trace_mem_write_files(tmp_path):
+    metrics = SeedMetrics(profile=True, trace_mem=True, dump_dir=tmp_path)
+    with metrics.stage('users'):
+        [str(i) for i in range(1000)]
+    summary = metrics.stages[0]
+    assert (tmp_path / 'seed-users.prof').exists() and summary['profile'].endswith('seed-users.prof')
+    assert (tmp_path / 'seed-users-mem.txt').read_text(encoding='utf-8')
+    assert summary['tracedPeak'] > 0
+
+
+def test_seed_writes_metrics_matching_table_counts(tmp_path, monkeypatch):
+    monkeypatch.delenv('DB_NAME', raising=False)
+    args = cli.parse_args(['--backend', 'sqlite', '--users', '20', '--orders', '60', '--chunk-size', '25',
+                           '--seed', '1', '--as-of', '2025-03-15', '--output-dir', str(tmp_path),
+                           '--schema-dir', str(tmp_path / 'schema')])
+    assert cli.seed(args) is not None
+    metrics = json.loads((tmp_path / 'seed-metrics.json').read_text(encoding='utf-8'))
+    conn = sqlite3.connect(tmp_path / 'test.db')
+    try:
+        for table in ('users', 'orders', 'order_items'):
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            assert metrics['tables'][table]['rows'] == count
+    finally:
+        conn.close()
+    stages = {stage['stage']: stage for stage in metrics['stages']}
+    assert {'users', 'orders', 'indexes'} <= set(stages)
+    # 60 个订单按每块 25 行分 3 块，每块对 orders 表一次插入
+    assert stages['orders']['tables']['orders']['totalQueries'] == 3
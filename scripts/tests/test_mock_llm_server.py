@@ -0,0 +1,97 @@
+"""mock-llm-server：剧本轮次、Messages API 响应格式和本地 HTTP 往返"""
+
+import argparse
+import importlib
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('yaml')
+mock_llm_server = importlib.import_module('mock-llm-server')
+
+TOOLS = [{'name': 'execute_bash'}, {'name': 'execute_sql'}]
+
+
+@pytest.fixture(scope='module')
+def script():
+    return mock_llm_server.Script.load(None, 'mysql')
+
+
+def _conversation(script, question):
+    """按 Agent 的方式循环：把 tool_use 的结果作为下一轮 user 消息发回"""
+    messages = [{'role': 'user', 'content': question}]
+    responses = []
+    while True:
+        response, _ = mock_llm_server.build_response({'messages': messages, 'tools': TOOLS}, script, 1)
+        responses.append(response)
+        if response['stop_reason'] != 'tool_use':
+            return responses
+        block = response['content'][0]
+        messages += [{'role': 'assistant', 'content': response['content']},
+                     {'role': 'user', 'content': [{'type': 'tool_result', 'tool_use_id': block['id'],
+                                                   'content': f"result of {block['name']}"}]}]
+
+
+def test_cube_question_replays_four_turns(script):
+    query = script.cube_queries[0]
+    responses = _conversation(script, f"  {query['question'].upper()} ")
+    assert [r['stop_reason'] for r in responses] == ['tool_use'] * 3 + ['end_turn']
+    assert [r['content'][0].get('name') for r in responses[:3]] == ['execute_bash', 'execute_bash', 'execute_sql']
+    assert responses[2]['content'][0]['input']['sql'] == query['sql']
+    assert 'result of execute_sql' in responses[3]['content'][0]['text']
+    assert all(r['usage']['input_tokens'] > 0 and r['usage']['output_tokens'] > 0 for r in responses)
+
+
+def test_unknown_question_maps_to_a_stable_query(script):
+    first = _conversation(script, '完全不相关的问题')[2]['content'][0]['input']['sql']
+    assert _conversation(script, '完全不相关的问题')[2]['content'][0]['input']['sql'] == first
+
+
+def test_custom_scenario_takes_precedence(script):
+    custom = mock_llm_server.Script([{'match': '收入', 'turns': [
+        {'tool': 'execute_sql', 'input': {'sql': 'SELECT 1'}}, {'text': '完成'}]}], script.cube_queries)
+    responses = _conversation(custom, '总收入是多少')
+    assert responses[0]['content'][0]['input'] == {'sql': 'SELECT 1'}
+    assert responses[1]['content'][0]['text'] == '完成'
+
+
+def test_request_without_tools_ends_immediately(script):
+    response, turn = mock_llm_server.build_response({'messages': [{'role': 'user', 'content': 'hi'}]}, script, 1)
+    assert (turn, response['stop_reason']) == (0, 'end_turn')
+
+
+def test_http_round_trip_and_error_injection(script):
+    options = argparse.Namespace(seed=0, verbose=False, jitter_ms=0, latency_ms=0, ms_per_output_token=0,
+                                 error_rate=0)
+    stats = mock_llm_server.Stats()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), mock_llm_server.make_handler(script, stats, options))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def post(body):
+        request = urllib.request.Request(f"{base}/v1/messages", data=json.dumps(body).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    try:
+        body = post({'messages': [{'role': 'user', 'content': script.cube_queries[0]['question']}], 'tools': TOOLS})
+        assert body['type'] == 'message' and body['stop_reason'] == 'tool_use'
+
+        options.error_rate = 1
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post({'messages': [{'role': 'user', 'content': 'x'}], 'tools': TOOLS})
+        assert error.value.code == 529
+
+        with urllib.request.urlopen(f"{base}/stats", timeout=5) as response:
+            snapshot = json.loads(response.read())
+        assert snapshot['requests'] == 2 and snapshot['errorsInjected'] == 1
+        assert snapshot['byStopReason'] == {'tool_use': 1}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,63 @@
+"""question-generator：重复率、可复现的负载流和 SQL 方言"""
+
+import importlib
+import json
+
+import pytest
+
+pytest.importorskip('yaml')
+question_generator = importlib.import_module('question-generator')
+
+
+def _catalog(size):
+    return [{'question': f"q{i}", 'query_id': f"id{i}"} for i in range(size)]
+
+
+@pytest.mark.parametrize('repeat_rate', [0.0, 0.3, 0.7])
+def test_repeat_rate(repeat_rate):
+    items = list(question_generator.iter_workload(_catalog(5000), 4000, repeat_rate, 1.0, 10, False, 1))
+    repeats = sum(item['repeat'] for item in items)
+    assert repeats / len(items) == pytest.approx(repeat_rate, abs=0.03)
+    # 重复的只能是已经出现过的问题
+    seen = set()
+    for item in items:
+        assert item['repeat'] == (item['question'] in seen)
+        seen.add(item['question'])
+
+
+def test_exhausted_catalog_only_repeats():
+    items = list(question_generator.iter_workload(_catalog(3), 10, 0.0, 1.0, 10, False, 1))
+    assert len({item['question'] for item in items}) == 3
+    assert all(item['repeat'] for item in items[3:])
+
+
+def test_workload_is_reproducible_and_timed():
+    first = list(question_generator.iter_workload(_catalog(50), 100, 0.4, 1.0, 4, True, 7))
+    second = list(question_generator.iter_workload(_catalog(50), 100, 0.4, 1.0, 4, True, 7))
+    assert first == second
+    assert [item['seq'] for item in first] == list(range(100))
+    fixed = list(question_generator.iter_workload(_catalog(50), 3, 0.4, 1.0, 4, False, 7))
+    assert [item['ts'] for item in fixed] == [0.0, 0.25, 0.5]
+
+
+def _generate(tmp_path, *extra):
+    output = tmp_path / 'questions.jsonl'
+    question_generator.main(['--count', '200', '--as-of', '2025-03-15', '--output', str(output), *extra])
+    return [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+
+
+def test_dialect_defaults_to_db_type(tmp_path, monkeypatch):
+    monkeypatch.setenv('DB_TYPE', 'mysql')
+    mysql = {item['query_id']: item['sql'] for item in _generate(tmp_path)}
+    postgres = {item['query_id']: item['sql'] for item in _generate(tmp_path, '--dialect', 'postgresql')}
+    time_filtered = [key for key in mysql if 'filter=last_30_days' in key]
+    assert time_filtered
+    assert all("INTERVAL 30 DAY" in mysql[key] for key in time_filtered)
+    assert not any("INTERVAL 30 DAY" in sql for sql in postgres.values())
+
+
+def test_unsupported_db_type_asks_for_dialect(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv('DB_TYPE', 'sqlite')
+    with pytest.raises(SystemExit):
+        _generate(tmp_path)
+    assert '--dialect' in capsys.readouterr().err
@@ -0,0 +1,83 @@
+"""schema-synth：行数配置、加载顺序、外键取值和同行时间先后"""
+
+import csv
+import importlib
+import json
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+from common import SCHEMA_DIR
+
+pytest.importorskip('yaml')
+schema_synth = importlib.import_module('schema-synth')
+
+AS_OF = datetime(2025, 3, 15)
+
+
+def _tables():
+    tables = schema_synth.load_tables(SCHEMA_DIR)
+    schema_synth.apply_relationships(tables, schema_synth.load_relationships(SCHEMA_DIR))
+    return tables
+
+
+def _plan(tables, counts, default_rows=50, chunk_size=4):
+    row_counts = defaultdict(lambda: default_rows)
+    row_counts.update(counts)
+    order = schema_synth.load_order(tables)
+    return order, schema_synth.build_plan(tables, order, row_counts, chunk_size, 1, AS_OF, 30)
+
+
+def test_load_order_puts_parents_first():
+    order = schema_synth.load_order(_tables())
+    assert order.index('users') < order.index('orders') < order.index('order_items')
+    assert order.index('products') < order.index('order_items')
+
+
+def test_unlisted_tables_use_default_rows():
+    _, plan = _plan(_tables(), {'users': 10})
+    rows = {step['table']: step['rows'] for step in plan}
+    assert rows == {'products': 50, 'users': 10, 'orders': 50, 'order_items': 50}
+    orders = next(step for step in plan if step['table'] == 'orders')
+    assert next(rule for rule in orders['rules'] if rule['name'] == 'user_id')['parent_rows'] == 10
+    assert [task[4] for task in orders['tasks']] == [4] * 12 + [2]
+
+
+def test_parent_outside_selection_uses_default_rows():
+    tables = _tables()
+    _, plan = _plan({'orders': tables['orders']}, {}, default_rows=7)
+    rule = next(rule for rule in plan[0]['rules'] if rule['name'] == 'user_id')
+    assert rule['parent_rows'] == 7
+
+
+def test_zero_row_parent_is_rejected():
+    with pytest.raises(ValueError, match='users'):
+        _plan(_tables(), {'users': 0})
+
+
+def test_chunks_are_deterministic_and_keep_timestamps_ordered():
+    _, plan = _plan(_tables(), {'users': 10, 'orders': 200})
+    orders = next(step for step in plan if step['table'] == 'orders')
+    columns = [rule['name'] for rule in orders['rules']]
+    rows = [row for task in orders['tasks'] for row in schema_synth.generate_chunk(task)[2]]
+    assert rows == [row for task in orders['tasks'] for row in schema_synth.generate_chunk(task)[2]]
+
+    user_ids = {row[columns.index('user_id')] for row in rows}
+    assert user_ids <= set(range(1, 11))
+    times = [columns.index(name) for name in ('created_at', 'paid_at', 'shipped_at', 'completed_at')]
+    for row in rows:
+        present = [row[i] for i in times if row[i] is not None]
+        assert present == sorted(present)
+
+
+def test_main_writes_csv_with_config_default_rows(tmp_path):
+    config = tmp_path / 'synth.json'
+    config.write_text(json.dumps({'default_rows': 30, 'chunk_size': 8, 'tables': {'users': 5}}), encoding='utf-8')
+    schema_synth.main(['--config', str(config), '--sink', 'csv', '--out-dir', str(tmp_path / 'out'),
+                       '--workers', '1'])
+    counts = {}
+    for name in ('products', 'users', 'orders', 'order_items'):
+        with open(tmp_path / 'out' / f'{name}.csv', encoding='utf-8', newline='') as f:
+            counts[name] = sum(1 for _ in csv.reader(f)) - 1
+    assert counts == {'products': 30, 'users': 5, 'orders': 30, 'order_items': 30}
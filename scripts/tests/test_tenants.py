@@ -0,0 +1,64 @@
+"""sqlzen_seed.tenants：租户规模分布、租户计划和多租户加载"""
+
+import json
+import random
+import sqlite3
+
+import pytest
+
+from sqlzen_seed import cli
+from sqlzen_seed.backends.postgres import PostgresBackend
+from sqlzen_seed.backends.sqlite import SQLiteBackend
+from sqlzen_seed.tenants import plan_tenants, run_tenants, tenant_weights
+
+
+@pytest.mark.parametrize('distribution', ['uniform', 'zipf', 'lognormal'])
+def test_weights_have_mean_one(distribution):
+    weights = tenant_weights(8, distribution, rng=random.Random(1))
+    assert len(weights) == 8
+    assert sum(weights) / len(weights) == pytest.approx(1)
+
+
+def test_zipf_weights_decrease_with_rank():
+    weights = tenant_weights(5, 'zipf', skew=1.5)
+    assert weights == sorted(weights, reverse=True)
+    assert weights[0] / weights[1] == pytest.approx(2 ** 1.5)
+
+
+def _args(tmp_path, *extra):
+    return cli.parse_args(['--backend', 'sqlite', '--users', '30', '--orders', '100', '--seed', '11',
+                           '--as-of', '2025-03-15', '--output-dir', str(tmp_path), '--tenants', '3',
+                           '--parallel', '1', *extra])
+
+
+def test_plan_gives_each_tenant_its_own_directories_and_seed(tmp_path):
+    tenants = plan_tenants(_args(tmp_path, '--tenant-sizes', 'zipf'))
+    assert [tenant.tenant for tenant in tenants] == ['tenant_001', 'tenant_002', 'tenant_003']
+    assert [tenant.seed for tenant in tenants] == [11, 12, 13]
+    assert tenants[0].orders > tenants[1].orders > tenants[2].orders
+    assert len({tenant.schema_dir for tenant in tenants}) == len({tenant.state_file for tenant in tenants}) == 3
+    assert tenants[1].schema_dir == tmp_path / 'tenants' / 'tenant_002' / 'schema'
+    assert not any(tenant.resume for tenant in tenants)
+
+
+def test_tenant_config_isolation():
+    assert SQLiteBackend.tenant_config({'database': 'test.db'}, 'tenant_001') == {'database': 'test_tenant_001.db'}
+    config = PostgresBackend.tenant_config({'database': 'test', 'host': 'localhost'}, 'tenant_001')
+    assert config['database'] == 'test' and config['schema'] == 'tenant_001'
+
+
+def test_run_tenants_on_sqlite(tmp_path, monkeypatch):
+    monkeypatch.delenv('DB_NAME', raising=False)
+    args = _args(tmp_path, '--tenant-sizes', 'uniform')
+    results = run_tenants(args, cli.seed)
+    assert [result['status'] for result in results] == ['ok'] * 3
+
+    manifest = json.loads((tmp_path / 'tenants' / 'tenants.json').read_text(encoding='utf-8'))
+    assert manifest['tenants'] == 3 and manifest['failed'] == 0
+    for result in results:
+        conn = sqlite3.connect(result['location'])
+        try:
+            assert conn.execute('SELECT COUNT(*) FROM orders').fetchone()[0] == result['orders']
+        finally:
+            conn.close()
+    assert len({result['location'] for result in results}) == 3
@@ -0,0 +1,53 @@
+"""workload-driver：加权查询混合、按权重抽样和并发级别参数"""
+
+import argparse
+import importlib
+from collections import Counter
+
+import pytest
+
+pytest.importorskip('yaml')
+workload_driver = importlib.import_module('workload-driver')
+
+
+def test_mix_splits_each_group_weight_evenly():
+    mix = workload_driver.build_mix('postgresql', 0.2, 0.8, False)
+    examples = [weight for query, weight in mix if query['id'].startswith('example:')]
+    cubes = [weight for query, weight in mix if query['id'].startswith('cube:')]
+    assert examples and cubes
+    assert sum(examples) == pytest.approx(0.2)
+    assert sum(cubes) == pytest.approx(0.8)
+    assert len(set(cubes)) == 1
+
+
+def test_zero_weight_skips_group():
+    mix = workload_driver.build_mix('postgresql', 0, 1, False)
+    assert all(query['id'].startswith('cube:') for query, _ in mix)
+
+
+def test_empty_group_with_weight_is_rejected(tmp_path, monkeypatch):
+    (tmp_path / 'examples').mkdir()
+    (tmp_path / 'cubes').mkdir()
+    (tmp_path / 'tables').mkdir()
+    monkeypatch.setattr(workload_driver, 'SCHEMA_DIR', tmp_path)
+    with pytest.raises(ValueError, match='--examples-weight 0'):
+        workload_driver.build_mix('postgresql', 1, 0, False)
+    with pytest.raises(ValueError, match='--cube-weight 0'):
+        workload_driver.build_mix('postgresql', 0, 1, False)
+
+
+def test_picker_follows_weights_and_is_reproducible():
+    mix = [({'id': 'a'}, 0.75), ({'id': 'b'}, 0.25)]
+    first = workload_driver.QueryPicker(mix, 3)
+    picks = [first.pick()['id'] for _ in range(4000)]
+    second = workload_driver.QueryPicker(mix, 3)
+    assert [second.pick()['id'] for _ in range(4000)] == picks
+    assert Counter(picks)['a'] / 4000 == pytest.approx(0.75, abs=0.03)
+
+
+def test_concurrency_levels():
+    assert workload_driver.concurrency_levels('1, 4,16,') == [1, 4, 16]
+    for value in ('0', '4,-2', 'x', ' , '):
+        with pytest.raises(argparse.ArgumentTypeError):
+            workload_driver.concurrency_levels(value)
+    assert workload_driver.parse_args([]).concurrency == [1, 2, 4, 8, 16]
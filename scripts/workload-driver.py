@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+SQL-Zen 并发负载驱动
+
+模拟 Agent 的生产流量：大量小型分析查询同时到达。按加权混合回放
+schema/examples/*.sql 和 Cube 层生成的 SQL，逐级提高并发，报告每一级的
+吞吐、延迟分位数和错误率，用于评估连接池和数据库实例规格。
+
+两种模式：
+    closed  闭环：N 个客户端各自「执行 → 思考时间 → 执行」，吞吐受延迟约束
+    open    开环：按泊松到达率 --rate 发出请求，最多 N 个并发执行；
+            延迟从计划到达时间算起，排队时间计入延迟（避免协同遗漏）
+
+使用方式：
+    python scripts/workload-driver.py --concurrency 1,2,4,8,16 --duration 30
+    python scripts/workload-driver.py --mode open --rate 200 --concurrency 8,16,32
+    python scripts/workload-driver.py --examples-weight 0 --cube-weight 1   # 只回放 Cube SQL
+
+输出：
+    控制台表格，以及 scripts/output/workload-report.json
+
+环境变量与 init-test-data.py 相同（DB_TYPE, DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD）。
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+from common import OUTPUT_DIR, SCHEMA_DIR, connect, get_db_type, percentile, positive_int, timed_query
+from cube_sql import iter_cube_queries, load_cubes, load_table_columns
+
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+# 闭环客户端连接失败后的重试间隔（秒）
+CONNECT_RETRY_SECONDS = 0.1
+
+
+# ============================================
+# 1. 查询混合
+# ============================================
+
+def load_example_queries(schema_dir):
+    """读取 schema/examples/*.sql，去掉注释和结尾分号"""
+    queries = []
+    for path in sorted((schema_dir / 'examples').glob('*.sql')):
+        lines = [line for line in path.read_text(encoding='utf-8').splitlines()
+                 if not line.strip().startswith('--')]
+        sql = '\n'.join(lines).strip().rstrip(';').strip()
+        if sql:
+            queries.append({'id': f"example:{path.stem}", 'sql': sql})
+    return queries
+
+
+def build_mix(db_type, examples_weight, cube_weight, all_granularities, as_of=None):
+    """
+    构建加权查询混合
+
+    两组查询的总权重分别为 examples_weight 和 cube_weight，组内平均分配。
+    传入 as_of 时 Cube SQL 中的 CURRENT_DATE 固定为该日期。
+    权重大于 0 的一组没有任何查询时抛出 ValueError。
+    """
+    mix = []
+    if examples_weight > 0:
+        examples = load_example_queries(SCHEMA_DIR)
+        if not examples:
+            raise ValueError(f"{SCHEMA_DIR / 'examples'} 下没有 SQL 文件，请使用 --examples-weight 0")
+        for query in examples:
+            mix.append((query, examples_weight / len(examples)))
+    if cube_weight > 0:
+        cube_queries = [
+            {'id': f"cube:{q['id']}", 'sql': q['sql']}
+            for q in iter_cube_queries(load_cubes(SCHEMA_DIR), db_type, load_table_columns(SCHEMA_DIR),
+                                       all_granularities=all_granularities, as_of=as_of)
+        ]
+        if not cube_queries:
+            raise ValueError(f"{SCHEMA_DIR / 'cubes'} 中没有可生成的 Cube 查询，请使用 --cube-weight 0")
+        for query in cube_queries:
+            mix.append((query, cube_weight / len(cube_queries)))
+    return mix
+
+
+class QueryPicker:
+    """按权重抽取查询（线程安全、可复现）"""
+
+    def __init__(self, mix, seed):
+        self.queries = [query for query, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def pick(self):
+        with self.lock:
+            return self.rng.choices(self.queries, weights=self.weights)[0]
+
+
+# ============================================
+# 2. 负载执行
+# ============================================
+
+class LevelResult:
+    """一个并发级别的统计"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies_ms = []
+        self.errors = Counter()
+        self.error_samples = {}
+        self.completed = 0
+
+    def record(self, query_id, latency_ms, error=None):
+        with self.lock:
+            self.completed += 1
+            if error is None:
+                self.latencies_ms.append(latency_ms)
+            else:
+                self.errors[query_id] += 1
+                self.error_samples.setdefault(query_id, str(error).splitlines()[0][:200])
+
+    def summary(self, concurrency, elapsed):
+        failed = sum(self.errors.values())
+        result = {
+            'concurrency': concurrency,
+            'duration': round(elapsed, 3),
+            'totalQueries': self.completed,
+            'succeeded': len(self.latencies_ms),
+            'failed': failed,
+            'errorRate': round(failed / self.completed, 4) if self.completed else 0,
+            'throughput': round(len(self.latencies_ms) / elapsed, 2) if elapsed else 0,
+            'avgQueryTime': round(sum(self.latencies_ms) / len(self.latencies_ms), 3) if self.latencies_ms else 0,
+            'minQueryTime': round(min(self.latencies_ms), 3) if self.latencies_ms else 0,
+            'maxQueryTime': round(max(self.latencies_ms), 3) if self.latencies_ms else 0,
+        }
+        for pct in LATENCY_PERCENTILES:
+            result[f'p{pct}QueryTime'] = round(percentile(self.latencies_ms, pct), 3)
+        result['errors'] = [
+            {'query': query_id, 'count': count, 'sample': self.error_samples[query_id]}
+            for query_id, count in self.errors.most_common()
+        ]
+        return result
+
+
+def _execute(cursor, query):
+    try:
+        timed_query(cursor, query['sql'])
+        return None
+    except Exception as e:
+        return e
+
+
+def _connect(db_type, query, result, start):
+    """建立连接；失败（如连接数耗尽）时记为该查询的一次错误，返回 None"""
+    try:
+        return connect(db_type)
+    except Exception as e:
+        result.record(query['id'], (time.perf_counter() - start) * 1000, e)
+        return None
+
+
+def run_closed_loop(db_type, picker, concurrency, duration, think_ms):
+    """闭环：每个客户端持有一个连接，串行执行查询；连接失败时稍后重连"""
+    result = LevelResult()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        conn = cursor = None
+        try:
+            while time.perf_counter() < deadline:
+                query = picker.pick()
+                start = time.perf_counter()
+                if conn is None:
+                    conn = _connect(db_type, query, result, start)
+                    if conn is None:
+                        time.sleep(max(think_ms / 1000, CONNECT_RETRY_SECONDS))
+                        continue
+                    cursor = conn.cursor()
+                error = _execute(cursor, query)
+                result.record(query['id'], (time.perf_counter() - start) * 1000, error)
+                if think_ms:
+                    time.sleep(think_ms / 1000)
+        finally:
+            if conn is not None:
+                cursor.close()
+                conn.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return result, time.perf_counter() - started
+
+
+def run_open_loop(db_type, picker, concurrency, duration, rate, seed):
+    """开环：泊松到达，最多 concurrency 个连接并发执行，延迟含排队时间"""
+    result = LevelResult()
+    local = threading.local()
+    connections = []
+    lock = threading.Lock()
+    rng = random.Random(seed)
+
+    def worker(query, scheduled_at):
+        if not hasattr(local, 'cursor'):
+            # 连接失败时不缓存，该线程的下一个查询重新连接
+            conn = _connect(db_type, query, result, scheduled_at)
+            if conn is None:
+                return
+            with lock:
+                connections.append(conn)
+            local.cursor = conn.cursor()
+        error = _execute(local.cursor, query)
+        result.record(query['id'], (time.perf_counter() - scheduled_at) * 1000, error)
+
+    started = time.perf_counter()
+    submitted = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        next_arrival = started
+        while next_arrival < started + duration:
+            now = time.perf_counter()
+            if next_arrival > now:
+                time.sleep(next_arrival - now)
+            query = picker.pick()
+            submitted.append((pool.submit(worker, query, next_arrival), query))
+            next_arrival += rng.expovariate(rate)
+    elapsed = time.perf_counter() - started
+    # worker 内未捕获的异常留在 future 中，同样计入错误
+    for future, query in submitted:
+        error = future.exception()
+        if error is not None:
+            result.record(query['id'], 0, error)
+    for conn in connections:
+        conn.close()
+    return result, elapsed
+
+
+# ============================================
+# 主函数
+# ============================================
+
+def concurrency_levels(value):
+    """argparse 参数类型：逗号分隔的正整数并发级别"""
+    levels = [positive_int(level.strip()) for level in value.split(',') if level.strip()]
+    if not levels:
+        raise argparse.ArgumentTypeError(f"至少需要一个并发级别: {value!r}")
+    return levels
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='并发回放 Agent 风格的分析查询，测量数据库饱和点')
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed', help='负载模式（默认：closed）')
+    parser.add_argument('--concurrency', type=concurrency_levels, default='1,2,4,8,16',
+                        help='逐级测试的并发数，逗号分隔（默认：1,2,4,8,16）')
+    parser.add_argument('--duration', type=float, default=30, help='每个并发级别的持续时间（秒，默认：30）')
+    parser.add_argument('--warmup', type=float, default=5, help='每个级别开始前的预热时间（秒，默认：5）')
+    parser.add_argument('--rate', type=float, default=100, help='开环模式的到达率（查询/秒，默认：100）')
+    parser.add_argument('--think-ms', type=float, default=0, help='闭环模式每次查询后的思考时间（毫秒）')
+    parser.add_argument('--examples-weight', type=float, default=0.2,
+                        help='schema/examples/*.sql 的总权重（默认：0.2）')
+    parser.add_argument('--cube-weight', type=float, default=0.8, help='Cube 生成 SQL 的总权重（默认：0.8）')
+    parser.add_argument('--all-granularities', action='store_true', help='Cube 时间维度展开全部粒度')
+    parser.add_argument('--as-of', type=date.fromisoformat,
+                        help='Cube SQL 的 CURRENT_DATE 固定为该日期（与 init-test-data.py --as-of 一致）')
+    parser.add_argument('--seed', type=int, default=42, help='查询抽样和到达时间的随机种子（默认：42）')
+    parser.add_argument('--report', help='报告 JSON 路径（默认：scripts/output/workload-report.json）')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    levels = args.concurrency
+    if args.mode == 'open' and args.rate <= 0:
+        print(f"❌ 开环模式的到达率必须大于 0: --rate {args.rate}")
+        sys.exit(1)
+    if args.duration <= 0:
+        print(f"❌ 每级持续时间必须大于 0: --duration {args.duration}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("SQL-Zen 并发负载驱动")
+    print("=" * 60)
+
+    try:
+        db_type = get_db_type()
+        mix = build_mix(db_type, args.examples_weight, args.cube_weight, args.all_granularities, args.as_of)
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if not mix:
+        print("❌ 查询混合为空，请检查 --examples-weight / --cube-weight")
+        sys.exit(1)
+
+    try:
+        connect(db_type).close()
+    except Exception as e:
+        print(f"❌ 数据库连接失败: {e}")
+        sys.exit(1)
+
+    print(f"\n📦 数据库: {db_type}，模式: {args.mode}，查询混合: {len(mix)} 条 SQL")
+    if args.mode == 'open':
+        print(f"⏱️  到达率 {args.rate}/s，每级 {args.duration}s（预热 {args.warmup}s）")
+    else:
+        print(f"⏱️  每级 {args.duration}s（预热 {args.warmup}s），思考时间 {args.think_ms}ms")
+
+    summaries = []
+    header = f"{'并发':>6} {'吞吐(q/s)':>10} {'P50(ms)':>9} {'P95(ms)':>9} {'P99(ms)':>9} {'错误率':>8}"
+    print("\n" + header)
+    print('-' * len(header))
+    for i, concurrency in enumerate(levels):
+        picker = QueryPicker(mix, args.seed + i)
+        if args.mode == 'open':
+            run = lambda seconds: run_open_loop(db_type, picker, concurrency, seconds, args.rate, args.seed + i)
+        else:
+            run = lambda seconds: run_closed_loop(db_type, picker, concurrency, seconds, args.think_ms)
+        if args.warmup > 0:
+            run(args.warmup)
+        result, elapsed = run(args.duration)
+        summary = result.summary(concurrency, elapsed)
+        summaries.append(summary)
+        print(f"{concurrency:>6} {summary['throughput']:>10.1f} {summary['p50QueryTime']:>9.2f} "
+              f"{summary['p95QueryTime']:>9.2f} {summary['p99QueryTime']:>9.2f} {summary['errorRate']:>8.2%}")
+
+    report = {
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'db_type': db_type,
+        'mode': args.mode,
+        'rate': args.rate if args.mode == 'open' else None,
+        'duration': args.duration,
+        'mix': [{'query': query['id'], 'weight': round(weight, 6)} for query, weight in mix],
+        'levels': summaries,
+    }
+    report_path = Path(args.report) if args.report else OUTPUT_DIR / 'workload-report.json'
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    best = max(summaries, key=lambda s: s['throughput'])
+    print(f"\n🎯 最高吞吐 {best['throughput']} q/s（并发 {best['concurrency']}）")
+    failing = [s for s in summaries if s['errors']]
+    if failing:
+        print("⚠️  部分查询执行失败（如 schema/examples 中引用了种子数据不存在的列），详见报告")
+    print(f"📄 {report_path}")
+
+
+if __name__ == '__main__':
+    main()